@@ -0,0 +1,90 @@
+##
+# @file bench_exact.py
+# @brief Compara a base exata sem frações (`FractionFreeBasis`) com um Simplex Revisado ingênuo em `Fraction`.
+# @details Uso: `python benchmarks/bench_exact.py [restrições] [variáveis]`.
+# As duas versões usam a regra de Dantzig e a mesma razão mínima, então percorrem as mesmas bases; a ingênua
+# guarda `B^{-1}` como matriz de `Fraction` e a atualiza por operações de linha a cada iteração.
+
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Exact import FractionFreeBasis, to_fraction_array  # noqa: E402
+
+
+def generate_problem(rows: int, columns: int, seed: int = 0) -> (np.ndarray, np.ndarray, np.ndarray):
+    rng = np.random.default_rng(seed)
+    constraint_matrix = rng.integers(1, 40, (rows, columns)) / rng.integers(1, 8, (rows, columns))
+    restrictions = rng.integers(50, 200, rows).astype(np.float64)
+    objective = rng.integers(1, 30, columns) / 4
+    return constraint_matrix, restrictions, objective
+
+
+def get_leaving(x_b, y) -> int:
+    candidates = [i for i in range(len(y)) if y[i] > 0]
+    return min(candidates, key=lambda i: (x_b[i] / y[i], i))
+
+
+def solve_with_fractions(constraint_matrix, restrictions, objective) -> (Fraction, int):
+    rows, columns = constraint_matrix.shape
+    matrix = to_fraction_array(np.hstack((constraint_matrix, np.eye(rows))))
+    restrictions = to_fraction_array(restrictions)
+    costs = to_fraction_array(np.concatenate((-objective, np.zeros(rows))))
+    basis, non_basis = list(range(columns, columns + rows)), list(range(columns))
+    inverse = to_fraction_array(np.eye(rows))
+    iterations = 0
+    while True:
+        iterations += 1
+        x_b = inverse @ restrictions
+        reduced_costs = costs[non_basis] - (costs[basis] @ inverse) @ matrix[:, non_basis]
+        entering = int(np.argmin(reduced_costs))
+        if reduced_costs[entering] >= 0:
+            return -(costs[basis] @ x_b), iterations
+        y = inverse @ matrix[:, non_basis[entering]]
+        leaving = get_leaving(x_b, y)
+        inverse[leaving] = inverse[leaving] / y[leaving]
+        for i in range(rows):
+            if i != leaving and y[i] != 0:
+                inverse[i] = inverse[i] - y[i] * inverse[leaving]
+        basis[leaving], non_basis[entering] = non_basis[entering], basis[leaving]
+
+
+def solve_fraction_free(constraint_matrix, restrictions, objective) -> (Fraction, int):
+    rows, columns = constraint_matrix.shape
+    costs = np.concatenate((-objective, np.zeros(rows)))
+    non_basis = list(range(columns))
+    basis = FractionFreeBasis(np.hstack((constraint_matrix, np.eye(rows))), restrictions, costs,
+                              list(range(columns, columns + rows)))
+    iterations = 0
+    while True:
+        iterations += 1
+        x_b, _, entering, _ = basis.price(non_basis)
+        if entering == -1:
+            return -(to_fraction_array(costs)[basis.basic_indexes] @ x_b[:, 0]), iterations
+        y = basis.get_direction(non_basis[entering])[:, 0]
+        leaving = get_leaving(x_b[:, 0], y)
+        leaving_index = basis.basic_indexes[leaving]
+        basis.replace(leaving, non_basis[entering])
+        non_basis[entering] = leaving_index
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 60
+    problem = generate_problem(rows, columns)
+
+    start = time.perf_counter()
+    expected, naive_iterations = solve_with_fractions(*problem)
+    naive = time.perf_counter() - start
+    start = time.perf_counter()
+    value, iterations = solve_fraction_free(*problem)
+    fraction_free = time.perf_counter() - start
+
+    assert value == expected and iterations == naive_iterations
+    print(f"{rows}x{columns}, {iterations} iterações, ótimo = {float(value):.6f} (denominador com {len(str(value.denominator))} dígitos)")
+    print(f"Fraction: {naive:.3f}s, sem frações (Bareiss): {fraction_free:.3f}s ({naive / fraction_free:.1f}x)")
@@ -0,0 +1,58 @@
+##
+# @file bench_instrumentation.py
+# @brief Mede o custo da `SolverInstrumentation` no laço do `RevisedSimplex`, ligada e desligada.
+# @details Uso: `python benchmarks/bench_instrumentation.py [restrições] [variáveis] [repetições]`.
+# Desligada, o laço só faz um teste `is not None` por etapa; ligada, cada etapa lê o relógio uma vez.
+# Também imprime a divisão do tempo entre as etapas, como em `to_dict()`.
+
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Instrumentation import SolverInstrumentation  # noqa: E402
+from Solver import RevisedSimplex, SolverOptions  # noqa: E402
+
+
+def generate_problem(rows: int, columns: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        "lp_variables": [f"x_{j + 1}" for j in range(columns)],
+        "constraint_matrix": rng.integers(1, 20, (rows, columns)).astype(np.float64),
+        "is_maximization": True,
+        "objective_function": rng.integers(1, 30, columns).astype(np.float64),
+        "restrictions_vector": rng.integers(100, 1000, rows).astype(np.float64),
+        "symbols": ["<="] * rows,
+    }
+
+
+def time_solve(data: dict, repetitions: int, instrumented: bool) -> (float, int, SolverInstrumentation):
+    times, instrumentation = [], None
+    for _ in range(repetitions):
+        solver = RevisedSimplex(data=data, options=SolverOptions(max_iterations=10 ** 6), quiet=True)
+        if instrumented:
+            instrumentation = solver.set_instrumentation()
+        start = time.perf_counter()
+        solver.solve()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), solver.current_interaction, instrumentation
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    repetitions = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    data = generate_problem(rows, columns)
+
+    disabled, iterations, _ = time_solve(data, repetitions, False)
+    enabled, _, instrumentation = time_solve(data, repetitions, True)
+    print(f"{rows}x{columns}, {iterations} iterações, {disabled / iterations * 1e6:.1f} us por iteração")
+    print(f"ligada: {(enabled - disabled) / iterations * 1e6:+.2f} us por iteração ({(enabled - disabled) / disabled:+.1%})")
+    stats = instrumentation.to_dict()
+    for stage, seconds in stats["stages"].items():
+        print(f"  {stage:<12} {seconds * 1e3:9.3f} ms ({seconds / stats['total']:.1%})")
+    print("  " + ", ".join(f"{counter}={value}" for counter, value in stats["counters"].items()))
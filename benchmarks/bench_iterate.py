@@ -0,0 +1,82 @@
+##
+# @file bench_iterate.py
+# @brief Mede o custo do caminho por gerador (`RevisedSimplex.iterate()`) em relação ao tempo de cada pivô.
+# @details Uso: `python benchmarks/bench_iterate.py [restrições] [variáveis] [repetições]`.
+# Compara `solve()` com a mesma resolução sem montar os eventos e com o custo puro de repassar um valor por
+# três geradores encadeados (`yield from`), que é o que o laço do solver faz a cada pivô.
+
+import io
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Context import SolveContext  # noqa: E402
+from Solver import IterationEvent, RevisedSimplex, SolverOptions  # noqa: E402
+
+
+def generate_problem(rows: int, columns: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    return {
+        "lp_variables": [f"x_{j + 1}" for j in range(columns)],
+        "constraint_matrix": rng.integers(1, 20, (rows, columns)).astype(np.float64),
+        "is_maximization": True,
+        "objective_function": rng.integers(1, 30, columns).astype(np.float64),
+        "restrictions_vector": rng.integers(100, 1000, rows).astype(np.float64),
+        "symbols": ["<="] * rows,
+    }
+
+
+def time_solve(data: dict, repetitions: int) -> (float, int):
+    times = []
+    for _ in range(repetitions):
+        solver = RevisedSimplex(data=data, options=SolverOptions(max_iterations=10 ** 6))
+        with SolveContext(output=io.StringIO()):
+            start = time.perf_counter()
+            solver.solve()
+            times.append(time.perf_counter() - start)
+    return statistics.median(times), solver.current_interaction
+
+
+def time_yield_chain(count: int) -> float:
+    def inner():
+        for i in range(count):
+            yield i
+
+    def middle():
+        yield from inner()
+
+    def outer():
+        yield from middle()
+
+    start = time.perf_counter()
+    for _ in outer():
+        pass
+    return (time.perf_counter() - start) / count
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    repetitions = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    data = generate_problem(rows, columns)
+
+    with_events, iterations = time_solve(data, repetitions)
+    original = RevisedSimplex._RevisedSimplex__get_iteration_event
+    placeholder = IterationEvent(0, 0, "", "", 0.0, 0.0, 0.0)
+    RevisedSimplex._RevisedSimplex__get_iteration_event = lambda self, *arguments: placeholder
+    try:
+        without_events, _ = time_solve(data, repetitions)
+    finally:
+        RevisedSimplex._RevisedSimplex__get_iteration_event = original
+    per_yield = time_yield_chain(100000)
+
+    per_iteration = with_events / iterations
+    print(f"{rows}x{columns}, {iterations} iterações, {per_iteration * 1e6:.1f} us por iteração")
+    print(f"eventos: {(with_events - without_events) / iterations * 1e6:.2f} us por pivô "
+          f"({(with_events - without_events) / with_events:+.1%} do total)")
+    print(f"repasse pelos geradores: {per_yield * 1e6:.3f} us por pivô ({per_yield / per_iteration:.2%} do total)")
@@ -0,0 +1,49 @@
+##
+# @file bench_latex_format.py
+# @brief Compara a formatação em LaTeX elemento a elemento com a formatação vetorizada de `LatexUtils`.
+# @details Uso: `python benchmarks/bench_latex_format.py [ordem da matriz]`.
+
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from Utils import LatexUtils  # noqa: E402
+
+
+def format_elementwise(matrix: np.ndarray) -> list[str]:
+    result = []
+    for value in matrix.ravel():
+        value = float(str(value))
+        if value % 1 != 0:
+            fraction = Fraction(value).limit_denominator()
+            result.append(f"\\frac{{{fraction.numerator}}}{{{fraction.denominator}}}")
+        else:
+            result.append(str(int(value)))
+    return result
+
+
+if __name__ == "__main__":
+    order = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rng = np.random.default_rng(0)
+    basis = np.eye(order)
+    basis[:, : order // 2] = rng.integers(0, 3, (order, order // 2))
+    matrices = {
+        "identidade/inteiros": np.eye(order),
+        "frações pequenas": rng.integers(-20, 20, (order, order)) / rng.integers(1, 9, (order, order)),
+        "B^-1 aleatória": np.linalg.inv(basis + order * np.eye(order)),
+    }
+    for name, matrix in matrices.items():
+        start = time.perf_counter()
+        expected = format_elementwise(matrix)
+        elementwise = time.perf_counter() - start
+        start = time.perf_counter()
+        formatted = LatexUtils.format_values(matrix).ravel().tolist()
+        vectorized = time.perf_counter() - start
+        assert formatted == expected
+        print(f"{name:>20}: elemento a elemento {elementwise:.3f}s, vetorizado {vectorized:.3f}s "
+              f"({elementwise / vectorized:.1f}x)")
@@ -0,0 +1,54 @@
+##
+# @file bench_mps.py
+# @brief Mede a escrita e a leitura de arquivos MPS grandes gerados aleatoriamente.
+# @details Uso: `python benchmarks/bench_mps.py [linhas] [colunas] [não nulos por coluna]`.
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from MpsParser import MpsParser, MpsWriter  # noqa: E402
+
+
+def generate_problem(rows: int, columns: int, nonzeros_per_column: int, seed: int = 0) -> dict:
+    rng = np.random.default_rng(seed)
+    constraint_matrix = np.zeros((rows, columns))
+    for column in range(columns):
+        constraint_matrix[rng.choice(rows, nonzeros_per_column, replace=False), column] = rng.integers(1, 10, nonzeros_per_column)
+    return {
+        "lp_variables": [f"x{j}" for j in range(columns)],
+        "constraint_matrix": constraint_matrix,
+        "is_maximization": True,
+        "objective_function": rng.integers(1, 10, columns).astype(np.float64),
+        "restrictions_vector": rng.integers(10, 100, rows).astype(np.float64),
+        "symbols": ["<="] * rows,
+    }
+
+
+def main() -> None:
+    rows, columns, nonzeros = [int(arg) for arg in sys.argv[1:4]] + [2000, 5000, 5][len(sys.argv[1:4]):]
+    problem = generate_problem(rows, columns, nonzeros)
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "generated.mps")
+        start = time.perf_counter()
+        MpsWriter.write(filename, problem)
+        write_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parsed = MpsParser(filename).parse_file()
+        read_time = time.perf_counter() - start
+        size = os.path.getsize(filename)
+
+    assert np.array_equal(parsed["constraint_matrix"], problem["constraint_matrix"])
+    print(f"{rows}x{columns}, {columns * nonzeros} não nulos, {size / 2**20:.1f} MiB")
+    print(f"escrita: {write_time:.3f}s  leitura: {read_time:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
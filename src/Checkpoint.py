@@ -0,0 +1,91 @@
+##
+# @file Checkpoint.py
+# @brief Pontos de retomada periódicos para resoluções longas.
+# @details O estado do solver (fase, base, não base, valores das variáveis, iteração e degeneração) é gravado
+# em um `.npz` sem pickle. A gravação é feita em um arquivo temporário no mesmo diretório e renomeada, então
+# um processo interrompido no meio da escrita nunca deixa um ponto de retomada corrompido.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+
+class Checkpointer:
+    ##
+    # @class Checkpointer
+    # @brief Decide quando gravar o estado do solver e faz a gravação atômica.
+    # @details Grava a cada `every_iterations` iterações ou a cada `every_seconds` segundos, o que vier primeiro.
+    # Sem nenhum dos dois, grava em todas as iterações.
+
+    FORMAT_VERSION = 1
+    STRING_KEYS = ["variables", "basis", "non_basis", "slack_variables", "artificial_variables"]
+
+    def __init__(self, filename: str, every_iterations: int = None, every_seconds: float = None) -> None:
+        self.filename = filename
+        self.every_iterations = every_iterations
+        self.every_seconds = every_seconds
+        self.last_iteration = 0
+        self.last_time = time.monotonic()
+        self.saved = 0
+
+    def is_due(self, iteration: int) -> bool:
+        if self.every_iterations is None and self.every_seconds is None:
+            return True
+        if self.every_iterations is not None and iteration - self.last_iteration >= self.every_iterations:
+            return True
+        return self.every_seconds is not None and time.monotonic() - self.last_time >= self.every_seconds
+
+    def maybe_save(self, state: dict) -> bool:
+        if not self.is_due(state["iteration"]):
+            return False
+        self.save(state)
+        return True
+
+    def save(self, state: dict) -> None:
+        ##
+        # @brief Grava o estado de forma atômica.
+        # @param state Dicionário produzido por `RevisedSimplex` (listas de nomes, valores e contadores).
+
+        arrays = {key: np.array(state[key], dtype=np.str_) for key in self.STRING_KEYS}
+        arrays.update({
+            "version": np.int64(self.FORMAT_VERSION),
+            "phase": np.int64(state["phase"]),
+            "iteration": np.int64(state["iteration"]),
+            "variable_values": np.array(state["variable_values"], dtype=np.float64),
+            "degeneracy_points": np.array(state["degeneracy_points"], dtype=np.int64),
+        })
+        directory = os.path.dirname(os.path.abspath(self.filename))
+        descriptor, temporary = tempfile.mkstemp(prefix=".checkpoint.", suffix=".npz", dir=directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temporary, self.filename)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        self.last_iteration = state["iteration"]
+        self.last_time = time.monotonic()
+        self.saved += 1
+
+    @staticmethod
+    def load(filename: str) -> dict:
+        ##
+        # @brief Lê um ponto de retomada gravado por `save`.
+        # @return Dicionário com as mesmas chaves recebidas por `save`.
+
+        with np.load(filename, allow_pickle=False) as arrays:
+            if int(arrays["version"]) != Checkpointer.FORMAT_VERSION:
+                raise ValueError(f"Versão de ponto de retomada não suportada: {int(arrays['version'])}")
+            state = {key: arrays[key].tolist() for key in Checkpointer.STRING_KEYS}
+            state.update({
+                "phase": int(arrays["phase"]),
+                "iteration": int(arrays["iteration"]),
+                "variable_values": arrays["variable_values"].tolist(),
+                "degeneracy_points": arrays["degeneracy_points"].tolist(),
+            })
+        return state
@@ -0,0 +1,213 @@
+##
+# @file Cli.py
+# @brief Interface de linha de comando não interativa, para uso em scripts, cron e pipelines.
+# @details Uso (dentro de `src`):
+# @code
+# python -m Cli "../data/input/*.txt" --language en --format jsonl --jobs 4
+# python -m Cli problema.mps --show-steps --output-dir /tmp/saida
+# python -m Cli "../data/input/*.txt" --show-steps --languages all
+# python -m Cli modelo_grande.mps --show-steps --compact --detail-every 20
+# @endcode
+# Os módulos pesados (NumPy, solver, dicionário de idiomas e escrita em LaTeX) só são importados depois
+# que os argumentos são lidos, então `--help` e erros de uso respondem sem carregá-los.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import argparse
+import glob
+import os
+import sys
+
+FORMATS = ["jsonl", "csv", "text"]
+# Cópias de `LanguageUtils.get_available_languages()`, `SolverOptions.PRICING_RULES` e
+# `SolverOptions.ARITHMETIC_MODES`, para não importar os módulos pesados ao ler os argumentos; o teste do Cli
+# confere que elas continuam iguais às originais.
+LANGUAGES = ["pt", "en", "es"]
+PRICING_RULES = ["dantzig", "steepest_edge"]
+ARITHMETIC_MODES = ["float", "exact"]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m Cli", description="Resolve problemas de otimização linear com o Simplex Revisado.")
+    parser.add_argument("inputs", nargs="+", help="arquivos ou padrões glob (texto ou MPS)")
+    parser.add_argument("-l", "--language", choices=LANGUAGES, default="pt")
+    parser.add_argument("--languages", type=parse_languages, default=None,
+                        help="com --show-steps, gera os documentos destes idiomas (ex.: pt,en ou all) com uma única resolução")
+    parser.add_argument("-s", "--show-steps", action="store_true", help="gera o documento LaTeX passo a passo")
+    parser.add_argument("--compact", action="store_true",
+                        help="com --show-steps, abrevia matrizes grandes e detalha só algumas iterações (limites de "
+                             "RenderPolicy.compact, ajustáveis com as opções abaixo)")
+    parser.add_argument("--max-rows", type=parse_positive_int, default=None,
+                        help="com --show-steps, abrevia matrizes com mais linhas que isso")
+    parser.add_argument("--max-columns", type=parse_positive_int, default=None,
+                        help="com --show-steps, abrevia matrizes com mais colunas que isso")
+    parser.add_argument("--detail-every", type=parse_positive_int, default=None,
+                        help="com --show-steps, detalha uma iteração a cada N (além das primeiras e da última de cada "
+                             "fase) e resume as demais")
+    parser.add_argument("-d", "--output-dir", default="output", help="diretório dos documentos LaTeX")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="processos usados na resolução")
+    parser.add_argument("-f", "--format", choices=FORMATS, default=None,
+                        help="formato dos resultados (padrão: text na saída padrão; com --output, pela extensão do "
+                             "arquivo: csv para .csv e jsonl nos demais casos)")
+    parser.add_argument("-o", "--output", default="-", help="arquivo de resultados (- para a saída padrão)")
+    parser.add_argument("--pricing", choices=PRICING_RULES, default="dantzig")
+    parser.add_argument("--max-iterations", type=int, default=100)
+    parser.add_argument("--arithmetic", choices=ARITHMETIC_MODES, default="float",
+                        help="exact resolve com frações exatas (apenas com --pricing dantzig)")
+    return parser
+
+
+def parse_languages(value: str) -> list[str]:
+    languages = LANGUAGES if value == "all" else [language.strip() for language in value.split(",") if language.strip()]
+    unknown = [language for language in languages if language not in LANGUAGES]
+    if unknown or not languages:
+        raise argparse.ArgumentTypeError(f"Idiomas inválidos: {value}. Opções: {', '.join(LANGUAGES)} ou all")
+    return list(languages)
+
+
+def parse_positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"Valor inválido: {value}. Use um inteiro positivo")
+    return number
+
+
+def get_render_policy(arguments: argparse.Namespace):
+    ##
+    # @brief Política de escrita do passo a passo escolhida pelas opções `--compact`, `--max-rows`, `--max-columns`
+    # e `--detail-every`.
+    # @details Sem `--compact`, só os limites informados são aplicados, e com `--detail-every` apenas a primeira
+    # iteração (e a última de cada fase) é detalhada além de uma a cada N.
+    # @return A `RenderPolicy`, ou `None` se nenhuma dessas opções foi usada (tudo é escrito).
+
+    limits = {key: value for key, value in [("max_rows", arguments.max_rows), ("max_columns", arguments.max_columns),
+                                            ("every_iterations", arguments.detail_every)] if value is not None}
+    if not arguments.compact and not limits:
+        return None
+
+    from RenderPolicy import RenderPolicy
+
+    if arguments.compact:
+        return RenderPolicy.compact(**limits)
+    if arguments.detail_every is not None:
+        limits["full_iterations"] = 1
+    return RenderPolicy(**limits)
+
+
+def expand_inputs(patterns: list[str]) -> list[str]:
+    ##
+    # @brief Expande os padrões glob, mantendo a ordem e removendo repetições.
+    # @return Lista de arquivos existentes.
+
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        if not matches:
+            raise FileNotFoundError(f"Nenhum arquivo encontrado para {pattern}")
+        for match in matches:
+            if not os.path.isfile(match):
+                raise FileNotFoundError(f"Arquivo não encontrado: {match}")
+            if match not in files:
+                files.append(match)
+    return files
+
+
+def solve_file(filename: str, language: str, options: dict) -> dict:
+    ##
+    # @brief Resolve um arquivo sem escrever nada na saída e devolve o registro de resultado.
+    # @details Arquivos inválidos geram um registro com status `error` em vez de interromper o lote.
+
+    import io
+    import time
+    from Context import SolveContext
+    from ResultsWriter import ResultsWriter
+    from Solver import RevisedSimplex, SolverOptions
+
+    with SolveContext(language=language, output=io.StringIO()):
+        start = time.perf_counter()
+        try:
+            solver = RevisedSimplex(os.path.abspath(filename), options=SolverOptions(**options), quiet=True)
+            loaded = time.perf_counter()
+            solver.solve(show_steps=False)
+        except (OSError, ValueError, IndexError) as error:
+            return ResultsWriter.get_error_record(filename, error)
+        timings = {"parse": loaded - start, "solve": time.perf_counter() - loaded}
+    return ResultsWriter.get_record(filename, solver, timings)
+
+
+def main(argv: list[str] = None) -> int:
+    parser = build_parser()
+    arguments = parser.parse_args(argv)
+    if arguments.format == "text" and arguments.output != "-":
+        parser.error("o formato text só é escrito na saída padrão; use --format jsonl ou csv com --output")
+    try:
+        files = expand_inputs(arguments.inputs)
+    except FileNotFoundError as error:
+        print(error, file=sys.stderr)
+        return 2
+
+    from ResultsWriter import ResultsWriter
+    from Solver import SolverOptions
+
+    try:
+        options = SolverOptions(arguments.pricing, arguments.max_iterations, arithmetic=arguments.arithmetic).to_dict()
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 2
+    if arguments.output == "-" and arguments.format in (None, "text"):
+        sink = None
+    else:
+        sink = ResultsWriter(arguments.output, arguments.format)
+
+    try:
+        if arguments.show_steps:
+            records = _emit(_build_document(files, arguments, options), sink)
+        elif arguments.jobs > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=arguments.jobs) as pool:
+                records = pool.map(solve_file, files, [arguments.language] * len(files), [options] * len(files))
+                records = _emit(records, sink)
+        else:
+            records = _emit((solve_file(file, arguments.language, options) for file in files), sink)
+    finally:
+        if sink is not None:
+            sink.close()
+
+    return 1 if any(record["status"] == "error" for record in records) else 0
+
+
+def _emit(records, sink) -> list[dict]:
+    ##
+    # @brief Grava cada registro assim que ele fica pronto, no `ResultsWriter` ou como texto na saída padrão.
+
+    emitted = []
+    for record in records:
+        if sink is not None:
+            sink.write(record)
+        else:
+            objective = "" if record["objective"] is None else f" {record['objective']:.6g}"
+            print(f"{record['file']}: {record['status']}{objective}", flush=True)
+        emitted.append(record)
+    return emitted
+
+
+def _build_document(files: list[str], arguments: argparse.Namespace, options: dict) -> list[dict]:
+    from IncrementalBuild import IncrementalBatchBuilder
+    from Solver import SolverOptions
+
+    output_directory = os.path.join(os.path.abspath(arguments.output_dir), "")
+    languages = arguments.languages or [arguments.language]
+    builder = IncrementalBatchBuilder([os.path.abspath(file) for file in files], SolverOptions(**options),
+                                      languages[0], output_directory, languages=languages, jobs=arguments.jobs,
+                                      render_policy=get_render_policy(arguments))
+    builder.build()
+    for output_file in builder.output_files.values():
+        print(output_file, file=sys.stderr)
+    return builder.results
+
+
+if __name__ == "__main__":
+    sys.exit(main())
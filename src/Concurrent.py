@@ -0,0 +1,129 @@
+##
+# @file Concurrent.py
+# @brief Modo concorrente: executa várias configurações do solver e mantém a primeira a terminar.
+# @details Cada estratégia (`SolverOptions`) roda em um processo separado sobre o mesmo problema,
+# compartilhado via `SharedProblem` para evitar uma cópia da matriz por processo. O primeiro resultado
+# conclusivo (ótimo, degenerado, ilimitado ou inviável) é retornado e os demais processos são encerrados.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import logging
+import multiprocessing
+import queue
+import time
+
+from SharedProblem import SharedProblem, SharedProblemHandle
+from Solver import RevisedSimplex, SolverOptions
+
+logger = logging.getLogger(__name__)
+
+
+def _race_worker(strategy: str, handle: SharedProblemHandle, options: SolverOptions, results: multiprocessing.Queue) -> None:
+    ##
+    # @brief Resolve o problema compartilhado com uma estratégia e publica o resultado na fila.
+
+    start = time.perf_counter()
+    try:
+        solver = RevisedSimplex.from_shared(handle, options=options, quiet=True)
+        result = solver.solve(show_steps=False)
+        results.put((strategy, {
+            "status": result.status.value,
+            "solution": result.get_solution(),
+            "basis": result.get_basis_names(),
+            "iterations": result.iterations,
+            "elapsed": time.perf_counter() - start,
+        }))
+    except Exception as error:
+        results.put((strategy, {"status": "error", "error": repr(error), "elapsed": time.perf_counter() - start}))
+
+
+class ConcurrentSolver:
+    ##
+    # @class ConcurrentSolver
+    # @brief Corrida entre estratégias do `RevisedSimplex` em processos separados.
+    # @details
+    # Um resultado é considerado conclusivo quando seu status está em `FINISHED_STATUSES`. Se nenhuma
+    # estratégia concluir (por exemplo, todas excederem o limite de iterações), o último resultado recebido
+    # é retornado. O dicionário devolvido sempre inclui a chave `strategy` com o nome da vencedora.
+    # Um processo que morre sem publicar o resultado (falha de segmentação, falta de memória, `SIGKILL`) é
+    # percebido a cada `POLL_INTERVAL` segundos e conta como um resultado com status `error`, então não
+    # trava a corrida mesmo sem `timeout`.
+
+    FINISHED_STATUSES = ["optimal", "degenerate", "unbounded", "infeasible/phase_1", "infeasible/phase_2"]
+    POLL_INTERVAL = 0.1
+    DEFAULT_STRATEGIES = {
+        "dantzig": SolverOptions(pricing="dantzig"),
+        "steepest_edge": SolverOptions(pricing="steepest_edge"),
+    }
+
+    def __init__(self, strategies: dict[str, SolverOptions] = None, timeout: float = None) -> None:
+        ##
+        # @param strategies Dicionário nome -> `SolverOptions` com as estratégias a competir.
+        # @param timeout Tempo máximo de espera em segundos (sem limite se omitido).
+
+        self.strategies = strategies if strategies is not None else dict(self.DEFAULT_STRATEGIES)
+        self.timeout = timeout
+
+    def solve(self, data: dict) -> dict:
+        ##
+        # @brief Executa a corrida sobre um problema no formato do `FileParser`.
+        # @param data Dicionário do problema.
+        # @return O resultado da estratégia vencedora.
+        # @exception TimeoutError Se nenhum resultado chegar dentro de `timeout`.
+
+        results = multiprocessing.Queue()
+        with SharedProblem.create(data) as shared_problem:
+            workers = {
+                name: multiprocessing.Process(target=_race_worker, args=(name, shared_problem.handle, options, results), daemon=True)
+                for name, options in self.strategies.items()
+            }
+            for worker in workers.values():
+                worker.start()
+            try:
+                return self.__wait_for_winner(results, workers)
+            finally:
+                for worker in workers.values():
+                    if worker.is_alive():
+                        worker.terminate()
+                for worker in workers.values():
+                    worker.join()
+
+    def __wait_for_winner(self, results: multiprocessing.Queue, workers: dict[str, multiprocessing.Process]) -> dict:
+        start = time.monotonic()
+        deadline = None if self.timeout is None else start + self.timeout
+        last_result = None
+        reported = set()
+        while len(reported) < len(workers):
+            remaining = self.POLL_INTERVAL
+            if deadline is not None:
+                remaining = min(max(deadline - time.monotonic(), 0), self.POLL_INTERVAL)
+            try:
+                strategy, result = results.get(timeout=remaining)
+            except queue.Empty:
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                crashed = [name for name, worker in workers.items() if worker.exitcode is not None and name not in reported]
+                if not crashed:
+                    continue
+                try:
+                    # Quem terminou normalmente já gravou o resultado no pipe antes de o código de saída aparecer.
+                    strategy, result = results.get_nowait()
+                except queue.Empty:
+                    for name in crashed:
+                        logger.warning("Estratégia %s encerrada sem resultado (código de saída %s)", name,
+                                       workers[name].exitcode)
+                        reported.add(name)
+                        last_result = {"status": "error", "error": f"processo encerrado com código {workers[name].exitcode}",
+                                       "elapsed": time.monotonic() - start, "strategy": name}
+                    continue
+            reported.add(strategy)
+            result["strategy"] = strategy
+            if result["status"] in self.FINISHED_STATUSES:
+                logger.info("Estratégia vencedora: %s (%s, %.4fs)", strategy, result["status"], result["elapsed"])
+                return result
+            logger.info("Estratégia %s terminou sem conclusão: %s", strategy, result["status"])
+            last_result = result
+
+        if last_result is None:
+            raise TimeoutError("Nenhuma estratégia terminou dentro do tempo limite.")
+        return last_result
@@ -1,5 +1,7 @@
 DATA_INPUT = "../data/input/"
 DATA_OUTPUT = "../data/output/"
+DATA_CACHE = "../data/cache/"
+RESULTS_FILE = "results.jsonl"
 VALID_YES = ["s", "y", "yes", "sim", "si"]
 
 EXAMPLE_FILE = "example.txt"
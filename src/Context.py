@@ -0,0 +1,59 @@
+##
+# @file Context.py
+# @brief Estado de execução local a cada resolução (idioma, saída de mensagens e diretório de saída).
+# @details Os valores são guardados em `contextvars`, de forma que cada thread (ou tarefa asyncio) enxerga
+# apenas a configuração que ela mesma definiu. Assim, várias resoluções podem rodar ao mesmo tempo com
+# idiomas e destinos diferentes sem nenhuma variável global de módulo ser alterada.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import sys
+from contextvars import ContextVar
+
+import Constants
+
+_language = ContextVar("language", default="pt")
+_output = ContextVar("output", default=None)
+_output_directory = ContextVar("output_directory", default=Constants.DATA_OUTPUT)
+
+
+class SolveContext:
+    ##
+    # @class SolveContext
+    # @brief Define, dentro de um bloco `with`, o idioma, a saída de mensagens e o diretório dos documentos.
+    # @details Os parâmetros omitidos mantêm o valor já vigente. Ao sair do bloco, os valores anteriores
+    # são restaurados. Exemplo:
+    # @code
+    # with SolveContext(language="en", output=io.StringIO()):
+    #     solver.solve()
+    # @endcode
+
+    def __init__(self, language: str = None, output=None, output_directory: str = None) -> None:
+        self.values = [(_language, language), (_output, output), (_output_directory, output_directory)]
+        self.tokens = []
+
+    def __enter__(self) -> "SolveContext":
+        self.tokens = [(variable, variable.set(value)) for variable, value in self.values if value is not None]
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        for variable, token in reversed(self.tokens):
+            variable.reset(token)
+        self.tokens = []
+
+    @staticmethod
+    def get_language() -> str:
+        return _language.get()
+
+    @staticmethod
+    def set_language(language: str) -> None:
+        _language.set(language)
+
+    @staticmethod
+    def get_output():
+        output = _output.get()
+        return output if output is not None else sys.stdout
+
+    @staticmethod
+    def get_output_directory() -> str:
+        return _output_directory.get()
@@ -0,0 +1,154 @@
+##
+# @file Exact.py
+# @brief Aritmética racional exata para o Simplex Revisado, sem objetos `Fraction` nos cálculos.
+# @details A inversa da matriz básica é mantida como `B^{-1} = adj / d`, com `adj` inteira e um único
+# denominador `d` (o determinante da base, a menos do sinal). A base inicial é invertida por eliminação de
+# Gauss-Jordan sem frações (Bareiss) e cada troca de base atualiza `adj` com a mesma regra; todas as divisões
+# são exatas, então os inteiros só crescem com o determinante da base, e não com o número de iterações.
+# As decisões (variável que entra, razão mínima e empates) são tomadas sobre esses inteiros, e as frações
+# reduzidas só são montadas para o que vai para o LaTeX.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import math
+from fractions import Fraction
+
+import numpy as np
+
+
+def to_fraction(value) -> Fraction:
+    ##
+    # @brief Converte um valor lido do problema na fração que ele representa em decimal.
+    # @details `0.1` vira `1/10` (e não a fração binária do float), pois usa a menor representação do float.
+
+    if isinstance(value, Fraction):
+        return value
+    return Fraction(repr(float(value)))
+
+
+def to_fraction_array(values) -> np.ndarray:
+    return np.vectorize(to_fraction, otypes=[object])(np.asarray(values))
+
+
+def get_fraction_array(numerators: np.ndarray, denominator: int) -> np.ndarray:
+    ##
+    # @brief Monta as frações reduzidas `numerators / denominator` (`dtype=object`), com o mesmo formato.
+
+    return np.vectorize(lambda numerator: Fraction(numerator, denominator), otypes=[object])(numerators)
+
+
+def to_integer_rows(matrix) -> (np.ndarray, np.ndarray):
+    ##
+    # @brief Multiplica cada linha pelo MMC dos denominadores dos seus elementos.
+    # @return Uma tupla com a matriz de inteiros (`dtype=object`) e o fator de cada linha.
+
+    fractions = to_fraction_array(matrix)
+    scale = np.array([math.lcm(*(value.denominator for value in row)) if len(row) else 1 for row in fractions],
+                     dtype=object)
+    integers = np.vectorize(lambda value: value.numerator, otypes=[object])(fractions * scale[:, np.newaxis])
+    return integers, scale
+
+
+def invert_fraction_free(matrix: np.ndarray) -> (np.ndarray, int):
+    ##
+    # @brief Inverte uma matriz inteira por Gauss-Jordan sem frações (Bareiss).
+    # @return Uma tupla `(adj, d)` com `matrix^{-1} = adj / d`, ambos inteiros.
+    # @details Cada passo faz `(p a_ij - a_ik a_kj) / p_anterior` em todas as linhas menos a do pivô; a divisão
+    # é sempre exata e, no fim, a diagonal inteira vale o último pivô.
+
+    size = matrix.shape[0]
+    augmented = np.concatenate((np.asarray(matrix, dtype=object), np.eye(size, dtype=np.int64).astype(object)), axis=1)
+    previous = 1
+    for k in range(size):
+        pivot_row = next((i for i in range(k, size) if augmented[i, k] != 0), None)
+        if pivot_row is None:
+            raise ValueError("A matriz básica é singular.")
+        if pivot_row != k:
+            augmented[[k, pivot_row]] = augmented[[pivot_row, k]]
+        pivot = augmented[k, k]
+        others = np.arange(size) != k
+        augmented[others] = (pivot * augmented[others] - np.outer(augmented[others, k], augmented[k])) // previous
+        previous = pivot
+    return augmented[:, size:], previous
+
+
+class FractionFreeBasis:
+    ##
+    # @class FractionFreeBasis
+    # @brief Base do Simplex Revisado em aritmética exata (ver `SolverOptions(arithmetic="exact")`).
+    # @details As linhas de A e b são multiplicadas por inteiros (`row_scale`) para ficarem inteiras, o que não
+    # altera `x_b`, `y` nem os custos reduzidos; `B^{-1}` e `c_b B^{-1}` são corrigidos por esse fator ao serem
+    # exibidos. Os custos também ficam inteiros, sobre um denominador comum.
+
+    def __init__(self, constraint_matrix: np.ndarray, restrictions: np.ndarray, costs: np.ndarray,
+                 basic_indexes: list[int]) -> None:
+        restrictions = np.asarray(restrictions).reshape(-1, 1)
+        augmented, self.row_scale = to_integer_rows(np.hstack((constraint_matrix, restrictions)))
+        self.matrix, self.restrictions = augmented[:, :-1], augmented[:, -1]
+        costs = to_fraction_array(costs)
+        self.cost_denominator = math.lcm(*(cost.denominator for cost in costs))
+        self.costs = np.array([cost.numerator * (self.cost_denominator // cost.denominator) for cost in costs],
+                              dtype=object)
+        self.basic_indexes = list(basic_indexes)
+        self.adjugate, self.determinant = invert_fraction_free(self.matrix[:, self.basic_indexes])
+
+    def price(self, non_basic_indexes: list[int]) -> (np.ndarray, np.ndarray, int, int):
+        ##
+        # @brief Calcula `x_b` e os custos reduzidos e escolhe a variável que entra (menor custo reduzido).
+        # @return Uma tupla `(x_b, c_r, indice, empates)` com as mesmas convenções de `BlockPricer.price`.
+
+        columns = self.matrix[:, non_basic_indexes]
+        duals = self.costs[self.basic_indexes] @ self.adjugate
+        reduced_costs = self.costs[non_basic_indexes] * self.determinant - duals @ columns
+        signed = reduced_costs if self.determinant > 0 else -reduced_costs
+
+        index, ties = -1, 0
+        negative_indexes = [i for i, value in enumerate(signed) if value < 0]
+        if negative_indexes:
+            minimum = min(signed[i] for i in negative_indexes)
+            index = next(i for i in negative_indexes if signed[i] == minimum)
+            ties = sum(1 for i in negative_indexes if signed[i] == minimum)
+
+        x_b = get_fraction_array((self.adjugate @ self.restrictions).reshape(-1, 1), self.determinant)
+        c_r = get_fraction_array(reduced_costs, self.cost_denominator * self.determinant)
+        return x_b, c_r, index, ties
+
+    def get_direction(self, column_index: int) -> np.ndarray:
+        ##
+        # @brief Retorna `y = B^{-1} a_q` como coluna de frações.
+
+        return get_fraction_array((self.adjugate @ self.matrix[:, column_index]).reshape(-1, 1), self.determinant)
+
+    def get_inverse(self) -> np.ndarray:
+        return get_fraction_array(self.adjugate * self.row_scale[np.newaxis, :], self.determinant)
+
+    def get_duals(self) -> np.ndarray:
+        ##
+        # @brief Retorna `p_t = c_b B^{-1}` do problema original.
+
+        duals = (self.costs[self.basic_indexes] @ self.adjugate) * self.row_scale
+        return get_fraction_array(duals, self.cost_denominator * self.determinant)
+
+    def get_variable_values(self) -> np.ndarray:
+        ##
+        # @brief Valores de todas as colunas na solução básica atual (zero fora da base).
+
+        values = np.full(self.matrix.shape[1], Fraction(0), dtype=object)
+        values[self.basic_indexes] = get_fraction_array(self.adjugate @ self.restrictions, self.determinant)
+        return values
+
+    def replace(self, position: int, column_index: int) -> None:
+        ##
+        # @brief Troca a variável básica da posição `position` pela coluna `column_index`.
+        # @details Com `y = adj a_q`, o novo denominador é `y_r` e as demais linhas viram
+        # `(y_r adj_i - y_i adj_r) / d`, divisão exata pelo denominador anterior.
+
+        direction = self.adjugate @ self.matrix[:, column_index]
+        pivot = direction[position]
+        if pivot == 0:
+            raise ValueError("O pivô da troca de base é nulo.")
+        others = np.arange(len(self.basic_indexes)) != position
+        self.adjugate[others] = (pivot * self.adjugate[others]
+                                 - np.outer(direction[others], self.adjugate[position])) // self.determinant
+        self.determinant = pivot
+        self.basic_indexes[position] = column_index
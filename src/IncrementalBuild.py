@@ -0,0 +1,262 @@
+##
+# @file IncrementalBuild.py
+# @brief Geração incremental do documento LaTeX com a resolução de vários problemas.
+# @details Cada problema é resolvido em um fragmento próprio (sem preâmbulo), guardado em `<idioma>/.build/`
+# junto de um `manifest.json` que registra, por arquivo de entrada, o hash do conteúdo, as opções do solver,
+# a política de escrita, o idioma, o número do exercício e o fragmento gerado. Em uma nova execução, apenas os
+# arquivos cuja entrada no manifesto não confere são resolvidos novamente.
+# O documento geral é um índice pequeno, com um `\input` por fragmento, regravado de forma atômica no fim;
+# se a execução for interrompida, o índice anterior e os fragmentos já concluídos continuam válidos.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import Constants
+from Context import SolveContext
+from LatexWriter import LatexWriter, MultiLanguageLatexWriter
+from RenderPolicy import RenderPolicy
+from ResultsWriter import ResultsWriter
+from Solver import RevisedSimplex, SolverOptions
+from Utils import LanguageUtils
+
+
+class IncrementalBatchBuilder:
+    ##
+    # @class IncrementalBatchBuilder
+    # @brief Resolve uma lista de arquivos e monta o documento geral, reaproveitando fragmentos inalterados.
+    # @details O documento geral inclui os fragmentos com `\input`, com uma quebra de página entre eles, e deve
+    # ser compilado no diretório do idioma. Com `inline_fragments`, o conteúdo dos fragmentos é copiado para o
+    # documento, que fica idêntico ao produzido ao escrever todos os exercícios em um único `LatexWriter`.
+    # Em ambos os casos, os fragmentos nunca são carregados juntos na memória.
+    # Com `jobs` > 1, os fragmentos desatualizados são gerados em paralelo, em processos separados.
+    # Com um `ResultsWriter`, um registro é gravado por arquivo, na ordem da lista; para fragmentos
+    # reaproveitados, o registro salvo no manifesto é regravado com `"cached": true` nos tempos.
+    # Com `languages`, cada problema é resolvido uma única vez e os fragmentos e documentos de todos esses
+    # idiomas são gerados juntos (ver `MultiLanguageLatexWriter`); cada idioma tem o próprio manifesto.
+    # Um arquivo que não pode ser lido ou resolvido fica em `failed`, com um registro de status `error` em
+    # `results`, e fica de fora do documento e do manifesto (sendo tentado de novo na próxima execução).
+    # Com `on_result`, a função recebe `(arquivo, registro)` de cada arquivo assim que ele fica pronto (ou é
+    # reaproveitado), na ordem da lista, para que quem chamou informe o progresso durante o `build()`.
+    # Com `render_policy`, os fragmentos são escritos com esses limites de tamanho (ver `RenderPolicy`); a política
+    # faz parte do manifesto, então mudá-la refaz os fragmentos.
+
+    FORMAT_VERSION = 1
+    BUILD_DIRECTORY = ".build"
+    RENDER_ERRORS = (OSError, ValueError, IndexError)
+    PAGE_BREAK = "\n\n" + r"\newpage" + "\n\n"
+
+    def __init__(self, input_files: list[str], options: SolverOptions = None, language: str = None,
+                 output_directory: str = None, problem_cache=None, output_name: str = None,
+                 results_writer: ResultsWriter = None, languages: list[str] = None, inline_fragments: bool = False,
+                 jobs: int = 1, on_result=None, render_policy: RenderPolicy = None) -> None:
+        self.input_files = list(input_files)
+        self.options = options if options is not None else SolverOptions()
+        self.language = language
+        self.languages = list(languages) if languages else None
+        self.output_directory = output_directory
+        self.problem_cache = problem_cache
+        self.output_name = output_name
+        self.results_writer = results_writer
+        self.inline_fragments = inline_fragments
+        self.jobs = jobs
+        self.on_result = on_result
+        self.render_policy = render_policy if render_policy is not None else RenderPolicy()
+        self.rebuilt = []
+        self.reused = []
+        self.failed = []
+        self.results = []
+        self.output_files = {}
+
+    def build(self) -> str:
+        ##
+        # @brief Atualiza os fragmentos desatualizados e regrava o documento geral de cada idioma.
+        # @return Caminho do documento `.tex` gerado (o do primeiro idioma, com vários idiomas; todos ficam em
+        # `output_files`).
+
+        with SolveContext(language=self.language, output_directory=self.output_directory):
+            languages = self.languages or [LanguageUtils.get_language()]
+            output_directory = SolveContext.get_output_directory()
+            manifest_files, manifests, new_manifests = {}, {}, {}
+            for language in languages:
+                build_directory = f"{output_directory}{language}/{self.BUILD_DIRECTORY}"
+                os.makedirs(build_directory, exist_ok=True)
+                manifest_files[language] = os.path.join(build_directory, "manifest.json")
+                manifests[language] = self.__load_manifest(manifest_files[language])
+                new_manifests[language] = {}
+
+            all_records, stale = [], []
+            for exercise_number, input_file in enumerate(self.input_files, start=1):
+                content_hash = self.__get_content_hash(input_file)
+                records = {language: {
+                    "hash": content_hash,
+                    "options": self.options.to_dict(),
+                    "render_policy": self.render_policy.to_dict(),
+                    "language": language,
+                    "exercise_number": exercise_number,
+                    "version": self.FORMAT_VERSION,
+                } for language in languages}
+                previous = {language: manifests[language].get(input_file) for language in languages}
+                if all(self.__is_reusable(previous[language], records[language]) for language in languages):
+                    for language in languages:
+                        records[language]["fragment"] = previous[language]["fragment"]
+                        records[language]["result"] = previous[language].get("result")
+                else:
+                    stale.append((input_file, exercise_number))
+                all_records.append((input_file, records))
+
+            self.rebuilt, self.reused, self.failed, self.results = [], [], [], []
+            rendered = self.__render_stale(stale, languages, output_directory)
+            try:
+                for input_file, records in all_records:
+                    if "fragment" in records[languages[0]]:
+                        result = records[languages[0]]["result"]
+                        if result is not None:
+                            # Cópia: o registro do manifesto continua sendo o da resolução que gerou o fragmento.
+                            result = dict(result, timings=dict(result["timings"], cached=True))
+                        self.reused.append(input_file)
+                    else:
+                        fragment_files, result = next(rendered)
+                        if fragment_files is None:
+                            self.failed.append(input_file)
+                        else:
+                            for language in languages:
+                                records[language].update({"fragment": fragment_files[language], "result": result})
+                            self.rebuilt.append(input_file)
+                    if result is not None:
+                        self.results.append(result)
+                        if self.results_writer is not None:
+                            self.results_writer.write(result)
+                    if self.on_result is not None:
+                        self.on_result(input_file, result)
+                    if "fragment" in records[languages[0]]:
+                        for language in languages:
+                            new_manifests[language][input_file] = records[language]
+            finally:
+                rendered.close()
+            self.output_files = {}
+            for language in languages:
+                with SolveContext(language=language):
+                    output_file = LatexWriter.get_filename(self.output_name or LanguageUtils.get_translated_text("general_file_id"))
+                fragment_files = [record["fragment"] for record in new_manifests[language].values()]
+                self.__write_atomically(output_file, lambda file: self.__write_document(file, output_file, fragment_files))
+                self.__write_atomically(manifest_files[language],
+                                        lambda file: file.write(json.dumps(new_manifests[language], indent=1)))
+                self.__remove_stale_fragments(manifests[language], new_manifests[language])
+                self.output_files[language] = output_file
+        return self.output_files[languages[0]]
+
+    def __render_stale(self, stale: list, languages: list[str], output_directory: str):
+        ##
+        # @brief Gera os fragmentos desatualizados, na ordem de `stale`, um a um ou em processos separados.
+        # @details Um arquivo que não pode ser resolvido produz `(None, registro de erro)` em vez de interromper
+        # o lote, como em `Cli.solve_file`.
+
+        if self.jobs <= 1 or len(stale) <= 1:
+            for input_file, exercise_number in stale:
+                try:
+                    yield render_fragment(input_file, exercise_number, languages, self.options, output_directory,
+                                          self.problem_cache, self.render_policy)
+                except self.RENDER_ERRORS as error:
+                    yield None, ResultsWriter.get_error_record(os.path.basename(input_file), error)
+            return
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            futures = [pool.submit(render_fragment, input_file, exercise_number, languages, self.options,
+                                   output_directory, self.problem_cache, self.render_policy)
+                       for input_file, exercise_number in stale]
+            for (input_file, _), future in zip(stale, futures):
+                try:
+                    yield future.result()
+                except self.RENDER_ERRORS as error:
+                    yield None, ResultsWriter.get_error_record(os.path.basename(input_file), error)
+
+    def __write_document(self, file, output_file: str, fragment_files: list[str]) -> None:
+        file.write(Constants.LATEX_INITIALIZATION + "\n\n")
+        for i, fragment_file in enumerate(fragment_files):
+            if i > 0:
+                file.write(self.PAGE_BREAK)
+            if self.inline_fragments:
+                with open(fragment_file, "r", encoding="utf-8") as fragment:
+                    shutil.copyfileobj(fragment, file)
+            else:
+                relative_path = os.path.relpath(fragment_file, os.path.dirname(os.path.abspath(output_file)))
+                file.write(r"\input{" + relative_path.replace(os.sep, "/") + "}\n")
+        file.write(r"\end{document}")
+
+    @staticmethod
+    def __is_reusable(previous: dict, record: dict) -> bool:
+        return previous is not None and bool(previous.get("fragment")) and os.path.exists(previous["fragment"]) \
+            and all(previous.get(key) == value for key, value in record.items())
+
+    @staticmethod
+    def __get_content_hash(input_file: str) -> str:
+        digest = hashlib.sha256()
+        with open(input_file, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def __load_manifest(manifest_file: str) -> dict:
+        try:
+            with open(manifest_file, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def __remove_stale_fragments(manifest: dict, new_manifest: dict) -> None:
+        in_use = {record["fragment"] for record in new_manifest.values()}
+        for record in manifest.values():
+            fragment = record.get("fragment")
+            if fragment and fragment not in in_use and os.path.exists(fragment):
+                os.remove(fragment)
+
+    @staticmethod
+    def __write_atomically(filename: str, write_content) -> None:
+        descriptor, temporary = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=os.path.dirname(filename) or ".")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                write_content(file)
+            os.replace(temporary, filename)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+
+def render_fragment(input_file: str, exercise_number: int, languages: list[str], options: SolverOptions = None,
+                    output_directory: str = None, problem_cache=None, render_policy: RenderPolicy = None) -> (dict, dict):
+    ##
+    # @brief Resolve um arquivo e grava o seu fragmento em `<idioma>/.build/` para cada idioma.
+    # @details Pode ser chamada isoladamente (para refazer um único exercício) ou em um processo separado.
+    # Se o arquivo não puder ser resolvido, os fragmentos incompletos são apagados e o erro é propagado.
+    # `render_policy` limita o tamanho do passo a passo (ver `RenderPolicy`); sem ela, tudo é escrito.
+    # @return Uma tupla com os caminhos dos fragmentos por idioma e o registro de resultado (ver `ResultsWriter`).
+
+    key = hashlib.sha256(os.path.abspath(input_file).encode()).hexdigest()[:16]
+    with SolveContext(output_directory=output_directory):
+        writer = MultiLanguageLatexWriter(f"{IncrementalBatchBuilder.BUILD_DIRECTORY}/{key}", languages, standalone=False,
+                                          render_policy=render_policy)
+        try:
+            solver = RevisedSimplex("", True, writer, options=options, problem_cache=problem_cache)
+            start = time.perf_counter()
+            solver.reload_problem(input_file)
+            loaded = time.perf_counter()
+            solver.set_exercise_number(exercise_number)
+            solver.solve(True)
+            timings = {"parse": loaded - start, "solve": time.perf_counter() - loaded}
+        except BaseException:
+            writer.close()
+            for filename in writer.filenames.values():
+                if os.path.exists(filename):
+                    os.remove(filename)
+            raise
+        writer.close()
+    return writer.filenames, ResultsWriter.get_record(os.path.basename(input_file), solver, timings)
@@ -0,0 +1,139 @@
+##
+# @file Instrumentation.py
+# @brief Medição do laço do Simplex Revisado: tempos por fase e por etapa e contadores de eventos.
+# @details Com uma `SolverInstrumentation` ligada (`RevisedSimplex.set_instrumentation`), cada iteração de
+# `__solver_loop` é dividida nas etapas de `STAGES` e o tempo de cada uma é somado na fase em que ocorreu.
+# Desligada (o padrão), o laço só faz um teste `is not None` por etapa. Os resultados podem ser exportados como
+# dicionário, JSON ou um apêndice no documento LaTeX.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import json
+import time
+
+from Utils import LanguageUtils
+
+
+class SolverInstrumentation:
+    ##
+    # @class SolverInstrumentation
+    # @brief Tempos e contadores de uma resolução (os da última, pois são zerados a cada `solve()`).
+    # @details
+    # Etapas (`STAGES`), medidas em segundos por fase:
+    # - `invert`: inversão da matriz básica (na aritmética exata, a fatoração inicial e as matrizes do passo a passo),
+    # - `x_b`: cálculo da solução básica,
+    # - `pricing`: `c_b B^{-1}`, custos reduzidos e escolha da variável que entra (na aritmética exata, inclui `x_b`),
+    # - `ftran`: direção `y = B^{-1} a_q`,
+    # - `ratio_test`: teste de ilimitação, razões e escolha da variável que sai,
+    # - `update`: troca de base, atualização dos valores e montagem do `IterationEvent`.
+    # Contadores (`COUNTERS`): iterações (como em `current_interaction`), pivôs degenerados (passo nulo),
+    # refatorações (inversões completas da base) e iterações com empate na entrada ou na saída.
+    # Com `callback`, a função recebe esta instância após o pivô de cada `every_iterations`-ésima iteração.
+    # Com o passo a passo, a escrita do LaTeX entra no tempo da etapa em que acontece; com `latex_appendix`,
+    # as tabelas de `get_latex_appendix` são escritas ao fim de cada exercício.
+
+    STAGES = ["invert", "x_b", "pricing", "ftran", "ratio_test", "update"]
+    INVERT, X_B, PRICING, FTRAN, RATIO_TEST, UPDATE = range(len(STAGES))
+    COUNTERS = ["iterations", "degenerate_pivots", "refactorizations", "entering_ties", "leaving_ties"]
+
+    def __init__(self, callback=None, every_iterations: int = 1, latex_appendix: bool = False) -> None:
+        if every_iterations < 1:
+            raise ValueError("O intervalo entre as chamadas deve ser de pelo menos uma iteração.")
+        self.callback = callback
+        self.every_iterations = every_iterations
+        self.latex_appendix = latex_appendix
+        self.reset()
+
+    def reset(self) -> None:
+        self.phase_timers = {}
+        self.phase_iterations = {}
+        self.counters = dict.fromkeys(self.COUNTERS, 0)
+        self.phase = None
+        self.__timers = None
+
+    def begin_phase(self, phase: int) -> None:
+        self.phase = phase
+        self.__timers = self.phase_timers.setdefault(phase, [0.0] * len(self.STAGES))
+        self.phase_iterations.setdefault(phase, 0)
+
+    def begin_iteration(self) -> float:
+        ##
+        # @return O instante atual, a partir do qual a primeira etapa da iteração é medida.
+
+        self.counters["iterations"] += 1
+        self.phase_iterations[self.phase] += 1
+        return time.perf_counter()
+
+    def lap(self, stage: int, since: float) -> float:
+        ##
+        # @brief Soma o tempo desde `since` na etapa `stage` da fase atual.
+        # @return O instante atual, início da próxima etapa.
+
+        now = time.perf_counter()
+        self.__timers[stage] += now - since
+        return now
+
+    @staticmethod
+    def clock() -> float:
+        return time.perf_counter()
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        self.counters[counter] += amount
+
+    def end_pivot(self, entering_ties: int, leaving_ties: int, degenerate: bool) -> None:
+        if entering_ties > 1:
+            self.counters["entering_ties"] += 1
+        if leaving_ties > 1:
+            self.counters["leaving_ties"] += 1
+        if degenerate:
+            self.counters["degenerate_pivots"] += 1
+        if self.callback is not None and self.counters["iterations"] % self.every_iterations == 0:
+            self.callback(self)
+
+    def to_dict(self) -> dict:
+        ##
+        # @brief Dicionário serializável em JSON com os tempos (em segundos) e os contadores.
+        # @details `stages` e `total` somam as fases; `phases` tem, por fase, as iterações e os tempos.
+
+        phases = {str(phase): {"iterations": self.phase_iterations[phase], "total": sum(timers),
+                               "stages": dict(zip(self.STAGES, timers))}
+                  for phase, timers in sorted(self.phase_timers.items())}
+        stages = {stage: sum(timers[i] for timers in self.phase_timers.values()) for i, stage in enumerate(self.STAGES)}
+        return {"total": sum(stages.values()), "stages": stages, "phases": phases, "counters": dict(self.counters)}
+
+    def to_json(self, indent: int = None) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def get_latex_appendix(self) -> str:
+        ##
+        # @brief Tabelas com os tempos por etapa e fase (em milissegundos) e com os contadores.
+        # @details Os textos são traduzidos no idioma do contexto atual (`SolveContext`).
+
+        data = self.to_dict()
+        phases = list(data["phases"])
+        phase_names = {"1": LanguageUtils.get_translated_text("phase_one_text"),
+                       "2": LanguageUtils.get_translated_text("phase_two_text")}
+        total_text = LanguageUtils.get_translated_text("instrumentation_total_text")
+
+        rows = [" & ".join([LanguageUtils.get_translated_text("instrumentation_stage_text")]
+                           + [phase_names[phase] for phase in phases] + [total_text]) + r" \\ \hline"]
+        for stage in self.STAGES + ["total"]:
+            times = [data["phases"][phase]["stages"][stage] if stage != "total" else data["phases"][phase]["total"]
+                     for phase in phases] + [data["stages"][stage] if stage != "total" else data["total"]]
+            name = total_text if stage == "total" else r"\texttt{" + stage.replace("_", r"\_") + "}"
+            rows.append(" & ".join([name] + [f"{value * 1000:.3f}" for value in times]) + r" \\")
+        timers_table = (r"\begin{tabular}{l" + "r" * (len(phases) + 1) + r"}" + "\n" + r"\hline" + "\n"
+                        + "\n".join(rows) + "\n" + r"\hline" + "\n" + r"\end{tabular}")
+
+        rows = [LanguageUtils.get_translated_text("instrumentation_counter_text") + " & " + total_text + r" \\ \hline"]
+        rows += [r"\texttt{" + counter.replace("_", r"\_") + "} & " + str(value) + r" \\"
+                 for counter, value in data["counters"].items()]
+        counters_table = (r"\begin{tabular}{lr}" + "\n" + r"\hline" + "\n" + "\n".join(rows) + "\n" + r"\hline"
+                          + "\n" + r"\end{tabular}")
+
+        return "\n\n".join([r"\subsection{" + LanguageUtils.get_translated_text("instrumentation_title") + "}",
+                            LanguageUtils.get_translated_text("instrumentation_description"),
+                            timers_table, counters_table])
+
+    def write_latex(self, latex_writer) -> None:
+        latex_writer.write(self.get_latex_appendix())
@@ -12,6 +12,7 @@ class LanguageDictionary:
         "select_file_intro": "Por favor, selecione o arquivo que deseja resolver: ",
         "conv_all_confirmation": "Foram encontrados <x1> arquivos, tem certeza que deseja escrever todos no documento LaTeX? (s/n): ",
         "exercise_solved": "O problema <x1> foi resolvido e escrito no documento LaTeX com sucesso.",
+        "exercise_failed": "Erro: O problema <x1> não pôde ser resolvido e ficou fora do documento LaTeX: <x2>",
         "all_exercises_solved": "Todos os problemas foram resolvidos e escritos no documento LaTeX. \nDeseja encerrar o programa? (s/n): ",
         "select_file_options": "Digite o número correspondente ao arquivo: ",
         "show_steps": "Deseja visualizar os passos da resolução? (s/n): ",
@@ -76,6 +77,8 @@ class LanguageDictionary:
         "step_5_details": r"Primeiro, calculamos as razões $\frac{x_b}{y}$, onde $y \geq 0$, caso contrário iremos considerar como infinito argumentando que ele certamente não será removido da base.",
         "step_5_formula_variable": "Razões",
         "phase_1_conclusion": "Conclusão da Fase 1",
+        "summarized_iteration_text": "Iteração <x1> (<x2>), resumida: $<x3>$ entra na base, $<x4>$ sai e o elemento pivô é $<x5>$.",
+        "pivot_column_text": "Coluna do pivô ($y$)",
 
 
         "get_negative_pivot_details": "A variável que entrará na base, é obtida ao procurarmos pelo elemento correspondente ao menor número negativo do vetor de custos reduzidos $c_r$.",
@@ -106,6 +109,11 @@ class LanguageDictionary:
         "values_text": "Valores: ",
         "basic_variables_text": "Variáveis básicas: ",
         "simple_degenerate_text": "A solução é degenerada, isto é, pode haver mais do que um conjunto de variáveis básicas.",
+        "instrumentation_title": "Estatísticas da resolução",
+        "instrumentation_description": "Tempos de cada etapa do laço do Simplex Revisado, em milissegundos, e contadores de eventos da resolução.",
+        "instrumentation_stage_text": "Etapa",
+        "instrumentation_counter_text": "Contador",
+        "instrumentation_total_text": "Total",
         "solution_file_id": "solucao",
         "general_file_id": "geral"
     }
@@ -122,6 +130,7 @@ class LanguageDictionary:
         "no_file_error": "Error: No file was found.",
         "conv_all_confirmation": "<x1> files were found, are you sure you want to write them all in the LaTeX document? (y/n): ",
         "exercise_solved": "The <x1> problem has been solved and written to the LaTeX document successfully.",
+        "exercise_failed": "Error: The <x1> problem could not be solved and was left out of the LaTeX document: <x2>",
         "all_exercises_solved": "All problems have been solved and written into the LaTeX document. \nDo you want to close the program? (y/n): ",
         "select_file_intro": "Please select the file you want to solve:",
         "select_file_options": "Enter the corresponding number for the file: ",
@@ -187,6 +196,8 @@ class LanguageDictionary:
         "step_5_details": r"First, we calculate the ratios $\frac{x_b}{y}$, where $y \geq 0$, otherwise we consider it infinitely positive, arguing it will certainly not leave the basis.",
         "step_5_formula_variable": "Ratios",
         "phase_1_conclusion": "Phase 1 Conclusion",
+        "summarized_iteration_text": "Iteration <x1> (<x2>), summarized: $<x3>$ enters the basis, $<x4>$ leaves and the pivot element is $<x5>$.",
+        "pivot_column_text": "Pivot column ($y$)",
 
         "get_negative_pivot_details": "The variable entering the basis is chosen as the element corresponding to the smallest negative number in the reduced cost vector $c_r$.",
         "get_negative_pivot_entering_element_details": "Element entering the basis $= min_{Negative} <x1> $",
@@ -215,6 +226,11 @@ class LanguageDictionary:
         "values_text": "Values: ",
         "basic_variables_text": "Basic variables: ",
         "simple_degenerate_text": "The solution is degenerate, meaning there may be more than one set of basic variables.",
+        "instrumentation_title": "Solver statistics",
+        "instrumentation_description": "Time spent in each stage of the Revised Simplex loop, in milliseconds, and event counters of the solve.",
+        "instrumentation_stage_text": "Stage",
+        "instrumentation_counter_text": "Counter",
+        "instrumentation_total_text": "Total",
         "solution_file_id": "solution",
         "general_file_id": "general"
     }
@@ -231,6 +247,7 @@ class LanguageDictionary:
         "no_file_error": "Error: No se encontró ningún archivo.",
         "conv_all_confirmation": "Se han encontrado archivos <x1>, está seguro de que desea escribirlos todos en el documento LaTeX? (sí/no): ",
         "exercise_solved": "El problema <x1> ha sido resuelto y escrito en el documento LaTeX con éxito.",
+        "exercise_failed": "Error: El problema <x1> no pudo ser resuelto y quedó fuera del documento LaTeX: <x2>",
         "all_exercises_solved": "Todos los problemas han sido resueltos y escritos en el documento LaTeX. \nDesea cerrar el programa? (sí/no): ",
         "select_file_intro": "Por favor, seleccione el archivo que desea resolver: ",
         "select_file_options": "Ingrese el número correspondiente al archivo: ",
@@ -296,6 +313,8 @@ class LanguageDictionary:
         "step_5_details": r"Primero, calculamos las razones $\frac{x_b}{y}$, donde $y \geq 0$, de lo contrario, lo consideramos infinitamente positivo, argumentando que ciertamente no saldrá de la base.",
         "step_5_formula_variable": "Razones",
         "phase_1_conclusion": "Conclusión de la Fase 1",
+        "summarized_iteration_text": "Iteración <x1> (<x2>), resumida: $<x3>$ entra en la base, $<x4>$ sale y el elemento pivote es $<x5>$.",
+        "pivot_column_text": "Columna del pivote ($y$)",
 
         "get_negative_pivot_details": "la variable que entra en la base se elige como el elemento correspondiente al menor número negativo en el vector de costos reducidos $c_r$.",
         "get_negative_pivot_entering_element_details": "Elemento que entra en la base $= min_{Negativo} <x1> $",
@@ -324,6 +343,11 @@ class LanguageDictionary:
         "values_text": "Valores: ",
         "basic_variables_text": "Variables básicas: ",
         "simple_degenerate_text": "La solución es degenerada, lo que significa que puede haber más de un conjunto de variables básicas.",
+        "instrumentation_title": "Estadísticas de la resolución",
+        "instrumentation_description": "Tiempos de cada etapa del ciclo del Simplex Revisado, en milisegundos, y contadores de eventos de la resolución.",
+        "instrumentation_stage_text": "Etapa",
+        "instrumentation_counter_text": "Contador",
+        "instrumentation_total_text": "Total",
         "solution_file_id": "solucion",
         "general_file_id": "general"
 }
@@ -1,19 +1,47 @@
+import queue
+import threading
+import weakref
+
 import numpy as np
+from Context import SolveContext
+from RenderPolicy import RenderPolicy
 from Utils import LatexUtils, LanguageUtils
 import Constants
 
 
 class LatexWriter:
-    def __init__(self, filename: str):
-        self.filename = f"{Constants.DATA_OUTPUT}{LanguageUtils.get_language()}/{filename}_{LanguageUtils.get_translated_text('solution_file_id')}.tex"
-        self.file = open(self.filename, "w", encoding="utf-8")
-        self.write(Constants.LATEX_INITIALIZATION, break_line=True)
+    # Chaves de `step` lidas por `write_iteration` no resumo de uma iteração (`detailed` falso).
+    SUMMARIZED_ITERATION_FIELDS = ("detailed", "phase", "iteration", "entering", "leaving", "basis", "non_basis", "y")
+
+    def __init__(self, filename: str, language: str = None, output_directory: str = None, standalone: bool = True,
+                 buffer_size: int = -1, render_policy: RenderPolicy = None):
+        self.render_policy = render_policy if render_policy is not None else RenderPolicy()
+        with SolveContext(language=language, output_directory=output_directory):
+            self.language = LanguageUtils.get_language()
+            self.filename = LatexWriter.get_filename(filename)
+        self.standalone = standalone
+        self.file = open(self.filename, "w", encoding="utf-8", buffering=buffer_size)
+        if standalone:
+            self.write(Constants.LATEX_INITIALIZATION, break_line=True)
+
+    @staticmethod
+    def get_filename(filename: str) -> str:
+        return f"{SolveContext.get_output_directory()}{LanguageUtils.get_language()}/{filename}_{LanguageUtils.get_translated_text('solution_file_id')}.tex"
 
     def close(self):
-        self.write(r"\end{document}", break_line=False)
+        if self.standalone:
+            self.write(r"\end{document}", break_line=False)
         self.file.close()
 
+    def __enter__(self) -> "LatexWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def write(self, content: str = "", break_line: bool = True):
+        if LanguageUtils.TEXT_START in content:
+            content = LanguageUtils.resolve_deferred_text(content, self.language)
         if break_line:
             content += "\n\n"
         self.file.write(content)
@@ -31,13 +59,24 @@ class LatexWriter:
 
     def write_column_identifiers(self, matrix: np.ndarray, column_labels: list[str]):
         converted_labels = LatexUtils.format_variables(column_labels)
-        if matrix.ndim == 1:
+        if self.render_policy.is_large(matrix):
+            converted_labels = self.render_policy.elide_list(converted_labels, ellipsis=r"\cdots")
+            content = r"\[\begin{array}{|" + "c|" * len(converted_labels) + "}" + "\n"
+            content += r"\hline" + "\n"
+            content += " & ".join(converted_labels) + r" \\" + "\n"
+            content += r"\hline" + "\n"
+            for row in self.render_policy.get_elided_cells(matrix if matrix.ndim > 1 else matrix[np.newaxis, :]):
+                content += " & ".join(row) + r" \\" + "\n"
+            content += r"\hline" + "\n"
+            content += r"\end{array}\]" + "\n"
+
+        elif matrix.ndim == 1:
             #todo: Talvez converter os outros casos para usar o Join ao invés de is_first...
             content = r"\[\begin{array}{|" + "c|" * len(converted_labels) + "}" + "\n"
             content += r"\hline" + "\n"
             content += " & ".join(converted_labels) + r" \\" + "\n"
             content += r"\hline" + "\n"
-            content += " & ".join(LatexUtils.format_value(str(matrix[i])) for i in range(len(matrix))) + r" \\" + "\n"
+            content += " & ".join(LatexUtils.format_values(matrix)) + r" \\" + "\n"
             content += r"\hline" + "\n"
             content += r"\end{array}\]" + "\n"
 
@@ -46,8 +85,8 @@ class LatexWriter:
             content += r"\hline" + "\n"
             content += " & ".join(converted_labels) + r" \\" + "\n"
             content += r"\hline" + "\n"
-            for row in matrix:
-                content += " & ".join(LatexUtils.format_value(str(val)) for val in row) + r" \\" + "\n"
+            for row in LatexUtils.format_values(matrix):
+                content += " & ".join(row) + r" \\" + "\n"
             content += r"\hline" + "\n"
             content += r"\end{array}\]" + "\n"
 
@@ -58,7 +97,7 @@ class LatexWriter:
         content = ""
         for identifier, vector in zip(formated_identifiers, vectors):
             content += r"\["+"\n"
-            content += f"{identifier}: {LatexUtils.format_string_vector(vector)}"
+            content += f"{identifier}: {self.render_policy.format_string_vector(vector)}"
             content += "\n"+r"\]"
 
         self.write(content, break_line=True)
@@ -66,20 +105,291 @@ class LatexWriter:
     def write_matrix_equations(self, symbol: str, equations: list[np.ndarray[np.float64]], result: np.ndarray):
         content = r"\[ "
         content += f"{symbol} = "
-        content += LatexUtils.format_matrices(equations) + " = "
-        content += LatexUtils.format_matrix(result)
+        for equation in equations:
+            if isinstance(equation, np.ndarray) and self.render_policy.is_large(equation):
+                content += self.render_policy.format_matrix(equation) + "\n"
+            else:
+                content += LatexUtils.format_matrices([equation])
+        content += " = "
+        if self.render_policy.is_large(result):
+            content += self.render_policy.format_matrix(result) + "\n"
+        else:
+            content += LatexUtils.format_matrix(result)
         content += r" \]"
         self.write(content, break_line=True)
 
+    def write_iteration(self, step: dict):
+        ##
+        # @brief Escreve uma iteração do Simplex Revisado a partir das grandezas já calculadas nela.
+        # @param step Dicionário com as chaves:
+        # - `detailed`: `False` escreve só o resumo (variáveis que entram e saem, elemento e coluna do pivô),
+        # - `phase`, `iteration`: fase (1 ou 2) e número da iteração,
+        # - `variables`, `variable_values`, `basis`, `non_basis`: nomes e valores no início da iteração,
+        # - `inv_b`, `restrictions`, `x_b`: passo 1,
+        # - `costs_n`, `p_t`, `a_n`, `c_r`: passo 2,
+        # - `entering`, `entering_ties`: posição em `non_basis` da variável que entra (`-1` se a solução é ótima)
+        # e número de candidatas empatadas,
+        # - `a_q`, `y`: passo 4,
+        # - `ratios`, `leaving`, `leaving_ties`: passo 5, com a posição em `basis` da variável que sai
+        # (`-1` se o problema é ilimitado).
+        # @details O texto é traduzido para o idioma do escritor. Usado tanto pelo solver, durante a resolução,
+        # quanto pelo `TraceRenderer`, a partir de um rastro gravado.
+
+        with SolveContext(language=self.language):
+            if step["detailed"]:
+                self.__write_detailed_iteration(step)
+            else:
+                self.__write_summarized_iteration(step)
+
     def break_page(self) -> None:
         self.write("\n\n"+r"\newpage", True)
 
+    def __write_detailed_iteration(self, step: dict) -> None:
+        policy = self.render_policy
+        phase_text = LanguageUtils.get_translated_text("phase_one_text" if step["phase"] == 1 else "phase_two_text")
+        self.write(LanguageUtils.get_translated_text_variable_text("iteration_text", [str(step["iteration"]), phase_text]))
+        self.write(LanguageUtils.get_translated_text("current_status_text"))
+        self.write_column_identifiers(np.array(step["variable_values"]), step["variables"])
+        self.write_vectors_with_identifiers(["x_b", "x_n"], [step["basis"], step["non_basis"]])
+        self.write()
+        self.write(r"\textbf{"+LanguageUtils.get_translated_text("step_1_text")+"}")
+        self.write(LanguageUtils.get_translated_text("step_1_details"))
+        self.write_matrix_equations("x_b", [step["inv_b"], step["restrictions"]], step["x_b"])
+
+        self.write(r"\textbf{"+LanguageUtils.get_translated_text("step_2_text")+"}")
+        self.write(LanguageUtils.get_translated_text("step_2_details"))
+        self.write(r"\[ c_r = c_n - (c_b \cdot B^{-1}) \]")
+        self.write_matrix_equations("c_r", [step["costs_n"], "-", step["p_t"], step["a_n"]], step["c_r"])
+
+        self.write(r"\textbf{"+LanguageUtils.get_translated_text("step_3_text")+"}")
+        self.write(LanguageUtils.get_translated_text("get_negative_pivot_details"))
+        self.write(r"\textbf{"+LanguageUtils.get_translated_text_variable_text("get_negative_pivot_entering_element_details", [policy.format_numbers_vector(step["c_r"])])+"}")
+        entering = step["entering"]
+        if entering == -1:
+            self.write(LanguageUtils.get_translated_text("no_negative_pivot_found_details"))
+            return
+        self.write(LanguageUtils.get_translated_text_variable_text("get_negative_pivot_element_index_text", [str(entering + 1), policy.format_string_vector(step["non_basis"])]))
+        self.write(LanguageUtils.get_translated_text_variable_text("get_negative_pivot_chosen_element_text", [LatexUtils.format_variable(step["non_basis"][entering])]))
+        if step["entering_ties"] > 1:
+            self.write(LanguageUtils.get_translated_text("get_negative_pivot_degeneracy"))
+
+        self.write(r"\textbf{"+LanguageUtils.get_translated_text("step_4_text")+"}")
+        self.write(LanguageUtils.get_translated_text("step_4_details"))
+        self.write(r"\[ y =  B^{-1} \cdot A_n \]")
+        self.write_matrix_equations("y", [step["inv_b"], step["a_q"]], step["y"])
+        self.write(LanguageUtils.get_translated_text("step_4_variable_details"))
+        leaving = step["leaving"]
+        if leaving == -1:
+            return
+
+        self.write(r"\textbf{"+LanguageUtils.get_translated_text("step_5_text")+"}")
+        self.write(LanguageUtils.get_translated_text("step_5_details"))
+        self.write_matrix_equations(r"\text{"+LanguageUtils.get_translated_text("step_5_formula_variable")+"}", [step["x_b"], "/", step["y"]], step["ratios"])
+        self.write(LanguageUtils.get_translated_text_variable_text("get_positive_pivot_leaving_element_details", [policy.format_numbers_vector(step["ratios"].reshape(-1, 1)[:, 0])]))
+        self.write(LanguageUtils.get_translated_text_variable_text("get_positive_pivot_element_index_text", [str(leaving + 1), policy.format_string_vector(step["basis"])]))
+        self.write(LanguageUtils.get_translated_text_variable_text("get_positive_pivot_chosen_element_text", [LatexUtils.format_variable(step["basis"][leaving])]))
+        if step["leaving_ties"] > 1:
+            self.write(LanguageUtils.get_translated_text("get_positive_pivot_degeneracy"))
+
+    def __write_summarized_iteration(self, step: dict) -> None:
+        phase_text = LanguageUtils.get_translated_text("phase_one_text" if step["phase"] == 1 else "phase_two_text")
+        if step["entering"] == -1:
+            self.write(LanguageUtils.get_translated_text_variable_text("iteration_text", [str(step["iteration"]), phase_text]))
+            self.write(LanguageUtils.get_translated_text("no_negative_pivot_found_details"))
+            return
+        y = step["y"]
+        if step["leaving"] == -1:
+            self.write(LanguageUtils.get_translated_text_variable_text("iteration_text", [str(step["iteration"]), phase_text]))
+            self.write(LanguageUtils.get_translated_text_variable_text("get_negative_pivot_chosen_element_text", [LatexUtils.format_variable(step["non_basis"][step["entering"]])]))
+            self.write_matrices_with_labels([LanguageUtils.get_translated_text("pivot_column_text")], [y])
+            return
+        self.write(LanguageUtils.get_translated_text_variable_text("summarized_iteration_text", [
+            str(step["iteration"]), phase_text,
+            LatexUtils.format_variable(step["non_basis"][step["entering"]]), LatexUtils.format_variable(step["basis"][step["leaving"]]),
+            LatexUtils.format_values(y[step["leaving"]])[0]]))
+        self.write_matrices_with_labels([LanguageUtils.get_translated_text("pivot_column_text")], [y])
+
     def __format_matrix(self, matrix: np.ndarray) -> str:
+        if self.render_policy.is_large(matrix):
+            return self.render_policy.format_matrix(matrix)
         if matrix.ndim == 1:
-            rows = " & ".join(LatexUtils.format_value(str(val)) for val in matrix)
+            rows = " & ".join(LatexUtils.format_values(matrix))
             return r"\begin{bmatrix}" + rows + r"\end{bmatrix}"
         else:
-            rows = " \\\\\n".join(
-                " & ".join(LatexUtils.format_value(str(val)) for val in row) for row in matrix
-            )
+            rows = " \\\\\n".join(" & ".join(row) for row in LatexUtils.format_values(matrix))
             return r"\begin{bmatrix}" + rows + r"\end{bmatrix}"
+
+
+
+class AsyncLatexWriter(LatexWriter):
+    ##
+    # @class AsyncLatexWriter
+    # @brief `LatexWriter` que formata e grava em uma thread própria, com um buffer de arquivo grande.
+    # @details Cada chamada de escrita vira uma tarefa em uma fila limitada (quem escreve só espera quando
+    # a fila enche). Os vetores recebidos são copiados ao entrar na fila, pois o solver os altera no lugar.
+    # O arquivo é descarregado no disco a cada seção, subseção ou quebra de página, e em `flush()`.
+    # Um erro na thread de escrita é relançado na próxima chamada de `write`, `flush` ou `close`.
+    # `close()` (ou um bloco `with`) é obrigatório: é ele que espera a fila, fecha o documento e relança erros.
+    # Se o escritor não for fechado, as tarefas ainda na fila são gravadas quando o interpretador termina, mas
+    # o documento fica sem o `\end{document}`.
+
+    FLUSH_MARKERS = (r"\section", r"\subsection", r"\newpage")
+
+    def __init__(self, filename: str, language: str = None, output_directory: str = None, standalone: bool = True,
+                 buffer_size: int = 1 << 16, queue_size: int = 256, render_policy: RenderPolicy = None):
+        self.tasks = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.worker = threading.Thread(target=self.__run, name="latex-writer", daemon=True)
+        self.worker.start()
+        try:
+            super().__init__(filename, language, output_directory, standalone, buffer_size, render_policy)
+        except BaseException:
+            self.__stop()
+            raise
+        self.__finalizer = weakref.finalize(self, AsyncLatexWriter.__drain, self.tasks, self.worker, self.file)
+
+    def write(self, content: str = "", break_line: bool = True):
+        if threading.current_thread() is self.worker:
+            super().write(content, break_line)
+            if content.lstrip().startswith(self.FLUSH_MARKERS):
+                self.file.flush()
+        else:
+            self.__submit(super().write, content, break_line)
+
+    def write_matrices_with_labels(self, labels: list[str], matrices: list[np.ndarray]):
+        self.__submit(super().write_matrices_with_labels, labels, matrices)
+
+    def write_column_identifiers(self, matrix: np.ndarray, column_labels: list[str]):
+        self.__submit(super().write_column_identifiers, matrix, column_labels)
+
+    def write_vectors_with_identifiers(self, identifiers: list[str], vectors: list[list[str]]):
+        self.__submit(super().write_vectors_with_identifiers, identifiers, vectors)
+
+    def write_matrix_equations(self, symbol: str, equations: list[np.ndarray[np.float64]], result: np.ndarray):
+        self.__submit(super().write_matrix_equations, symbol, equations, result)
+
+    def write_iteration(self, step: dict):
+        ##
+        # @brief Enfileira a iteração copiando apenas os campos que o resumo usa, quando ela não é detalhada.
+        # @details Assim, `inv_b`, `a_n` e os demais vetores de uma iteração resumida não são copiados.
+
+        if not step["detailed"]:
+            step = {key: step[key] for key in self.SUMMARIZED_ITERATION_FIELDS}
+        self.__submit(super().write_iteration, step)
+
+    def flush(self) -> None:
+        ##
+        # @brief Espera todas as tarefas pendentes e descarrega o arquivo no disco.
+
+        self.__submit(self.file.flush)
+        self.tasks.join()
+        self.__raise_error()
+
+    def close(self):
+        if self.worker.is_alive():
+            self.__submit(super().close, check_error=False)
+        self.__finalizer()
+        self.__raise_error()
+
+    def __submit(self, function, *arguments, check_error: bool = True) -> None:
+        if threading.current_thread() is self.worker:
+            function(*arguments)
+            return
+        if check_error:
+            self.__raise_error()
+        self.tasks.put((function, tuple(AsyncLatexWriter.__snapshot(argument) for argument in arguments)))
+
+    def __run(self) -> None:
+        while True:
+            task = self.tasks.get()
+            try:
+                if task is None:
+                    return
+                function, arguments = task
+                if self.error is None:
+                    function(*arguments)
+            except BaseException as error:
+                self.error = error
+            finally:
+                self.tasks.task_done()
+
+    def __stop(self) -> None:
+        if self.worker.is_alive():
+            self.tasks.put(None)
+            self.worker.join()
+
+    def __raise_error(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    @staticmethod
+    def __drain(tasks: queue.Queue, worker: threading.Thread, file) -> None:
+        ##
+        # @brief Grava as tarefas pendentes, encerra a thread de escrita e fecha o arquivo.
+        # @details Chamado por `close()` ou, se ele faltar, na saída do interpretador (`weakref.finalize`), enquanto
+        # a thread daemon ainda roda. Não recebe o escritor, para não mantê-lo vivo depois de fechado.
+
+        if worker.is_alive():
+            tasks.put(None)
+            worker.join()
+        if not file.closed:
+            file.close()
+
+    @staticmethod
+    def __snapshot(value):
+        if isinstance(value, np.ndarray):
+            return value.copy()
+        if isinstance(value, (list, tuple)):
+            return type(value)(AsyncLatexWriter.__snapshot(item) for item in value)
+        if isinstance(value, dict):
+            return {key: AsyncLatexWriter.__snapshot(item) for key, item in value.items()}
+        return value
+
+
+class MultiLanguageLatexWriter(LatexWriter):
+    ##
+    # @class MultiLanguageLatexWriter
+    # @brief Escreve o mesmo documento em vários idiomas a partir de uma única resolução.
+    # @details Tem um `AsyncLatexWriter` por idioma, cada um com o próprio arquivo em `<saída>/<idioma>/`.
+    # O conteúdo, com os números já formatados, é montado uma única vez com os textos no idioma
+    # `LanguageUtils.DEFERRED_LANGUAGE` e repassado a todos; só os textos do `LanguageDictionary` mudam,
+    # traduzidos por cada escritor ao gravar. Exemplo:
+    # @code
+    # writer = MultiLanguageLatexWriter("problema", ["pt", "en", "es"])
+    # RevisedSimplex("problema.txt", True, writer).solve(True)
+    # writer.close()
+    # @endcode
+
+    def __init__(self, filename: str, languages: list[str] = None, output_directory: str = None,
+                 standalone: bool = True, buffer_size: int = 1 << 16, render_policy: RenderPolicy = None):
+        self.render_policy = render_policy if render_policy is not None else RenderPolicy()
+        self.language = LanguageUtils.DEFERRED_LANGUAGE
+        self.standalone = standalone
+        self.writers = []
+        try:
+            for language in (languages if languages else LanguageUtils.get_available_languages()):
+                self.writers.append(AsyncLatexWriter(filename, language, output_directory, standalone, buffer_size,
+                                                     render_policy=self.render_policy))
+        except BaseException:
+            self.close()
+            raise
+        self.filenames = {writer.language: writer.filename for writer in self.writers}
+        self.filename = self.writers[0].filename
+
+    def write(self, content: str = "", break_line: bool = True):
+        for writer in self.writers:
+            writer.write(content, break_line)
+
+    def flush(self) -> None:
+        for writer in self.writers:
+            writer.flush()
+
+    def close(self):
+        errors = []
+        for writer in self.writers:
+            try:
+                writer.close()
+            except BaseException as error:
+                errors.append(error)
+        if errors:
+            raise errors[0]
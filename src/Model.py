@@ -0,0 +1,190 @@
+##
+# @file Model.py
+# @brief Construção programática de problemas de otimização linear, sem passar pelo formato de texto.
+# @details As variáveis e restrições são adicionadas em blocos (vetores NumPy ou triplas COO) e guardadas em
+# buffers que crescem geometricamente. Limites das variáveis viram linhas de restrição ao gerar o problema,
+# já que o solver considera todas as variáveis >= 0.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import numpy as np
+
+from OutOfCore import OutOfCoreMatrix
+from Utils import FormatUtils
+
+
+class GrowableArray:
+    ##
+    # @class GrowableArray
+    # @brief Vetor NumPy com capacidade pré-alocada, dobrada sempre que um bloco não cabe.
+
+    def __init__(self, dtype, capacity: int = 16) -> None:
+        self.buffer = np.empty(max(capacity, 1), dtype=dtype)
+        self.size = 0
+
+    def extend(self, values) -> None:
+        values = np.asarray(values, dtype=self.buffer.dtype).ravel()
+        required = self.size + values.size
+        if required > self.buffer.size:
+            grown = np.empty(max(required, 2 * self.buffer.size), dtype=self.buffer.dtype)
+            grown[:self.size] = self.buffer[:self.size]
+            self.buffer = grown
+        self.buffer[self.size:required] = values
+        self.size = required
+
+    def view(self) -> np.ndarray:
+        return self.buffer[:self.size]
+
+
+class Model:
+    ##
+    # @class Model
+    # @brief Construtor incremental de problemas para o `RevisedSimplex`.
+    # @details Exemplo:
+    # @code
+    # model = Model(is_maximization=True)
+    # x = model.add_variables(2, cost=[3, 5], names=["x", "y"])
+    # model.add_constraints([[1, 1], [2, 3]], "<=", [4, 9])
+    # solver = model.to_solver()
+    # @endcode
+
+    SENSES = ["<=", ">=", "="]
+
+    def __init__(self, is_maximization: bool = False, capacity: int = 1024) -> None:
+        self.is_maximization = is_maximization
+        self.names = []
+        self.name_set = set()
+        self.cost = GrowableArray(np.float64, capacity)
+        self.lower_bounds = GrowableArray(np.float64, capacity)
+        self.upper_bounds = GrowableArray(np.float64, capacity)
+        self.rows = GrowableArray(np.int64, capacity)
+        self.columns = GrowableArray(np.int64, capacity)
+        self.values = GrowableArray(np.float64, capacity)
+        self.rhs = GrowableArray(np.float64, capacity)
+        self.senses = []
+
+    @property
+    def num_variables(self) -> int:
+        return len(self.names)
+
+    @property
+    def num_constraints(self) -> int:
+        return len(self.senses)
+
+    def add_variables(self, n: int, lb=0.0, ub=np.inf, cost=0.0, names: list[str] = None) -> np.ndarray:
+        ##
+        # @brief Adiciona `n` variáveis de uma vez.
+        # @param lb Limite inferior (escalar ou vetor). Deve ser >= 0.
+        # @param ub Limite superior (escalar ou vetor). `np.inf` para ilimitada.
+        # @param cost Coeficientes da função objetivo (escalar ou vetor).
+        # @param names Nomes das variáveis. Se omitido, usa `x<índice>`. Os nomes devem ser únicos no modelo,
+        # inclusive os gerados automaticamente (um `x2` fornecido antes impede o nome automático da 2ª variável).
+        # @return Índices das variáveis criadas.
+
+        first = self.num_variables
+        lb = np.broadcast_to(np.asarray(lb, dtype=np.float64), (n,))
+        ub = np.broadcast_to(np.asarray(ub, dtype=np.float64), (n,))
+        if np.any(lb < 0):
+            raise ValueError("Limites inferiores negativos não são suportados: todas as variáveis são >= 0.")
+        if np.any(ub < lb):
+            raise ValueError("O limite superior de uma variável é menor que o limite inferior.")
+        if names is None:
+            names = [f"x{i + 1}" for i in range(first, first + n)]
+        elif len(names) != n:
+            raise ValueError(f"Foram fornecidos {len(names)} nomes para {n} variáveis.")
+        names = list(names)
+        new_names = set(names)
+        if len(new_names) != n or not self.name_set.isdisjoint(new_names):
+            repeated = next(name for i, name in enumerate(names) if name in self.name_set or name in names[:i])
+            raise ValueError(f"O nome de variável {repeated} já está em uso no modelo.")
+
+        self.names.extend(names)
+        self.name_set.update(new_names)
+        self.cost.extend(np.broadcast_to(np.asarray(cost, dtype=np.float64), (n,)))
+        self.lower_bounds.extend(lb)
+        self.upper_bounds.extend(ub)
+        return np.arange(first, first + n)
+
+    def add_constraints(self, A_block, sense, rhs) -> np.ndarray:
+        ##
+        # @brief Adiciona um bloco de restrições.
+        # @param A_block Matriz densa `(k, num_variables)` ou triplas COO `(linhas, colunas, valores)`, com as
+        # linhas numeradas a partir de 0 dentro do bloco e as colunas nos índices das variáveis.
+        # @param sense Símbolo (`"<="`, `">="` ou `"="`) para todas as linhas ou uma lista com um por linha.
+        # @param rhs Lado direito (escalar ou vetor com um valor por linha).
+        # @return Índices das restrições criadas.
+
+        rhs = np.atleast_1d(np.asarray(rhs, dtype=np.float64))
+        if isinstance(A_block, tuple):
+            rows, columns, values = (np.asarray(item).ravel() for item in A_block)
+            count = rhs.size if isinstance(sense, str) else len(sense)
+        else:
+            A_block = np.atleast_2d(np.asarray(A_block, dtype=np.float64))
+            if A_block.shape[1] != self.num_variables:
+                raise ValueError(f"O bloco tem {A_block.shape[1]} colunas, mas o modelo tem {self.num_variables} variáveis.")
+            rows, columns = np.nonzero(A_block)
+            values = A_block[rows, columns]
+            count = A_block.shape[0]
+
+        senses = [sense] * count if isinstance(sense, str) else list(sense)
+        if len(senses) != count or rhs.size not in (1, count):
+            raise ValueError("Os símbolos e o lado direito devem ter um valor por restrição.")
+        if any(symbol not in self.SENSES for symbol in senses):
+            raise ValueError(f"Símbolo de restrição desconhecido. Opções: {', '.join(self.SENSES)}")
+        if rows.size > 0 and (rows.min() < 0 or rows.max() >= count or columns.min() < 0
+                              or columns.max() >= self.num_variables):
+            raise ValueError("O bloco de restrições referencia linhas ou variáveis inexistentes.")
+
+        first = self.num_constraints
+        self.rows.extend(rows + first)
+        self.columns.extend(columns)
+        self.values.extend(values)
+        self.rhs.extend(np.broadcast_to(rhs, (count,)))
+        self.senses.extend(senses)
+        return np.arange(first, first + count)
+
+    def to_coo(self) -> (np.ndarray, np.ndarray, np.ndarray, list, np.ndarray):
+        ##
+        # @brief Gera as triplas do problema final, com os limites das variáveis convertidos em restrições.
+        # @return Linhas, colunas, valores, símbolos e lado direito.
+
+        upper = np.nonzero(np.isfinite(self.upper_bounds.view()))[0]
+        lower = np.nonzero(self.lower_bounds.view() > 0)[0]
+        bound_columns = np.concatenate((upper, lower))
+        bound_rows = np.arange(self.num_constraints, self.num_constraints + bound_columns.size)
+
+        rows = np.concatenate((self.rows.view(), bound_rows))
+        columns = np.concatenate((self.columns.view(), bound_columns))
+        values = np.concatenate((self.values.view(), np.ones(bound_columns.size)))
+        symbols = self.senses + ["<="] * upper.size + [">="] * lower.size
+        rhs = np.concatenate((self.rhs.view(), self.upper_bounds.view()[upper], self.lower_bounds.view()[lower]))
+        return rows, columns, values, symbols, rhs
+
+    def to_data(self, out_of_core_file: str = None) -> dict:
+        ##
+        # @brief Gera o dicionário no formato do `FileParser`, aceito por `RevisedSimplex(data=...)`.
+        # @param out_of_core_file Se fornecido, a matriz é gravada nesse arquivo como `OutOfCoreMatrix`, sem
+        # nunca ser montada densa na memória.
+        # @details A função objetivo é uma visão do buffer do modelo e a matriz é montada direto das triplas.
+
+        rows, columns, values, symbols, rhs = self.to_coo()
+        shape = (len(symbols), self.num_variables)
+        if out_of_core_file is not None:
+            constraint_matrix = OutOfCoreMatrix.from_coo(out_of_core_file, rows, columns, values, shape)
+        else:
+            constraint_matrix = FormatUtils.coo_to_dense(rows, columns, values, shape)
+        return {
+            "lp_variables": self.names,
+            "constraint_matrix": constraint_matrix,
+            "is_maximization": self.is_maximization,
+            "objective_function": self.cost.view(),
+            "restrictions_vector": rhs,
+            "symbols": symbols,
+        }
+
+    def to_solver(self, options=None, out_of_core_file: str = None):
+        ##
+        # @brief Cria um `RevisedSimplex` pronto para `solve()` com o problema do modelo.
+
+        from Solver import RevisedSimplex
+        return RevisedSimplex(data=self.to_data(out_of_core_file), options=options)
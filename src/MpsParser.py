@@ -0,0 +1,230 @@
+import os
+import warnings
+from array import array
+
+import numpy as np
+from Utils import FormatUtils
+
+
+class MpsParser:
+    SECTIONS = ["NAME", "OBJSENSE", "ROWS", "COLUMNS", "RHS", "RANGES", "BOUNDS", "ENDATA"]
+    ROW_SYMBOLS = {"L": "<=", "G": ">=", "E": "="}
+    INTEGER_BOUNDS = ("BV", "UI", "LI")
+
+    def __init__(self, filename: str, relax_integrality: bool = False):
+        # O solver só resolve problemas contínuos: variáveis inteiras (blocos MARKER e limites BV, UI e LI) geram
+        # um erro, a não ser que `relax_integrality` peça explicitamente a relaxação linear, que é avisada.
+        self.filename = filename
+        self.relax_integrality = relax_integrality
+
+    def parse_file(self):
+        if not os.path.exists(self.filename):
+            raise FileNotFoundError(f"File {self.filename} does not exist")
+        with open(self.filename, "r") as file:
+            return self.parse_lines(file)
+
+    def parse_content(self, content: str):
+        return self.parse_lines(content.splitlines())
+
+    def parse_lines(self, lines):
+        row_ids = {}
+        symbols = []
+        objective_row = None
+        is_maximization = False
+        variable_ids = {}
+        objective = array("d")
+        rows, columns, values = array("q"), array("q"), array("d")
+        right_sides = {}
+        ranges = {}
+        bounds = []
+        section = None
+        relaxed = set()
+
+        for line in lines:
+            if line.strip() == "" or line.startswith("*"):
+                continue
+            fields = line.split()
+            if not line[0].isspace():
+                section = fields[0].upper()
+                if section not in self.SECTIONS:
+                    raise ValueError(f"Seção MPS desconhecida: {section}")
+                if section == "OBJSENSE" and len(fields) > 1:
+                    is_maximization = fields[1].upper() in ("MAX", "MAXIMIZE")
+                continue
+
+            if section == "OBJSENSE":
+                is_maximization = fields[0].upper() in ("MAX", "MAXIMIZE")
+            elif section == "ROWS":
+                row_type, row_name = fields[0].upper(), fields[1]
+                if row_type == "N":
+                    if objective_row is None:
+                        objective_row = row_name
+                    continue
+                if row_type not in self.ROW_SYMBOLS:
+                    raise ValueError(f"Tipo de linha MPS desconhecido: {row_type}")
+                row_ids[row_name] = len(symbols)
+                symbols.append(self.ROW_SYMBOLS[row_type])
+            elif section == "COLUMNS":
+                if len(fields) > 2 and fields[1].strip("'").upper() == "MARKER":
+                    if fields[2].strip("'").upper() == "INTORG":
+                        relaxed.add(self.__relax("MARKER INTORG", fields[0]))
+                    continue
+                column = variable_ids.setdefault(fields[0], len(variable_ids))
+                if column == len(objective):
+                    objective.append(0.0)
+                for row_name, value in zip(fields[1::2], fields[2::2]):
+                    if row_name == objective_row:
+                        objective[column] = float(value)
+                    elif row_name in row_ids:
+                        rows.append(row_ids[row_name])
+                        columns.append(column)
+                        values.append(float(value))
+            elif section == "RHS":
+                for row_name, value in self.__pairs(fields):
+                    right_sides[row_name] = float(value)
+            elif section == "RANGES":
+                for row_name, value in self.__pairs(fields):
+                    ranges[row_name] = float(value)
+            elif section == "BOUNDS":
+                bounds.append(self.__read_bound(fields))
+
+        restrictions = [right_sides.get(row_name, 0.0) for row_name in row_ids]
+        rows = np.frombuffer(rows, dtype=np.int64)
+        columns = np.frombuffer(columns, dtype=np.int64)
+        values = np.frombuffer(values, dtype=np.float64)
+
+        ranged_rows = np.array([row_ids[row_name] for row_name in ranges], dtype=np.int64)
+        if ranged_rows.size > 0:
+            new_row_ids = np.full(len(symbols), -1, dtype=np.int64)
+            new_row_ids[ranged_rows] = np.arange(len(symbols), len(symbols) + ranged_rows.size)
+            for row_name, range_value in ranges.items():
+                self.__add_range_row(row_ids[row_name], range_value, symbols, restrictions)
+            duplicated = new_row_ids[rows] >= 0
+            rows = np.concatenate((rows, new_row_ids[rows[duplicated]]))
+            columns = np.concatenate((columns, columns[duplicated]))
+            values = np.concatenate((values, values[duplicated]))
+
+        bound_rows = []
+        for bound_type, variable, value in bounds:
+            if variable not in variable_ids:
+                raise ValueError(f"Limite definido para uma variável inexistente: {variable}")
+            if bound_type in self.INTEGER_BOUNDS:
+                relaxed.add(self.__relax(bound_type, variable))
+            if self.__add_bound_row(variable, bound_type, value, symbols, restrictions):
+                bound_rows.append((len(symbols) - 1, variable_ids[variable]))
+        if bound_rows:
+            bound_rows = np.array(bound_rows, dtype=np.int64)
+            rows = np.concatenate((rows, bound_rows[:, 0]))
+            columns = np.concatenate((columns, bound_rows[:, 1]))
+            values = np.concatenate((values, np.ones(len(bound_rows))))
+
+        if relaxed:
+            warnings.warn(f"Integralidade ignorada em {self.filename} ({', '.join(sorted(relaxed))}): "
+                          f"o problema foi lido como a sua relaxação linear.", UserWarning, stacklevel=3)
+
+        constraint_matrix = FormatUtils.coo_to_dense(rows, columns, values, (len(symbols), len(variable_ids)))
+        return {
+            "lp_variables": list(variable_ids),
+            "constraint_matrix": constraint_matrix,
+            "is_maximization": is_maximization,
+            "objective_function": np.array(objective, dtype=np.float64),
+            "restrictions_vector": np.array(restrictions, dtype=np.float64),
+            "symbols": symbols,
+        }
+
+    def __relax(self, kind: str, name: str) -> str:
+        if not self.relax_integrality:
+            raise ValueError(f"Variáveis inteiras não são suportadas ({kind} em {name}); "
+                             f"use relax_integrality=True para resolver a relaxação linear.")
+        return kind
+
+    @staticmethod
+    def __pairs(fields: list[str]):
+        if len(fields) % 2 == 1:
+            fields = fields[1:]
+        return zip(fields[0::2], fields[1::2])
+
+    @staticmethod
+    def __read_bound(fields: list[str]) -> (str, str, float):
+        bound_type = fields[0].upper()
+        if bound_type in ("FR", "MI", "PL", "BV"):
+            return bound_type, fields[1] if len(fields) == 2 else fields[2], 0.0
+        if len(fields) == 3:
+            return bound_type, fields[1], float(fields[2])
+        return bound_type, fields[2], float(fields[3])
+
+    @staticmethod
+    def __add_range_row(row: int, range_value: float, symbols: list, restrictions: list) -> None:
+        rhs = restrictions[row]
+        if symbols[row] == "<=":
+            new_symbol, new_rhs = ">=", rhs - abs(range_value)
+        elif symbols[row] == ">=":
+            new_symbol, new_rhs = "<=", rhs + abs(range_value)
+        elif range_value >= 0:
+            symbols[row], new_symbol, new_rhs = ">=", "<=", rhs + range_value
+        else:
+            symbols[row], new_symbol, new_rhs = "<=", ">=", rhs + range_value
+        symbols.append(new_symbol)
+        restrictions.append(new_rhs)
+
+    @staticmethod
+    def __add_bound_row(variable: str, bound_type: str, value: float, symbols: list, restrictions: list) -> bool:
+        if bound_type in ("FR", "MI") or bound_type in ("LO", "LI") and value < 0:
+            raise ValueError(f"O limite {bound_type} de {variable} não é suportado: todas as variáveis são >= 0.")
+        if bound_type in ("UP", "UI"):
+            symbol = "<="
+        elif bound_type in ("LO", "LI"):
+            if value == 0:
+                return False
+            symbol = ">="
+        elif bound_type == "FX":
+            symbol = "="
+        elif bound_type == "BV":
+            symbol, value = "<=", 1.0
+        elif bound_type == "PL":
+            return False
+        else:
+            raise ValueError(f"Tipo de limite MPS desconhecido: {bound_type}")
+        symbols.append(symbol)
+        restrictions.append(value)
+        return True
+
+
+class MpsWriter:
+    ROW_TYPES = {"<=": "L", ">=": "G", "=": "E"}
+
+    @staticmethod
+    def write(filename: str, data: dict, name: str = "PROBLEM") -> None:
+        # Os campos são separados por espaços (como o `MpsParser` os lê), então nomes com espaços não são aceitos.
+        for identifier in [name] + list(data["lp_variables"]):
+            if identifier == "" or any(character.isspace() for character in str(identifier)):
+                raise ValueError(f"Nome inválido para o formato MPS (vazio ou com espaços): {identifier!r}")
+        constraint_matrix = data["constraint_matrix"]
+        row_names = [f"R{i + 1}" for i in range(len(data["symbols"]))]
+
+        with open(filename, "w") as file:
+            file.write(f"NAME          {name}\n")
+            file.write("OBJSENSE\n    " + ("MAX" if data["is_maximization"] else "MIN") + "\n")
+            file.write("ROWS\n N  COST\n")
+            for row_name, symbol in zip(row_names, data["symbols"]):
+                file.write(f" {MpsWriter.ROW_TYPES[symbol]}  {row_name}\n")
+
+            file.write("COLUMNS\n")
+            for column, variable in enumerate(data["lp_variables"]):
+                cost = data["objective_function"][column]
+                nonzero_rows = np.nonzero(constraint_matrix[:, column])[0]
+                # Uma coluna toda nula ainda precisa de uma linha, senão a variável some ao ler o arquivo de volta.
+                if cost != 0 or nonzero_rows.size == 0:
+                    file.write(MpsWriter.__field_line(variable, "COST", cost))
+                for row in nonzero_rows:
+                    file.write(MpsWriter.__field_line(variable, row_names[row], constraint_matrix[row, column]))
+
+            file.write("RHS\n")
+            for row_name, value in zip(row_names, data["restrictions_vector"]):
+                if value != 0:
+                    file.write(MpsWriter.__field_line("RHS", row_name, value))
+            file.write("ENDATA\n")
+
+    @staticmethod
+    def __field_line(first: str, second: str, value: float) -> str:
+        return f"    {first:<8}  {second:<8}  {float(value)!r:>12}\n"
@@ -0,0 +1,140 @@
+##
+# @file OutOfCore.py
+# @brief Matriz de restrições fora da memória, lida coluna a coluna de um arquivo mapeado.
+# @details As colunas originais ficam em um `.npy` em ordem de coluna (Fortran), de forma que cada coluna é
+# contígua no disco. As colunas de folga e artificiais acrescentadas pela padronização são vetores unitários
+# e por isso são guardadas apenas como (linha, valor). O pricing percorre as colunas nos blocos do
+# `BlockPricer`, então apenas a matriz básica, o bloco atual e um conjunto de trabalho limitado com as últimas
+# colunas lidas individualmente (as candidatas que entraram na base) ficam residentes.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+from collections import OrderedDict
+
+import numpy as np
+
+
+class OutOfCoreMatrix:
+    ##
+    # @class OutOfCoreMatrix
+    # @brief Substituto da matriz densa de restrições para modelos maiores que a memória.
+    # @details Suporta o acesso `matriz[:, colunas]` usado pelo solver e contabiliza a leitura feita no arquivo.
+    # As colunas pedidas uma a uma (a que entra na base é lida no FTRAN e de novo na troca de base) ficam em um
+    # conjunto de trabalho LRU de até `working_set_size` colunas, servidas sem nova leitura no arquivo.
+    # Não suporta a escrita passo a passo em LaTeX, que precisaria materializar a matriz inteira.
+
+    def __init__(self, filename: str, working_set_size: int = 64) -> None:
+        if working_set_size < 0:
+            raise ValueError("O conjunto de trabalho não pode ter tamanho negativo.")
+        self.filename = filename
+        self.working_set_size = working_set_size
+        self.working_set = OrderedDict()
+        self.columns = np.load(filename, mmap_mode="r")
+        if not self.columns.flags.f_contiguous:
+            raise ValueError("A matriz fora da memória precisa estar armazenada em ordem de coluna.")
+        self.unit_columns = []
+        self.source = None
+        self.bytes_read = 0
+        self.column_reads = 0
+        self.requests = 0
+        self.working_set_hits = 0
+
+    @staticmethod
+    def create(filename: str, matrix: np.ndarray, chunk_columns: int = 1024) -> "OutOfCoreMatrix":
+        ##
+        # @brief Grava uma matriz (densa ou mapeada) em ordem de coluna, bloco a bloco.
+
+        stored = np.lib.format.open_memmap(filename, mode="w+", dtype=np.float64, shape=matrix.shape, fortran_order=True)
+        for start in range(0, matrix.shape[1], chunk_columns):
+            stored[:, start:start + chunk_columns] = matrix[:, start:start + chunk_columns]
+        stored.flush()
+        del stored
+        return OutOfCoreMatrix(filename)
+
+    @staticmethod
+    def from_coo(filename: str, rows: np.ndarray, columns: np.ndarray, values: np.ndarray, shape: tuple,
+                 chunk_columns: int = 1024) -> "OutOfCoreMatrix":
+        ##
+        # @brief Grava uma matriz fornecida em triplas COO sem materializá-la densa na memória.
+
+        stored = np.lib.format.open_memmap(filename, mode="w+", dtype=np.float64, shape=shape, fortran_order=True)
+        order = np.argsort(columns, kind="stable")
+        rows, columns, values = rows[order], columns[order], values[order]
+        for start in range(0, shape[1], chunk_columns):
+            stop = min(start + chunk_columns, shape[1])
+            begin, end = np.searchsorted(columns, [start, stop])
+            block = np.zeros((shape[0], stop - start))
+            np.add.at(block, (rows[begin:end], columns[begin:end] - start), values[begin:end])
+            stored[:, start:stop] = block
+        stored.flush()
+        del stored
+        return OutOfCoreMatrix(filename)
+
+    @property
+    def shape(self) -> tuple:
+        return self.columns.shape[0], self.columns.shape[1] + len(self.unit_columns)
+
+    @property
+    def ndim(self) -> int:
+        return 2
+
+    def copy(self) -> "OutOfCoreMatrix":
+        ##
+        # @brief Nova visão do mesmo arquivo, sem as colunas unitárias.
+        # @details Os contadores da cópia começam zerados, mas cada leitura feita por ela também é somada nos
+        # contadores desta matriz, de forma que quem passou a matriz ao solver continua vendo todo o I/O.
+
+        matrix = OutOfCoreMatrix(self.filename, self.working_set_size)
+        matrix.source = self
+        return matrix
+
+    def append_unit_column(self, row: int, value: float) -> None:
+        self.unit_columns.append((row, value))
+
+    def __getitem__(self, key) -> np.ndarray:
+        rows, indexes = key
+        if rows != slice(None):
+            raise IndexError("Apenas o acesso por colunas (matriz[:, colunas]) é suportado.")
+        if np.isscalar(indexes):
+            return self.__read_working_set_column(int(indexes)).copy()
+        if isinstance(indexes, slice):
+            return self.__read_columns(np.arange(self.shape[1])[indexes])
+        return self.__read_columns(np.asarray(indexes, dtype=np.intp))
+
+    def __read_working_set_column(self, index: int) -> np.ndarray:
+        column = self.working_set.get(index)
+        if column is not None:
+            self.working_set.move_to_end(index)
+            matrix = self
+            while matrix is not None:
+                matrix.working_set_hits += 1
+                matrix = matrix.source
+            return column
+        column = self.__read_columns(np.array([index], dtype=np.intp))[:, 0]
+        if self.working_set_size > 0:
+            self.working_set[index] = column
+            if len(self.working_set) > self.working_set_size:
+                self.working_set.popitem(last=False)
+        return column
+
+    def __read_columns(self, indexes: np.ndarray) -> np.ndarray:
+        original_count = self.columns.shape[1]
+        result = np.zeros((self.columns.shape[0], len(indexes)), dtype=np.float64)
+        stored = indexes < original_count
+        if np.any(stored):
+            result[:, stored] = self.columns[:, indexes[stored]]
+            column_reads = int(np.count_nonzero(stored))
+            matrix = self
+            while matrix is not None:
+                matrix.bytes_read += column_reads * self.columns.shape[0] * self.columns.itemsize
+                matrix.column_reads += column_reads
+                matrix.requests += 1
+                matrix = matrix.source
+        for position in np.nonzero(~stored)[0]:
+            row, value = self.unit_columns[indexes[position] - original_count]
+            result[row, position] = value
+        return result
+
+    def get_io_statistics(self) -> dict:
+        return {"bytes_read": self.bytes_read, "column_reads": self.column_reads, "requests": self.requests,
+                "working_set_hits": self.working_set_hits, "stored_bytes": self.columns.nbytes}
@@ -1,6 +1,9 @@
 import os
+from array import array
+
 import numpy as np
-from Utils import FormatUtils
+from MpsParser import MpsParser
+from Utils import FileUtils, FormatUtils
 
 class FileParser:
     DEFAULT_RESTRICTIONS = [">=", "<=", "="]
@@ -8,27 +11,71 @@ class FileParser:
     def __init__(self, filename: str):
         self.filename = filename
 
+    @staticmethod
+    def for_file(filename: str):
+        if FileUtils.is_mps_file(filename):
+            return MpsParser(filename)
+        return FileParser(filename)
+
     def parse_file(self):
-        lp_problem = self._read_problem()
-        lp_problem = FormatUtils.format_file(lp_problem)
-        lp_variables = self.__get_lp_variables(lp_problem[:-1])
-        constraint_matrix = self.__setup_constraint_matrix(lp_problem[1:-1], lp_variables)
-        is_maximization = self.__check_maximization(lp_problem[0])
-        objective_expression = " ".join(lp_problem[0].split(" ")[1:])
-        objective_function = FormatUtils.string_to_array(objective_expression, lp_variables)
-        restrictions_vector = self._get_restrictions(lp_problem[1:-1])
-        restriction_simbols = self._get_restrictions_symbols(lp_problem[1:-1])
+        self._check_file()
+        with open(self.filename, "r") as file:
+            return self.parse_lines(file)
+
+    def parse_content(self, content: str):
+        return self.parse_lines(content.splitlines())
+
+    def parse_lines(self, lines):
+        seen_lines = set()
+        variable_ids = {}
+        rows, columns, values = array("q"), array("q"), array("d")
+        restrictions, symbols = array("d"), []
+        objective_line = None
+        pending_line = None
+
+        for line in lines:
+            line = FormatUtils.clean_line(line)
+            if line == "" or line in seen_lines:
+                continue
+            seen_lines.add(line)
+            if objective_line is None:
+                objective_line = line
+                continue
+            if pending_line is not None:
+                self.__parse_constraint(pending_line, variable_ids, rows, columns, values, restrictions, symbols)
+            pending_line = line
+
+        if objective_line is None:
+            raise ValueError("O arquivo não contém um problema de otimização linear.")
+        is_maximization = self.__check_maximization(objective_line)
+        objective_terms = list(FormatUtils.tokenize_expression(" ".join(objective_line.split(" ")[1:])))
+        for _, variable in objective_terms:
+            variable_ids.setdefault(variable, len(variable_ids))
+
+        lp_variables = sorted(variable_ids)
+        sorted_position = np.empty(len(variable_ids), dtype=np.int64)
+        for position, variable in enumerate(lp_variables):
+            sorted_position[variable_ids[variable]] = position
+
+        objective_function = np.zeros(len(lp_variables), dtype=np.float64)
+        for coefficient, variable in objective_terms:
+            objective_function[sorted_position[variable_ids[variable]]] += coefficient
+
+        constraint_matrix = FormatUtils.coo_to_dense(np.frombuffer(rows, dtype=np.int64),
+                                                     sorted_position[np.frombuffer(columns, dtype=np.int64)],
+                                                     np.frombuffer(values, dtype=np.float64),
+                                                     (len(symbols), len(lp_variables)))
 
         return {
             "lp_variables": lp_variables,
             "constraint_matrix": constraint_matrix,
             "is_maximization": is_maximization,
             "objective_function": objective_function,
-            "restrictions_vector": restrictions_vector,
-            "symbols": restriction_simbols,
+            "restrictions_vector": np.array(restrictions, dtype=np.float64),
+            "symbols": symbols,
         }
 
-    def _read_problem(self):
+    def _check_file(self):
         directory = os.path.dirname(self.filename)
         if not os.path.exists(directory):
             error_message = f"File {directory} does not exist"
@@ -37,50 +84,28 @@ class FileParser:
         if not os.path.exists(self.filename):
             raise FileNotFoundError
 
-        with open(self.filename, "r") as file:
-            return file.read()
-
-    def _get_restrictions_symbols(self, lp_problem: list) -> list:
-        symbols = []
-        for expression in lp_problem:
-            symbol = self._identify_restrictions(expression)
-            if symbol != "":
-                symbols.append(symbol)
-
-        return symbols
-
-    def _get_restrictions(self, constraints: list) -> np.ndarray:
-        np_array = np.empty(len(constraints))
-        for i in range(len(constraints)):
-            symbol = self._identify_restrictions(constraints[i])
-            if len(symbol) < 2 and not symbol == "=":
-                continue
-            else:
-                np_array[i] = constraints[i].split(symbol)[1]
-        return np_array.astype(np.float64)
-
     def _identify_restrictions(self, expression: str) -> str:
         for symbol in self.DEFAULT_RESTRICTIONS:
             if symbol in expression:
                 return symbol
         return ""
 
-    @staticmethod
-    def __setup_constraint_matrix(constraints: list, variables: list) -> np.ndarray:
-        constraint_matrix = np.zeros((len(constraints), len(variables)), dtype=np.float64)
-        for i in range(len(constraints)):
-            constraint_matrix[i] = FormatUtils.string_to_array(constraints[i], variables)
-        return constraint_matrix
+    def __parse_constraint(self, line: str, variable_ids: dict, rows: array, columns: array, values: array,
+                           restrictions: array, symbols: list) -> None:
+        symbol = self._identify_restrictions(line)
+        if symbol == "":
+            for _, variable in FormatUtils.tokenize_expression(line):
+                variable_ids.setdefault(variable, len(variable_ids))
+            return
 
-    @staticmethod
-    def __get_lp_variables(lp_problem: list) -> list:
-        global_vars = []
-        for line in lp_problem:
-            local_variables = FormatUtils.get_variables_vector(line)
-            for variable in local_variables:
-                if variable not in global_vars:
-                    global_vars.append(variable)
-        return sorted(global_vars)
+        left_side, right_side = line.split(symbol, 1)
+        row = len(symbols)
+        for coefficient, variable in FormatUtils.tokenize_expression(left_side):
+            rows.append(row)
+            columns.append(variable_ids.setdefault(variable, len(variable_ids)))
+            values.append(coefficient)
+        restrictions.append(float(right_side))
+        symbols.append(symbol)
 
     @staticmethod
     def __check_maximization(objective_function: str) -> bool:
@@ -0,0 +1,92 @@
+##
+# @file ProblemCache.py
+# @brief Cache compilado dos problemas lidos de arquivos de texto ou MPS.
+# @details Na primeira leitura, o resultado do parser é gravado em um diretório identificado pelo hash do
+# conteúdo do arquivo, com um `.npy` por vetor e um `meta.json` para nomes, símbolos e sentido do problema.
+# Nas leituras seguintes os vetores são abertos com `np.load(mmap_mode="r")`, sem nenhuma análise do texto.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+import Constants
+from Parser import FileParser
+
+
+class ProblemCache:
+    ##
+    # @class ProblemCache
+    # @brief Armazena e recupera problemas já analisados, indexados pelo hash do arquivo de origem.
+    # @details Um arquivo alterado produz um hash novo, então entradas antigas nunca são reutilizadas por engano.
+    # As entradas são gravadas em um diretório temporário e renomeadas ao final, de forma que um processo
+    # interrompido nunca deixa uma entrada incompleta visível.
+
+    FORMAT_VERSION = 1
+    ARRAY_KEYS = ["constraint_matrix", "objective_function", "restrictions_vector"]
+    META_KEYS = ["lp_variables", "symbols", "is_maximization"]
+    READ_CHUNK = 1 << 20
+
+    def __init__(self, directory: str = Constants.DATA_CACHE) -> None:
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    def get_key(self, filename: str) -> str:
+        ##
+        # @brief Calcula a chave de um arquivo de problema.
+        # @return Hash SHA-256 do conteúdo do arquivo combinado com o parser e a versão do formato.
+
+        digest = hashlib.sha256(f"{self.FORMAT_VERSION}:{type(FileParser.for_file(filename)).__name__}:".encode())
+        with open(filename, "rb") as file:
+            for chunk in iter(lambda: file.read(self.READ_CHUNK), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def parse_file(self, filename: str) -> dict:
+        ##
+        # @brief Devolve os dados do problema, usando o cache sempre que o arquivo não tiver mudado.
+        # @param filename Caminho do arquivo de texto ou MPS.
+        # @return Dicionário no formato do `FileParser`, com vetores mapeados em memória em caso de acerto.
+
+        key = self.get_key(filename)
+        data = self.load(key)
+        if data is not None:
+            self.hits += 1
+            return data
+
+        self.misses += 1
+        data = FileParser.for_file(filename).parse_file()
+        self.store(key, data)
+        return data
+
+    def load(self, key: str):
+        entry = os.path.join(self.directory, key)
+        if not os.path.isdir(entry):
+            return None
+        with open(os.path.join(entry, "meta.json"), "r", encoding="utf-8") as file:
+            data = json.load(file)
+        for array_key in self.ARRAY_KEYS:
+            data[array_key] = np.load(os.path.join(entry, f"{array_key}.npy"), mmap_mode="r")
+        return data
+
+    def store(self, key: str, data: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        entry = os.path.join(self.directory, key)
+        temporary = tempfile.mkdtemp(prefix=f".{key}.", dir=self.directory)
+        try:
+            for array_key in self.ARRAY_KEYS:
+                np.save(os.path.join(temporary, f"{array_key}.npy"), np.ascontiguousarray(data[array_key]))
+            with open(os.path.join(temporary, "meta.json"), "w", encoding="utf-8") as file:
+                json.dump({meta_key: data[meta_key] for meta_key in self.META_KEYS}, file)
+            os.replace(temporary, entry)
+        except OSError:
+            if not os.path.isdir(entry):
+                raise
+        finally:
+            shutil.rmtree(temporary, ignore_errors=True)
@@ -0,0 +1,144 @@
+##
+# @file RenderPolicy.py
+# @brief Limites de tamanho para o documento LaTeX passo a passo.
+# @details Acima dos limites de linhas e colunas, matrizes e vetores são abreviados (primeiras e últimas
+# linhas/colunas com reticências) ou listados apenas pelos elementos não nulos, e somente algumas iterações
+# são detalhadas; as demais viram um resumo com a variável que entra, a que sai e a coluna do pivô.
+# Assim, o tamanho do documento e o tempo de escrita não crescem com o tamanho do problema.
+# A abreviação é opcional: a política padrão escreve tudo, e `RenderPolicy.compact()` traz limites prontos.
+# Ela é escolhida por quem gera o documento: `RevisedSimplex`, `IncrementalBatchBuilder`, `render_fragment` e
+# os escritores recebem `render_policy`, e a linha de comando tem `--compact`, `--max-rows`, `--max-columns` e
+# `--detail-every`.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import numpy as np
+
+from Utils import LatexUtils
+
+
+class RenderPolicy:
+    ##
+    # @class RenderPolicy
+    # @brief Decide como cada matriz e cada iteração são escritas no LaTeX.
+    # @details
+    # - `max_rows`, `max_columns`: acima destes tamanhos a matriz é abreviada,
+    # - `edge`: número de linhas/colunas exibidas em cada extremidade de uma matriz abreviada,
+    # - `sparse_density`: matrizes abreviadas com densidade até este valor são listadas pelos não nulos,
+    # - `max_sparse_entries`: número máximo de não nulos listados,
+    # - `full_iterations`: as primeiras iterações detalhadas por completo,
+    # - `every_iterations`: depois delas, detalha uma a cada k iterações (`None` para nenhuma).
+    # Qualquer limite `None` desativa a abreviação correspondente; sem argumentos, nada é abreviado.
+    # A última iteração de cada fase é sempre detalhada pelo solver.
+
+    COMPACT_LIMITS = {"max_rows": 16, "max_columns": 16, "full_iterations": 10, "every_iterations": 10}
+
+    def __init__(self, max_rows: int = None, max_columns: int = None, edge: int = 3, sparse_density: float = 0.1,
+                 max_sparse_entries: int = 24, full_iterations: int = None, every_iterations: int = None) -> None:
+        self.max_rows = max_rows
+        self.max_columns = max_columns
+        self.edge = edge
+        self.sparse_density = sparse_density
+        self.max_sparse_entries = max_sparse_entries
+        self.full_iterations = full_iterations
+        self.every_iterations = every_iterations
+
+    @staticmethod
+    def unlimited() -> "RenderPolicy":
+        return RenderPolicy()
+
+    @staticmethod
+    def compact(**overrides) -> "RenderPolicy":
+        ##
+        # @brief Política com os limites de `COMPACT_LIMITS`, indicada para problemas grandes.
+        # @param overrides Argumentos do construtor que substituem os limites padrão.
+
+        return RenderPolicy(**dict(RenderPolicy.COMPACT_LIMITS, **overrides))
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+    def should_render_iteration(self, iteration: int) -> bool:
+        if self.full_iterations is None or iteration <= self.full_iterations:
+            return True
+        return self.every_iterations is not None and iteration % self.every_iterations == 0
+
+    def is_large(self, matrix: np.ndarray) -> bool:
+        matrix = np.asarray(matrix)
+        rows, columns = (1, matrix.shape[0]) if matrix.ndim == 1 else matrix.shape[:2]
+        return self.__exceeds(rows, self.max_rows) or self.__exceeds(columns, self.max_columns)
+
+    def select(self, size: int, limit: int) -> (np.ndarray, int):
+        ##
+        # @brief Índices exibidos de uma dimensão e a posição das reticências (-1 se nada for omitido).
+
+        if not self.__exceeds(size, limit):
+            return np.arange(size), -1
+        edge = min(self.edge, size // 2)
+        return np.concatenate((np.arange(edge), np.arange(size - edge, size))), edge
+
+    def elide_list(self, items: list, limit: int = None, ellipsis: str = r"\ldots") -> list:
+        indexes, gap = self.select(len(items), self.max_columns if limit is None else limit)
+        selected = [items[i] for i in indexes]
+        if gap >= 0:
+            selected.insert(gap, ellipsis)
+        return selected
+
+    def format_numbers_vector(self, vector: np.ndarray) -> str:
+        vector = np.asarray(vector).ravel()
+        indexes, gap = self.select(vector.size, self.max_columns)
+        formatted = LatexUtils.format_values(vector[indexes]).tolist()
+        if gap >= 0:
+            formatted.insert(gap, r"\ldots")
+        return r"\{" + ", ".join(formatted) + r"\}"
+
+    def format_string_vector(self, vector: list[str]) -> str:
+        return LatexUtils.format_string_vector(self.elide_list(list(vector)))
+
+    def format_matrix(self, matrix: np.ndarray) -> str:
+        ##
+        # @brief Escreve uma matriz grande como `bmatrix` abreviada ou como lista de não nulos.
+        # @return O LaTeX da matriz, sem quebra de linha final.
+
+        matrix = np.asarray(matrix)
+        shape = r"_{" + r" \times ".join(str(size) for size in matrix.shape) + "}"
+        if self.sparse_density is not None and matrix.size > 0 \
+                and np.count_nonzero(matrix) <= self.sparse_density * matrix.size:
+            return self.__format_sparse(matrix) + shape
+
+        if matrix.ndim == 1:
+            return r"\begin{bmatrix}" + " & ".join(self.get_elided_cells(matrix[np.newaxis, :])[0]) + r"\end{bmatrix}" + shape
+        rows = [" & ".join(row) for row in self.get_elided_cells(matrix)]
+        return r"\begin{bmatrix}" + r"\\ ".join(rows) + r"\end{bmatrix}" + shape
+
+    def get_elided_cells(self, matrix: np.ndarray) -> list[list[str]]:
+        ##
+        # @brief Células formatadas de uma matriz 2D, com `\cdots`, `\vdots` e `\ddots` no lugar do que foi omitido.
+        # @details Só o bloco exibido é formatado, então o custo não depende do tamanho da matriz.
+
+        row_indexes, row_gap = self.select(matrix.shape[0], self.max_rows)
+        column_indexes, column_gap = self.select(matrix.shape[1], self.max_columns)
+        cells = LatexUtils.format_values(matrix[np.ix_(row_indexes, column_indexes)]).tolist()
+        if column_gap >= 0:
+            for row in cells:
+                row.insert(column_gap, r"\cdots")
+        if row_gap >= 0:
+            gap_row = [r"\vdots"] * len(cells[0])
+            if column_gap >= 0:
+                gap_row[column_gap] = r"\ddots"
+            cells.insert(row_gap, gap_row)
+        return cells
+
+    def __format_sparse(self, matrix: np.ndarray) -> str:
+        positions = np.argwhere(matrix)
+        shown = positions[:self.max_sparse_entries]
+        values = LatexUtils.format_values(matrix[tuple(shown.T)]) if len(shown) else []
+        entries = [f"({','.join(str(index + 1) for index in position)}){{:}}\\ {value}"
+                   for position, value in zip(shown, values)]
+        if len(positions) > len(shown):
+            entries.append(r"\ldots")
+        return r"\left\{" + ", ".join(entries) + r"\right\}" + rf"^{{\mathrm{{nnz}}={len(positions)}}}"
+
+    @staticmethod
+    def __exceeds(size: int, limit: int) -> bool:
+        return limit is not None and size > limit
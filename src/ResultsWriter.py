@@ -0,0 +1,105 @@
+##
+# @file ResultsWriter.py
+# @brief Saída legível por máquina dos resultados de execuções em lote.
+# @details Cada problema resolvido vira um registro compacto (arquivo, status, valor objetivo, valores, base,
+# iterações e tempos), gravado em JSONL ou CSV por um arquivo com buffer, à medida que as resoluções terminam.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import csv
+import json
+import sys
+import time
+
+
+class ResultsWriter:
+    ##
+    # @class ResultsWriter
+    # @brief Grava um registro por problema em `.jsonl` ou `.csv`.
+    # @details O formato é escolhido pela extensão do arquivo, se não for informado. No CSV, os campos
+    # `values`, `basis` e `timings` são gravados como JSON dentro da célula, e a coluna `error` só é preenchida nos
+    # registros de `get_error_record` (ficando vazia nos demais). Com `flush_interval`, o buffer
+    # é descarregado no disco sempre que esse número de segundos tiver passado desde a última descarga.
+    # O nome `-` grava na saída padrão.
+
+    FORMATS = ["jsonl", "csv"]
+    FIELDS = ["file", "status", "objective", "values", "basis", "iterations", "timings", "error"]
+
+    def __init__(self, filename: str, file_format: str = None, flush_interval: float = None,
+                 buffer_size: int = 1 << 16) -> None:
+        if file_format is None:
+            file_format = "csv" if filename.lower().endswith(".csv") else "jsonl"
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Formato de resultados desconhecido: {file_format}. Opções: {', '.join(self.FORMATS)}")
+        self.filename = filename
+        self.file_format = file_format
+        self.flush_interval = flush_interval
+        if filename == "-":
+            self.file = sys.stdout
+        else:
+            self.file = open(filename, "w", encoding="utf-8", newline="", buffering=buffer_size)
+        self.last_flush = time.monotonic()
+        self.records = 0
+        if file_format == "csv":
+            self.csv_writer = csv.writer(self.file)
+            self.csv_writer.writerow(self.FIELDS)
+
+    def write(self, record: dict) -> None:
+        ##
+        # @brief Grava um registro já montado (com as chaves de `FIELDS`).
+
+        if self.file_format == "jsonl":
+            self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        else:
+            self.csv_writer.writerow([json.dumps(record.get(field), separators=(",", ":"))
+                                      if field in ("values", "basis", "timings") else record.get(field)
+                                      for field in self.FIELDS])
+        self.records += 1
+        if self.flush_interval is not None and time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def write_solver(self, filename: str, solver, timings: dict = None) -> None:
+        ##
+        # @brief Monta e grava o registro de um `RevisedSimplex` já resolvido.
+        # @param filename Nome do arquivo de entrada do problema.
+        # @param solver Solver após `solve()`.
+        # @param timings Tempos medidos em segundos (ex.: `{"parse": ..., "solve": ...}`).
+
+        self.write(ResultsWriter.get_record(filename, solver, timings))
+
+    @staticmethod
+    def get_record(filename: str, solver, timings: dict = None) -> dict:
+        solved = solver.status in ("optimal", "degenerate")
+        return {
+            "file": filename,
+            "status": solver.status,
+            "objective": float(solver.get_objective_value()) if solved else None,
+            "values": {name: float(value) for name, value in solver.get_solution().items()},
+            "basis": list(getattr(solver, "basis", [])),
+            "iterations": int(solver.current_interaction),
+            "timings": dict(timings or {}),
+        }
+
+    @staticmethod
+    def get_error_record(filename: str, error: Exception) -> dict:
+        ##
+        # @brief Registro de um arquivo que não pôde ser resolvido, com status `error` e a mensagem do erro.
+
+        return {"file": filename, "status": "error", "objective": None, "values": {}, "basis": [],
+                "iterations": 0, "timings": {}, "error": str(error)}
+
+    def flush(self) -> None:
+        self.file.flush()
+        self.last_flush = time.monotonic()
+
+    def close(self) -> None:
+        if self.file is sys.stdout:
+            self.file.flush()
+        elif not self.file.closed:
+            self.file.close()
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,316 @@
+##
+# @file Server.py
+# @brief Serviço local de resolução: recebe problemas por HTTP e resolve em um pool de processos.
+# @details
+# O processo do servidor mantém um pool fixo de processos trabalhadores que importam o NumPy e o solver
+# uma única vez. As requisições entram em uma fila limitada (respostas 503 quando cheia), cada uma com
+# seu prazo (respostas 504 quando excedido) e podem ser canceladas pelo identificador.
+# O prazo e o cancelamento também valem para uma resolução em andamento: o trabalhador os verifica entre
+# os pivôs (`RevisedSimplex.iterate()`) e abandona a resolução, liberando o processo para a próxima.
+# Problemas inválidos recebem 400; falhas do pool, 503; erros internos, 500.
+#
+# Rotas:
+# - `POST /solve`: corpo JSON com `problem` (texto no formato do `FileParser`) ou com os vetores
+#   `objective`, `constraint_matrix`, `is_maximization`, `restrictions` e `symbols` (como no
+#   `RevisedSimplexWithoutFile`). Campos opcionais: `id`, `timeout`, `language` e `options`.
+# - `DELETE /solve/<id>`: cancela uma requisição em andamento.
+# - `GET /health` e `GET /metrics`.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import argparse
+import asyncio
+import io
+import itertools
+import json
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+_cancel_flags = None
+
+
+def _initialize_worker(cancel_flags=None) -> None:
+    ##
+    # @brief Pré-carrega os módulos pesados em cada processo do pool.
+    # @param cancel_flags Vetor compartilhado com uma posição por despachante, marcada para interromper a
+    # resolução em andamento nessa posição.
+
+    global _cancel_flags
+    _cancel_flags = cancel_flags
+
+    import numpy  # noqa: F401
+    import Solver  # noqa: F401
+
+
+def _solve_job(request: dict, slot: int = None, time_budget: float = None) -> dict:
+    ##
+    # @brief Resolve uma requisição dentro de um processo trabalhador.
+    # @param request Corpo JSON já decodificado da requisição.
+    # @param slot Posição do despachante em `_cancel_flags`, verificada entre os pivôs.
+    # @param time_budget Segundos restantes até o prazo da requisição.
+    # @return Dicionário serializável com o resultado, ou `None` se a resolução foi interrompida.
+
+    import numpy as np
+    from Context import SolveContext
+    from Parser import FileParser
+    from Solver import RevisedSimplex, RevisedSimplexWithoutFile, SolverOptions
+
+    options = SolverOptions(**request.get("options", {}))
+    with SolveContext(language=request.get("language"), output=io.StringIO()):
+        if "problem" in request:
+            solver = RevisedSimplex(data=FileParser("").parse_content(request["problem"]), options=options, quiet=True)
+        else:
+            solver = RevisedSimplexWithoutFile(np.array(request["objective"], dtype=np.float64),
+                                               np.array(request["constraint_matrix"], dtype=np.float64),
+                                               bool(request["is_maximization"]),
+                                               np.array(request["restrictions"], dtype=np.float64),
+                                               request.get("symbols"), options, quiet=True)
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        start = time.perf_counter()
+        for _ in solver.iterate():
+            if (deadline is not None and time.monotonic() > deadline) \
+                    or (slot is not None and _cancel_flags is not None and _cancel_flags[slot]):
+                return None
+        result = solver.get_result({"solve": time.perf_counter() - start})
+
+    return {
+        "status": result.status.value,
+        "solution": result.get_solution(),
+        "basis": result.get_basis_names(),
+        "iterations": result.iterations,
+    }
+
+
+class SolveJob:
+    def __init__(self, job_id: str, payload: dict, future: asyncio.Future, deadline: float) -> None:
+        self.job_id = job_id
+        self.payload = payload
+        self.future = future
+        self.deadline = deadline
+        self.cancelled = False
+        self.slot = None
+
+
+class SolveServer:
+    ##
+    # @class SolveServer
+    # @brief Front-end asyncio com fila limitada na frente de um `ProcessPoolExecutor`.
+    # @details Existe um despachante por processo do pool, então no máximo `workers` problemas estão em
+    # resolução e até `queue_size` aguardam na fila. Requisições canceladas ou expiradas que ainda estão na
+    # fila nunca chegam ao pool; as que já estão em resolução são interrompidas no próximo pivô.
+    # Um `id` informado pelo cliente só pode ser reutilizado depois que a requisição anterior terminar.
+
+    REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 409: "Conflict", 500: "Internal Server Error",
+               503: "Service Unavailable", 504: "Gateway Timeout"}
+    INVALID_PROBLEM_ERRORS = (ValueError, IndexError, KeyError, TypeError)
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8315, workers: int = 2, queue_size: int = 64,
+                 default_timeout: float = 30.0) -> None:
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.queue_size = queue_size
+        self.default_timeout = default_timeout
+        self.jobs = {}
+        self.ids = itertools.count(1)
+        self.metrics = {"received": 0, "completed": 0, "failed": 0, "rejected": 0, "timed_out": 0, "cancelled": 0}
+        self.running = 0
+        self.queue = None
+        self.cancel_flags = None
+        self.pool = None
+        self.server = None
+        self.dispatchers = []
+
+    async def start(self) -> None:
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.cancel_flags = multiprocessing.RawArray("b", self.workers)
+        self.pool = self.__create_pool()
+        self.dispatchers = [asyncio.create_task(self.__dispatch(slot)) for slot in range(self.workers)]
+        self.server = await asyncio.start_server(self.__handle_connection, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def stop(self) -> None:
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        for dispatcher in self.dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    def get_metrics(self) -> dict:
+        metrics = dict(self.metrics)
+        metrics.update({"queued": self.queue.qsize() if self.queue else 0, "running": self.running,
+                        "workers": self.workers, "queue_size": self.queue_size})
+        return metrics
+
+    def __create_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_initialize_worker,
+                                   initargs=(self.cancel_flags,))
+
+    async def __dispatch(self, slot: int) -> None:
+        ##
+        # @brief Envia as requisições da fila ao pool, uma de cada vez, usando a posição `slot` de `cancel_flags`.
+
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self.queue.get()
+            try:
+                time_budget = job.deadline - loop.time()
+                if job.cancelled or job.future.done() or time_budget <= 0:
+                    continue
+                self.running += 1
+                self.cancel_flags[slot] = 0
+                job.slot = slot
+                pool = self.pool
+                try:
+                    result = await loop.run_in_executor(pool, _solve_job, job.payload, slot, time_budget)
+                    if not job.future.done():
+                        job.future.set_result(result)
+                except Exception as error:
+                    if isinstance(error, BrokenProcessPool) and self.pool is pool:
+                        pool.shutdown(wait=False, cancel_futures=True)
+                        self.pool = self.__create_pool()
+                    if not job.future.done():
+                        job.future.set_exception(error)
+                finally:
+                    job.slot = None
+                    self.running -= 1
+            finally:
+                self.queue.task_done()
+
+    def __interrupt(self, job: SolveJob) -> None:
+        job.cancelled = True
+        if job.slot is not None:
+            self.cancel_flags[job.slot] = 1
+
+    async def __submit(self, payload) -> (int, dict):
+        self.metrics["received"] += 1
+        if not isinstance(payload, dict):
+            return 400, {"error": "invalid_payload"}
+        timeout = payload.get("timeout", self.default_timeout)
+        if isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or not timeout > 0:
+            return 400, {"error": "invalid_timeout"}
+        job_id = str(payload.get("id", next(self.ids)))
+        if job_id in self.jobs:
+            return 409, {"id": job_id, "error": "duplicate_id"}
+
+        loop = asyncio.get_running_loop()
+        job = SolveJob(job_id, payload, loop.create_future(), loop.time() + timeout)
+        try:
+            self.queue.put_nowait(job)
+        except asyncio.QueueFull:
+            self.metrics["rejected"] += 1
+            return 503, {"id": job_id, "error": "queue_full"}
+
+        self.jobs[job_id] = job
+        try:
+            result = await asyncio.wait_for(asyncio.shield(job.future), timeout)
+        except asyncio.TimeoutError:
+            self.__interrupt(job)
+            self.metrics["timed_out"] += 1
+            return 504, {"id": job_id, "error": "deadline_exceeded"}
+        except asyncio.CancelledError:
+            if job.cancelled:
+                return 409, {"id": job_id, "error": "cancelled"}
+            self.__interrupt(job)
+            raise
+        except self.INVALID_PROBLEM_ERRORS as error:
+            self.metrics["failed"] += 1
+            return 400, {"id": job_id, "error": repr(error)}
+        except BrokenProcessPool as error:
+            self.metrics["failed"] += 1
+            return 503, {"id": job_id, "error": "worker_unavailable", "detail": repr(error)}
+        except Exception as error:
+            self.metrics["failed"] += 1
+            return 500, {"id": job_id, "error": "internal_error", "detail": repr(error)}
+        finally:
+            self.jobs.pop(job_id, None)
+
+        if result is None:
+            self.metrics["timed_out"] += 1
+            return 504, {"id": job_id, "error": "deadline_exceeded"}
+
+        self.metrics["completed"] += 1
+        result["id"] = job_id
+        return 200, result
+
+    def __cancel(self, job_id: str) -> (int, dict):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return 404, {"id": job_id, "error": "not_found"}
+        self.__interrupt(job)
+        job.future.cancel()
+        self.metrics["cancelled"] += 1
+        return 200, {"id": job_id, "status": "cancelled"}
+
+    async def __route(self, method: str, path: str, body: bytes) -> (int, dict):
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        if method == "GET" and path == "/metrics":
+            return 200, self.get_metrics()
+        if method == "POST" and path == "/solve":
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "invalid_json"}
+            return await self.__submit(payload)
+        if method == "DELETE" and path.startswith("/solve/"):
+            return self.__cancel(path[len("/solve/"):])
+        return 404, {"error": "not_found"}
+
+    async def __handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            headers = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+            content_length = headers.get("content-length", "0")
+
+            if len(request_line) < 2:
+                status, response = 400, {"error": "bad_request"}
+            elif not content_length.isdigit():
+                status, response = 400, {"error": "invalid_content_length"}
+            else:
+                body = await reader.readexactly(int(content_length))
+                status, response = await self.__route(request_line[0].upper(), request_line[1], body)
+
+            content = json.dumps(response).encode("utf-8")
+            writer.write(f"HTTP/1.1 {status} {self.REASONS.get(status, 'OK')}\r\n"
+                         f"Content-Type: application/json\r\nContent-Length: {len(content)}\r\n"
+                         f"Connection: close\r\n\r\n".encode("latin-1") + content)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serviço local de resolução do Simplex Revisado.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8315)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--queue-size", type=int, default=64)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    arguments = parser.parse_args()
+
+    solve_server = SolveServer(arguments.host, arguments.port, arguments.workers, arguments.queue_size, arguments.timeout)
+    try:
+        asyncio.run(solve_server.serve_forever())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,103 @@
+##
+# @file SharedProblem.py
+# @brief Compartilha os dados de um problema linear entre processos sem cópias.
+# @details Os vetores NumPy do problema (matriz de restrições, custos, restrições ou buffers esparsos)
+# são colocados em um único bloco de `multiprocessing.shared_memory`. Os processos trabalhadores recebem
+# apenas um `SharedProblemHandle` (pequeno e serializável) e anexam o bloco como visões somente leitura.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedProblemHandle:
+    ##
+    # @class SharedProblemHandle
+    # @brief Descritor serializável de um bloco de memória compartilhada.
+    # @details Guarda o nome do bloco, o layout (deslocamento, formato e tipo) de cada vetor
+    # e os dados que não são vetores (nomes das variáveis, símbolos, sentido do problema).
+
+    def __init__(self, block_name: str, layout: dict, metadata: dict) -> None:
+        self.block_name = block_name
+        self.layout = layout
+        self.metadata = metadata
+
+
+class SharedProblem:
+    ##
+    # @class SharedProblem
+    # @brief Bloco de memória compartilhada contendo os dados de um problema linear.
+    # @details Aceita o mesmo dicionário produzido pelo `FileParser`. Qualquer valor do tipo `np.ndarray`
+    # é copiado uma única vez para o bloco; os demais valores viajam dentro do handle.
+    # @note Apenas o processo que criou o bloco deve chamar `unlink`.
+
+    ALIGNMENT = 64
+
+    def __init__(self, block: shared_memory.SharedMemory, handle: SharedProblemHandle, is_owner: bool) -> None:
+        self.block = block
+        self.handle = handle
+        self.is_owner = is_owner
+
+    @staticmethod
+    def create(data: dict) -> "SharedProblem":
+        ##
+        # @brief Cria um bloco compartilhado a partir do dicionário de dados de um problema.
+        # @param data Dicionário no formato do `FileParser` (vetores densos ou buffers esparsos).
+        # @return O `SharedProblem` dono do bloco.
+
+        layout = {}
+        metadata = {}
+        size = 0
+        for key, value in data.items():
+            if isinstance(value, np.ndarray):
+                size = -(-size // SharedProblem.ALIGNMENT) * SharedProblem.ALIGNMENT
+                layout[key] = (size, value.shape, value.dtype.str)
+                size += value.nbytes
+            else:
+                metadata[key] = value
+
+        block = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        for key, (offset, shape, dtype) in layout.items():
+            view = np.ndarray(shape, dtype=dtype, buffer=block.buf, offset=offset)
+            view[...] = data[key]
+
+        handle = SharedProblemHandle(block.name, layout, metadata)
+        return SharedProblem(block, handle, True)
+
+    @staticmethod
+    def attach(handle: SharedProblemHandle) -> "SharedProblem":
+        ##
+        # @brief Anexa um bloco já existente a partir de seu handle.
+        # @param handle Handle obtido do processo que criou o bloco.
+        # @return Um `SharedProblem` que não é dono do bloco.
+
+        block = shared_memory.SharedMemory(name=handle.block_name)
+        return SharedProblem(block, handle, False)
+
+    def get_data(self) -> dict:
+        ##
+        # @brief Reconstrói o dicionário do problema com visões somente leitura sobre o bloco.
+        # @return Dicionário no formato do `FileParser`, sem cópias dos vetores.
+
+        data = dict(self.handle.metadata)
+        for key, (offset, shape, dtype) in self.handle.layout.items():
+            view = np.ndarray(shape, dtype=dtype, buffer=self.block.buf, offset=offset)
+            view.flags.writeable = False
+            data[key] = view
+        return data
+
+    def close(self) -> None:
+        self.block.close()
+
+    def unlink(self) -> None:
+        if self.is_owner:
+            self.block.unlink()
+
+    def __enter__(self) -> "SharedProblem":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.unlink()
+        self.close()
@@ -0,0 +1,162 @@
+##
+# @file SolutionCache.py
+# @brief Cache de soluções já calculadas, indexado por um hash canônico do problema.
+# @details A chave cobre a matriz de restrições, a função objetivo, o lado direito, os símbolos, o sentido,
+# os nomes das variáveis e as `SolverOptions` que alteram o resultado. As entradas ficam em um LRU em memória e,
+# opcionalmente, em um diretório em disco com limite de tamanho (os arquivos menos usados recentemente são
+# removidos primeiro).
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+
+from OutOfCore import OutOfCoreMatrix
+
+
+class SolutionCache:
+    ##
+    # @class SolutionCache
+    # @brief LRU em memória com armazenamento opcional em disco para resultados do `RevisedSimplex`.
+    # @details Um acerto devolve o estado final do solver (status, valores, base, variáveis de folga e
+    # artificiais e pontos de degeneração), que é restaurado sem executar nenhuma iteração.
+
+    FORMAT_VERSION = 1
+    HASH_CHUNK_COLUMNS = 4096
+    # Opções que só mudam como o pricing é executado (threads e tamanho dos blocos), e não a solução.
+    PERFORMANCE_OPTIONS = ("pricing_threads", "pricing_block_size")
+
+    def __init__(self, capacity: int = 256, directory: str = None, max_disk_bytes: int = 64 << 20) -> None:
+        self.capacity = capacity
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.entries = OrderedDict()
+        self.disk_files = None
+        self.disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get_key(self, solver) -> str:
+        ##
+        # @brief Calcula o hash canônico do problema carregado em um solver ainda não resolvido.
+        # @param solver Instância de `RevisedSimplex` antes da padronização.
+        # @return Hash SHA-256 em hexadecimal.
+        # @details As opções de `PERFORMANCE_OPTIONS` ficam de fora, e `-0.0` é normalizado para `0.0` (somando
+        # `0.0`), para que problemas iguais executados de formas diferentes compartilhem a mesma entrada.
+
+        options = {key: value for key, value in solver.options.to_dict().items() if key not in self.PERFORMANCE_OPTIONS}
+        digest = hashlib.sha256(json.dumps({
+            "version": self.FORMAT_VERSION,
+            "variables": list(solver.variables),
+            "symbols": list(solver.restriction_symbols),
+            "is_maximization": bool(solver.isMaximization),
+            "options": options,
+        }, sort_keys=True).encode())
+        for vector in (solver.objective, solver.restrictions):
+            digest.update((np.ascontiguousarray(vector, dtype=np.float64) + 0.0).tobytes())
+
+        matrix = solver.constraint_matrix
+        if isinstance(matrix, OutOfCoreMatrix):
+            matrix = matrix.columns
+        digest.update(str(matrix.shape).encode())
+        for start in range(0, matrix.shape[1], self.HASH_CHUNK_COLUMNS):
+            block = matrix[:, start:start + self.HASH_CHUNK_COLUMNS]
+            digest.update((np.ascontiguousarray(block, dtype=np.float64) + 0.0).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        ##
+        # @brief Procura uma solução, primeiro na memória e depois no disco.
+        # @return O dicionário salvo por `put`, ou `None` se não houver entrada.
+
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        entry = self.__load(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.disk_hits += 1
+        self.__remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        self.__remember(key, entry)
+        if self.directory is not None:
+            self.__store(key, entry)
+
+    def get_statistics(self) -> dict:
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0, "entries": len(self.entries)}
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+    def __remember(self, key: str, entry: dict) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+    def __load(self, key: str):
+        if self.directory is None:
+            return None
+        filename = os.path.join(self.directory, f"{key}.json")
+        try:
+            with open(filename, "r", encoding="utf-8") as file:
+                entry = json.load(file)
+            os.utime(filename)
+        except (OSError, ValueError):
+            return None
+        disk_files = self.__get_disk_files()
+        if key in disk_files:
+            disk_files.move_to_end(key)
+        return entry
+
+    def __store(self, key: str, entry: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        disk_files = self.__get_disk_files()
+        descriptor, temporary = tempfile.mkstemp(prefix=f".{key}.", dir=self.directory)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+            size = file.tell()
+        os.replace(temporary, os.path.join(self.directory, f"{key}.json"))
+        self.disk_bytes += size - disk_files.pop(key, 0)
+        disk_files[key] = size
+        self.__evict_disk()
+
+    def __get_disk_files(self) -> OrderedDict:
+        ##
+        # @brief Tamanho de cada arquivo do diretório, do menos ao mais usado recentemente.
+        # @details O diretório é listado uma única vez, na primeira leitura ou escrita; depois disso o tamanho
+        # total é mantido incrementalmente a cada `put`, sem listar o diretório de novo.
+
+        if self.disk_files is None:
+            files = []
+            if os.path.isdir(self.directory):
+                for name in os.listdir(self.directory):
+                    if name.endswith(".json") and not name.startswith("."):
+                        stat = os.stat(os.path.join(self.directory, name))
+                        files.append((stat.st_mtime, name[:-len(".json")], stat.st_size))
+            self.disk_files = OrderedDict((key, size) for _, key, size in sorted(files))
+            self.disk_bytes = sum(self.disk_files.values())
+        return self.disk_files
+
+    def __evict_disk(self) -> None:
+        while self.disk_bytes > self.max_disk_bytes and self.disk_files:
+            key, size = self.disk_files.popitem(last=False)
+            try:
+                os.remove(os.path.join(self.directory, f"{key}.json"))
+            except FileNotFoundError:
+                pass
+            self.disk_bytes -= size
@@ -10,13 +10,183 @@
 # @date 10/01/2025
 
 
+import time
+from enum import Enum
+from types import MappingProxyType
+
 import numpy as np
 
-from LatexWriter import LatexWriter
+from Checkpoint import Checkpointer
+from Context import SolveContext
+from Exact import FractionFreeBasis, to_fraction_array
+from Instrumentation import SolverInstrumentation
+from LatexWriter import AsyncLatexWriter, LatexWriter
+from OutOfCore import OutOfCoreMatrix
 from Parser import FileParser
+from Pricing import BlockPricer
+from ProblemCache import ProblemCache
+from RenderPolicy import RenderPolicy
+from SharedProblem import SharedProblem, SharedProblemHandle
+from SolutionCache import SolutionCache
+from Trace import IterationTrace
 from Utils import LatexUtils, LanguageUtils
 
 
+class SolverOptions:
+    ##
+    # @class SolverOptions
+    # @brief Configuração de uma execução do `RevisedSimplex`.
+    # @details Agrupa as escolhas que alteram o caminho percorrido pelo algoritmo, permitindo que
+    # diferentes estratégias sejam descritas, comparadas e enviadas para outros processos.
+    # - `pricing`: regra de escolha da variável que entra na base (`"dantzig"` ou `"steepest_edge"`),
+    # - `max_iterations`: número máximo de iterações somadas das duas fases,
+    # - `pricing_threads`: threads usadas no cálculo dos custos reduzidos (1 desativa o paralelismo),
+    # - `pricing_block_size`: colunas por bloco no pricing; a escolha do pivô não depende do número de threads,
+    # - `arithmetic`: `"float"` ou `"exact"`, que resolve com frações exatas sem perder precisão (ver
+    # `FractionFreeBasis`), indicado para problemas pequenos e para o passo a passo; só com a regra de Dantzig.
+
+    PRICING_RULES = ["dantzig", "steepest_edge"]
+    ARITHMETIC_MODES = ["float", "exact"]
+
+    def __init__(self, pricing: str = "dantzig", max_iterations: int = 100, pricing_threads: int = 1,
+                 pricing_block_size: int = 4096, arithmetic: str = "float") -> None:
+        if pricing not in self.PRICING_RULES:
+            raise ValueError(f"Regra de pricing desconhecida: {pricing}. Opções: {', '.join(self.PRICING_RULES)}")
+        if arithmetic not in self.ARITHMETIC_MODES:
+            raise ValueError(f"Aritmética desconhecida: {arithmetic}. Opções: {', '.join(self.ARITHMETIC_MODES)}")
+        if arithmetic == "exact" and pricing != "dantzig":
+            raise ValueError("A aritmética exata só está disponível com a regra de pricing dantzig.")
+        self.pricing = pricing
+        self.max_iterations = max_iterations
+        self.pricing_threads = pricing_threads
+        self.pricing_block_size = pricing_block_size
+        self.arithmetic = arithmetic
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+    def __repr__(self) -> str:
+        return f"SolverOptions({', '.join(f'{key}={value!r}' for key, value in self.to_dict().items())})"
+
+
+class IterationEvent:
+    ##
+    # @class IterationEvent
+    # @brief Resumo de um pivô, produzido por `RevisedSimplex.iterate()`.
+    # @details
+    # - `iteration`, `phase`: número da iteração (contado nas duas fases) e fase (1 ou 2),
+    # - `entering`, `leaving`: nomes das variáveis que entraram e saíram da base,
+    # - `objective`: valor da função objetivo da fase depois do pivô (na Fase 1, a soma das artificiais; na
+    # Fase 2, no sentido original do problema),
+    # - `primal_infeasibility`: soma das artificiais (Fase 1) e dos valores básicos negativos,
+    # - `step_length`: valor com que a variável entrou na base (a razão mínima).
+
+    __slots__ = ("iteration", "phase", "entering", "leaving", "objective", "primal_infeasibility", "step_length")
+
+    def __init__(self, iteration: int, phase: int, entering: str, leaving: str, objective: float,
+                 primal_infeasibility: float, step_length: float) -> None:
+        self.iteration = iteration
+        self.phase = phase
+        self.entering = entering
+        self.leaving = leaving
+        self.objective = objective
+        self.primal_infeasibility = primal_infeasibility
+        self.step_length = step_length
+
+    def to_dict(self) -> dict:
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    def __repr__(self) -> str:
+        return f"IterationEvent({', '.join(f'{key}={value!r}' for key, value in self.to_dict().items())})"
+
+
+class SolveStatus(str, Enum):
+    ##
+    # @class SolveStatus
+    # @brief Conclusão de uma resolução, com os mesmos valores dos textos de `RevisedSimplex.status`.
+    # @details Como é uma `str`, compara igual ao texto correspondente (`SolveStatus.OPTIMAL == "optimal"`).
+
+    OPTIMAL = "optimal"
+    DEGENERATE = "degenerate"
+    UNBOUNDED = "unbounded"
+    INFEASIBLE_PHASE_1 = "infeasible/phase_1"
+    INFEASIBLE_PHASE_2 = "infeasible/phase_2"
+    MAXIMUM_ITERATIONS_EXCEEDED = "maximum_iterations_exceeded"
+
+    @property
+    def is_solved(self) -> bool:
+        return self in (SolveStatus.OPTIMAL, SolveStatus.DEGENERATE)
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class SolveResult:
+    ##
+    # @class SolveResult
+    # @brief Resultado imutável de `RevisedSimplex.solve()`.
+    # @details
+    # - `status`: um `SolveStatus`,
+    # - `objective`: valor da função objetivo (`None` se o problema não foi resolvido),
+    # - `values`: valores de todas as colunas (decisão, folga e artificiais restantes), somente leitura,
+    # - `basis`: índices das variáveis básicas em `variables`, somente leitura,
+    # - `variables`: nomes das colunas, na ordem de `values`,
+    # - `iterations`: iterações somadas das duas fases; `phase_one_iterations`, as da Fase 1 (`None` se
+    # desconhecidas: ao retomar na Fase 2 ou ao restaurar do `SolutionCache`),
+    # - `degeneracy_points`: iterações em que houve empate na escolha do pivô,
+    # - `timings`: tempos medidos em segundos (ex.: `{"solve": ...}`).
+    # Os nomes só são associados aos valores e à base quando pedidos (`get_solution`, `get_basis_names`).
+
+    __slots__ = ("status", "objective", "values", "basis", "variables", "iterations", "phase_one_iterations",
+                 "degeneracy_points", "timings")
+
+    def __init__(self, status: SolveStatus, objective: float, values: np.ndarray, basis: np.ndarray,
+                 variables: tuple, iterations: int, phase_one_iterations: int = None,
+                 degeneracy_points: tuple = (), timings: dict = None) -> None:
+        values.flags.writeable = False
+        basis.flags.writeable = False
+        for key, value in zip(self.__slots__, (status, objective, values, basis, variables, iterations,
+                                               phase_one_iterations, tuple(degeneracy_points),
+                                               MappingProxyType(dict(timings or {})))):
+            object.__setattr__(self, key, value)
+
+    def __setattr__(self, key, value) -> None:
+        raise AttributeError("O resultado da resolução não pode ser alterado.")
+
+    def __delattr__(self, key) -> None:
+        raise AttributeError("O resultado da resolução não pode ser alterado.")
+
+    @property
+    def is_solved(self) -> bool:
+        return self.status.is_solved
+
+    def get_solution(self) -> dict:
+        ##
+        # @brief Dicionário nome -> valor, no formato de `RevisedSimplex.get_solution()`.
+
+        return dict(zip(self.variables, self.values.tolist()))
+
+    def get_basis_names(self) -> list[str]:
+        return [self.variables[index] for index in self.basis.tolist()]
+
+    def to_dict(self) -> dict:
+        ##
+        # @brief Dicionário serializável em JSON, com as chaves dos registros do `ResultsWriter` (sem `file`).
+
+        return {
+            "status": self.status.value,
+            "objective": self.objective,
+            "values": self.get_solution(),
+            "basis": self.get_basis_names(),
+            "iterations": self.iterations,
+            "timings": dict(self.timings),
+        }
+
+    def __repr__(self) -> str:
+        return (f"SolveResult(status={self.status.value!r}, objective={self.objective!r}, "
+                f"iterations={self.iterations!r}, variables={len(self.variables)})")
+
+
 class RevisedSimplex:
     ##
     # @class RevisedSimplex
@@ -32,26 +202,53 @@ class RevisedSimplex:
     # @note
     # Esta classe é dependente do fornecimento de um arquivo com os dados do problema.
 
-    def __init__(self, file:str = "", show_steps: bool = False, latex_writer: LatexWriter = None) -> None:
+    SUMMARIZED_STATUS_TEXT = {
+        "infeasible/phase_1": "summarized/infeasible/phase_1_text",
+        "infeasible/phase_2": "summarized/infeasible/phase_2_text",
+        "maximum_iterations_exceeded": "maximum_iterations_exceeded_text",
+    }
+
+    def __init__(self, file:str = "", show_steps: bool = False, latex_writer: LatexWriter = None, data: dict = None,
+                 options: SolverOptions = None, problem_cache: ProblemCache = None,
+                 solution_cache: SolutionCache = None, quiet: bool = False,
+                 render_policy: RenderPolicy = None) -> None:
         ##
         # @brief Construtor da classe RevisedSimplex.
         # @param file Nome do arquivo que contém os dados do problema de otimização linear.
         # O padrão é uma string vazia (não utiliza arquivo).
         # @param show_steps Indica se os passos intermediários do processo devem ser exibidos no LaTeX.
         # @param latex_writer Instância de LatexWriter para gerar a saída em LaTeX. Opcional caso mais de um problema vá ser resolvido.
+        # @param data Dicionário no formato do `FileParser` já carregado. Usado no lugar de `file` quando fornecido.
+        # @param options Configuração da execução (regra de pricing, limite de iterações). Usa os padrões se omitida.
+        # @param problem_cache Cache compilado de problemas. Se fornecido, arquivos inalterados não são analisados novamente.
+        # @param solution_cache Cache de soluções. Se fornecido, problemas já resolvidos com as mesmas opções são restaurados sem iterar.
+        # @param quiet Não imprime nada na saída (status e resultados) fora do passo a passo; o resultado fica em `solve()`.
+        # @param render_policy Limites de tamanho do passo a passo (ver `RenderPolicy`), usados no `LatexWriter` criado
+        # quando `latex_writer` é omitido; um escritor fornecido usa a própria política.
         # @details
         # Este construtor inicializa e configura a classe RevisedSimplex. Ele pode usar informações de um arquivo
         # ou ser configurado manualmente através de sua classe filha para resolver problemas lineares passados através de uma matriz.
         # @see RevisedSimplexWithoutFile
 
         self.__exercise_number = 1
-        if not file == "":
+        self.options = options if options is not None else SolverOptions()
+        self.problem_cache = problem_cache
+        self.solution_cache = solution_cache
+        self.checkpointer = None
+        self.trace = None
+        self.instrumentation = None
+        self.exact_basis = None
+        self.shared_problem = None
+        self.quiet = quiet
+        if data is not None:
+            self.__setup_from_data(data)
+        elif not file == "":
             self._load_problem_data(file)
         if latex_writer is None:
             self._setup_support_variables()
             if show_steps:
                 self.should_close = True
-                self.latexWriter = LatexWriter(file.split("/")[-1].split(".")[0])
+                self.latexWriter = AsyncLatexWriter(file.split("/")[-1].split(".")[0], render_policy=render_policy)
         else:
             self.should_close = False
             self.latexWriter = latex_writer
@@ -62,13 +259,56 @@ class RevisedSimplex:
         # @brief Carrega os dados do problema de um arquivo.
         # @param file Caminho para o arquivo contendo os dados do problema linear.
         # @details
-        # Os dados são lidos e processados utilizando o `FileParser`. Após a leitura,
+        # Os dados são lidos e processados utilizando o `FileParser` (ou o `MpsParser` para arquivos MPS,
+        # escolhido pela extensão), ou recuperados do `ProblemCache` quando o arquivo não mudou. Após a leitura,
         # as informações são configuradas nos atributos da classe, como variáveis, matriz de restrição e função objetivo
         # por uma outra função auxiliar.
 
-        data = FileParser(file).parse_file()
+        if self.problem_cache is not None:
+            data = self.problem_cache.parse_file(file)
+        else:
+            data = FileParser.for_file(file).parse_file()
         self.__setup_from_data(data)
 
+    @classmethod
+    def from_shared(cls, handle: SharedProblemHandle, show_steps: bool = False, latex_writer: LatexWriter = None,
+                    options: SolverOptions = None, quiet: bool = False, **overrides) -> "RevisedSimplex":
+        ##
+        # @brief Constrói o solver a partir de um problema colocado em memória compartilhada.
+        # @param handle Handle obtido de `SharedProblem.create(...).handle` no processo principal.
+        # @param show_steps Indica se os passos intermediários do processo devem ser exibidos no LaTeX.
+        # @param latex_writer Instância de LatexWriter para gerar a saída em LaTeX.
+        # @param options Configuração da execução.
+        # @param quiet Não imprime nada na saída fora do passo a passo.
+        # @param overrides Campos do dicionário do problema a substituir (ex.: `objective_function` ou
+        # `restrictions_vector`), permitindo resolver variações de um mesmo modelo.
+        # @return Uma instância do solver cuja matriz de restrições é uma visão somente leitura do bloco.
+        # @details
+        # A matriz de restrições não é copiada ao anexar o bloco; o processo trabalhador só passa a ter
+        # uma cópia própria quando a padronização acrescenta as colunas de folga e artificiais. O bloco é
+        # fechado (sem ser destruído) logo em seguida, ou por `close()` se o solver não chegar a resolver.
+
+        shared_problem = SharedProblem.attach(handle)
+        data = shared_problem.get_data()
+        data.update(overrides)
+        solver = cls(show_steps=show_steps, latex_writer=latex_writer, data=data, options=options, quiet=quiet)
+        solver.shared_problem = shared_problem
+        return solver
+
+    def close(self) -> None:
+        ##
+        # @brief Libera os recursos externos do solver: o bloco compartilhado de `from_shared` ainda anexado.
+        # @details Só é necessário quando o solver é descartado sem resolver; `solve()` já fecha o bloco.
+        # @warning Um solver fechado antes de resolver não deve mais ser usado, pois a sua matriz é uma visão do bloco.
+
+        self.__release_shared_problem()
+
+    def __enter__(self) -> "RevisedSimplex":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def _setup_support_variables(self) -> None:
         ##
         # @brief Configura variáveis de suporte internas para o problema carregado.
@@ -86,6 +326,8 @@ class RevisedSimplex:
         self.status = None  # Ideia vinda do scipy pra organizar melhor qual a conclusão do simplex.
         self.degeneracy_points = []
         self.current_interaction = 0
+        self.phase_one_iterations = 0
+        self.basic_indexes = None
 
     def __setup_from_data(self, data) -> None:
         ##
@@ -100,14 +342,20 @@ class RevisedSimplex:
         # @details
         # Esse método inicializa os dados principais do problema (variáveis, matriz de restrições, função objetivo, etc.)
         # com base no dicionário resultante do parser de arquivo passado anteriormente.
+        # Os vetores de custo e de restrições são copiados, pois o solver os altera durante a resolução,
+        # enquanto a matriz de restrições é mantida como recebida (podendo ser uma visão somente leitura).
+        # Uma `OutOfCoreMatrix` é reaberta, para que a padronização não altere o objeto de quem chamou; as leituras
+        # da cópia continuam contadas nos contadores de I/O do objeto original.
         # @warning Só deve ser usado após ter dados carregados pelo FileParser
 
-        self.variables = data["lp_variables"]
+        self.variables = list(data["lp_variables"])
         self.constraint_matrix = data["constraint_matrix"]
+        if isinstance(self.constraint_matrix, OutOfCoreMatrix):
+            self.constraint_matrix = self.constraint_matrix.copy()
         self.isMaximization = data["is_maximization"]
-        self.objective = data["objective_function"]
-        self.restrictions = data["restrictions_vector"]
-        self.restriction_symbols = data["symbols"]
+        self.objective = np.array(data["objective_function"], dtype=np.float64)
+        self.restrictions = np.array(data["restrictions_vector"], dtype=np.float64)
+        self.restriction_symbols = list(data["symbols"])
 
     def reload_problem(self, file: str) -> None:
         ##
@@ -116,17 +364,50 @@ class RevisedSimplex:
         # @details
         # Este método lê um novo problema do arquivo fornecido e redefine as variáveis configuradas
         # para que o algoritmo possa ser executado novamente.
+        # Com um `ProblemCache` configurado, arquivos inalterados são carregados do cache compilado.
         # @note
         # Usado especialmente para quando queremos escrever várias soluções num mesmo arquivo.
         
-        data = FileParser(file).parse_file()
-        self.__setup_from_data(data)
+        self._load_problem_data(file)
         self._setup_support_variables()
 
-    def solve(self, show_steps: bool = False) -> None:
+    def set_checkpoint(self, filename: str, every_iterations: int = None, every_seconds: float = None) -> None:
+        ##
+        # @brief Ativa a gravação periódica de pontos de retomada durante `solve()`.
+        # @param filename Arquivo `.npz` onde o estado será gravado (substituído a cada gravação).
+        # @param every_iterations Grava a cada N iterações.
+        # @param every_seconds Grava a cada T segundos.
+        # @see Checkpointer
+
+        self.checkpointer = Checkpointer(filename, every_iterations, every_seconds)
+
+    def set_trace(self, trace: IterationTrace = None) -> IterationTrace:
+        ##
+        # @brief Ativa a gravação do rastro compacto das iterações nas próximas resoluções.
+        # @param trace Rastro a ser preenchido (um novo, se não for informado).
+        # @return O rastro, para ser salvo com `IterationTrace.save` ou escrito com um `TraceRenderer`.
+        # @note Uma solução restaurada do `SolutionCache` não tem iterações a gravar.
+
+        self.trace = trace if trace is not None else IterationTrace()
+        return self.trace
+
+    def set_instrumentation(self, instrumentation: SolverInstrumentation = None) -> SolverInstrumentation:
+        ##
+        # @brief Ativa a medição dos tempos por fase e por etapa e dos contadores nas próximas resoluções.
+        # @param instrumentation Instância a ser preenchida (uma nova, sem callback, se não for informada).
+        # Os valores são zerados no início de cada `solve()`.
+        # @return A instância, para ler `to_dict()`/`to_json()` após a resolução.
+        # @note Uma solução restaurada do `SolutionCache` não tem iterações a medir.
+
+        self.instrumentation = instrumentation if instrumentation is not None else SolverInstrumentation()
+        return self.instrumentation
+
+    def solve(self, show_steps: bool = False, resume_from: str = None) -> SolveResult:
         ##
         # @brief Resolve o problema de programação linear carregado.
         # @param show_steps Exibe os passos do algoritmo em LaTeX, se definido como True.
+        # @param resume_from Ponto de retomada gravado por `set_checkpoint`. A resolução continua da fase e da
+        # base salvas, com a matriz básica refatorada a partir dos índices da base.
         # @details
         # Executa cada etapa do algoritmo do Simplex Revisado, de forma sequencial:
         # - Padroniza o problema com variáveis artificiais e de folga,
@@ -135,7 +416,94 @@ class RevisedSimplex:
         # @note
         # A solução final ou mensagens de erro (problema inviável ou ilimitado) são impressas
         # ou registradas no arquivo gerado em LaTeX.
-        
+        # Com uma `OutOfCoreMatrix` como matriz de restrições, o passo a passo não está disponível, pois exigiria
+        # materializar a matriz inteira no documento.
+        # Com um `SolutionCache` e sem o passo a passo, um problema já resolvido é restaurado do cache.
+        # Com o passo a passo, os textos são gerados no idioma do `LatexWriter` (em vários idiomas de uma vez com
+        # um `MultiLanguageLatexWriter`).
+        # Com `SolverOptions(arithmetic="exact")`, as escolhas de pivô são exatas e o LaTeX mostra as frações
+        # calculadas, sem aproximar floats; os valores em `variable_values` são essas frações arredondadas.
+        # @return Um `SolveResult` com o status, o valor objetivo, os valores, a base, as iterações e o tempo de
+        # resolução. Os atributos do solver (`status`, `variable_values`, `basis`...) continuam preenchidos.
+
+        # O laço é o mesmo de `iterate()`, consumido até o fim.
+
+        start = time.perf_counter()
+        for _ in self.iterate(show_steps, resume_from):
+            pass
+        return self.get_result({"solve": time.perf_counter() - start})
+
+    def get_result(self, timings: dict = None) -> SolveResult:
+        ##
+        # @brief Monta o `SolveResult` do estado final, para quem resolveu com `iterate()`.
+        # @param timings Tempos medidos em segundos a incluir no resultado.
+        # @warning Deve ser chamado somente após a resolução terminar (com `status` definido).
+
+        status = SolveStatus(self.status)
+        basic_indexes = self.basic_indexes if self.basic_indexes is not None else self.__get_basic_indexes()
+        return SolveResult(status, float(self.get_objective_value()) if status.is_solved else None,
+                           np.array(self.variable_values, dtype=np.float64), np.array(basic_indexes, dtype=np.int64),
+                           tuple(self.__get_variables_list()), int(self.current_interaction),
+                           self.phase_one_iterations, self.degeneracy_points, timings)
+
+    def iterate(self, show_steps: bool = False, resume_from: str = None):
+        ##
+        # @brief Resolve o problema aos poucos, produzindo um `IterationEvent` a cada pivô.
+        # @param show_steps Exibe os passos do algoritmo em LaTeX, se definido como True.
+        # @param resume_from Ponto de retomada gravado por `set_checkpoint`.
+        # @return Um gerador de `IterationEvent`. A resolução só avança quando o próximo evento é pedido.
+        # @details Permite acompanhar o progresso, registrar amostras ou parar antes do fim, sem o custo do
+        # passo a passo em LaTeX. Exemplo:
+        # @code
+        # for event in solver.iterate():
+        #     if event.iteration >= 50:
+        #         break
+        # @endcode
+        # Ao esgotar o gerador, o estado final (`status`, valores e bases) e as mensagens são os mesmos de
+        # `solve()`. Ao interrompê-lo, o solver fica na última iteração concluída, sem `status` final.
+        # Os erros de configuração são lançados na chamada, e não no primeiro evento.
+
+        if show_steps and isinstance(self.constraint_matrix, OutOfCoreMatrix):
+            raise ValueError("O passo a passo em LaTeX não é suportado com a matriz de restrições fora da memória.")
+        if self.options.arithmetic == "exact" and isinstance(self.constraint_matrix, OutOfCoreMatrix):
+            raise ValueError("A aritmética exata não é suportada com a matriz de restrições fora da memória.")
+        return self.__iterate(show_steps, resume_from)
+
+    def __iterate(self, show_steps: bool, resume_from: str):
+        steps = self.__solve(show_steps, resume_from)
+        if not show_steps:
+            yield from steps
+            return
+
+        finished = False
+        language = self.latexWriter.language
+        try:
+            while True:
+                with SolveContext(language=language):
+                    event = next(steps, None)
+                if event is None:
+                    break
+                yield event
+            finished = True
+        finally:
+            steps.close()
+            if not finished and self.should_close:
+                self.latexWriter.close()
+
+    def __solve(self, show_steps: bool, resume_from: str):
+        self.exact_basis = None
+        self.basic_indexes = None
+        self.phase_one_iterations = 0
+        if self.instrumentation is not None:
+            self.instrumentation.reset()
+        cache_key = None
+        if self.solution_cache is not None and not show_steps:
+            cache_key = self.solution_cache.get_key(self)
+            cached_state = self.solution_cache.get(cache_key)
+            if cached_state is not None:
+                self.__restore_solution_state(cached_state)
+                return
+
         if show_steps:
             self.latexWriter.write(r"\section{" + LanguageUtils.get_translated_text_variable_text("exercise_text", [str(self.__exercise_number)]) + "}")
             self.__write_current_problem()
@@ -153,14 +521,90 @@ class RevisedSimplex:
                 self.latexWriter.write(LanguageUtils.get_translated_text("cost_change_max_text"))
                 self.latexWriter.write_matrices_with_labels([f"{LanguageUtils.get_translated_text('cost_vector_text')} (c)"], [self.objective])
 
-        from_phase_one = False
-        if self.__solve_phase_one(show_steps) == 0:
-            from_phase_one = True
-        if self.status != "infeasible/phase_1" and not "unbounded" in str(self.status):
-            self.__solve_phase_two(from_phase_one, show_steps)
-
+        resume_state = None
+        if resume_from is not None:
+            resume_state = Checkpointer.load(resume_from)
+            self.__restore_checkpoint_state(resume_state)
+
+        self.pricer = BlockPricer(self.options.pricing, self.options.pricing_threads, self.options.pricing_block_size)
+        try:
+            from_phase_one = False
+            if resume_state is not None and resume_state["phase"] == 2:
+                from_phase_one = True
+                self.phase_one_iterations = None
+            elif (yield from self.__solve_phase_one(show_steps, resume_state is not None)) == 0:
+                from_phase_one = True
+            if self.status not in ("infeasible/phase_1", "maximum_iterations_exceeded") and not "unbounded" in str(self.status):
+                yield from self.__solve_phase_two(from_phase_one, show_steps)
+        finally:
+            self.pricer.close()
+
+        if cache_key is not None:
+            self.solution_cache.put(cache_key, self.get_solution_state())
         self.__show_process_results(show_steps)
 
+    def get_solution_state(self) -> dict:
+        ##
+        # @brief Retorna o estado final da resolução em um dicionário serializável em JSON.
+        # @return Dicionário com status, valores das variáveis, base, não base, variáveis de folga e artificiais,
+        # pontos de degeneração e número de iterações.
+
+        return {
+            "status": self.status,
+            "variable_values": [float(value) for value in self.variable_values],
+            "basis": list(getattr(self, "basis", [])),
+            "non_basis": list(getattr(self, "non_basis", [])),
+            "slack_variables": list(self.slack_variables),
+            "artificial_variables": list(self.artificial_variables),
+            "degeneracy_points": [int(point) for point in self.degeneracy_points],
+            "iterations": int(self.current_interaction),
+        }
+
+    def __get_checkpoint_state(self, phase: int) -> dict:
+        return {
+            "phase": phase,
+            "iteration": self.current_interaction,
+            "variables": self.variables,
+            "basis": self.basis,
+            "non_basis": self.non_basis,
+            "slack_variables": self.slack_variables,
+            "artificial_variables": self.artificial_variables,
+            "variable_values": self.variable_values,
+            "degeneracy_points": self.degeneracy_points,
+        }
+
+    def __restore_checkpoint_state(self, state: dict) -> None:
+        ##
+        # @brief Restaura o estado de um ponto de retomada sobre o problema já padronizado.
+        # @param state Estado lido por `Checkpointer.load`.
+
+        if state["variables"] != self.variables or state["slack_variables"] != self.slack_variables:
+            raise ValueError("O ponto de retomada não corresponde ao problema carregado.")
+        self.basis = list(state["basis"])
+        self.non_basis = list(state["non_basis"])
+        self.artificial_variables = list(state["artificial_variables"])
+        self.variable_values = list(state["variable_values"])
+        self.degeneracy_points = list(state["degeneracy_points"])
+        self.current_interaction = state["iteration"]
+
+    def __restore_solution_state(self, state: dict) -> None:
+        ##
+        # @brief Restaura o estado salvo por `get_solution_state` e exibe o resultado como se o problema tivesse sido resolvido.
+        # @param state Estado recuperado do `SolutionCache`.
+
+        self.status = state["status"]
+        self.variable_values = list(state["variable_values"])
+        self.basis = list(state["basis"])
+        self.non_basis = list(state["non_basis"])
+        self.slack_variables = list(state["slack_variables"])
+        self.artificial_variables = list(state["artificial_variables"])
+        self.degeneracy_points = list(state["degeneracy_points"])
+        self.current_interaction = state["iterations"]
+        self.phase_one_iterations = None
+        if self.status in self.SUMMARIZED_STATUS_TEXT:
+            self.__print_current_exercise_status(self.SUMMARIZED_STATUS_TEXT[self.status])
+        self.__show_process_results(False)
+
     def __get_initial_artificial_basis(self) -> list[str]:
         ##
         # @brief Obtém a base inicial com variáveis artificiais para a Fase 1.
@@ -205,10 +649,11 @@ class RevisedSimplex:
 
 
 
-    def __solve_phase_one(self, show_steps: bool = False) -> int:
+    def __solve_phase_one(self, show_steps: bool = False, resumed: bool = False):
         ##
         # @brief Resolve a Fase 1 do Simplex Revisado para remover as variáveis artificiais acrescentadas na padronização do problema.
         # @param show_steps Exibe os detalhes da resolução passo a passo no LaTeX, se `True`.
+        # @param resumed Indica que a base e a não base já foram restauradas de um ponto de retomada.
         # @return Retorna:
         #     - `0` se a Fase 1 for concluída com sucesso,
         #     - `-1` se a fase 1 não foi necessária, ou não pode ser concluida.
@@ -216,6 +661,7 @@ class RevisedSimplex:
         # Na Fase 1, o algoritmo tenta remover as variáveis artificiais da base procurando por uma solução factível
         # e em seguida, verificar se o problema é viável.
         # Caso ele não seja, o status do problema é atualizado para "inviável" ou para "ilimitado".
+        # É um gerador (ver `iterate`): repassa os eventos de cada pivô e devolve o resultado no `return`.
             
         if len(self.artificial_variables) < 1:
             return -1
@@ -230,8 +676,9 @@ class RevisedSimplex:
             self.latexWriter.write(LanguageUtils.get_translated_text("artificial_variables_cost"))
             self.latexWriter.write_column_identifiers(artificial_costs, self.__get_variables_list())
 
-        self.basis = self.__get_initial_artificial_basis()
-        self.non_basis = self.__get_initial_artificial_non_basis(self.basis)
+        if not resumed:
+            self.basis = self.__get_initial_artificial_basis()
+            self.non_basis = self.__get_initial_artificial_non_basis(self.basis)
 
         if show_steps:
             self.latexWriter.write(LanguageUtils.get_translated_text("initial_basic_non_basic_definition"))
@@ -244,7 +691,10 @@ class RevisedSimplex:
         non_basic_indexes = self.__get_non_basic_indexes()
         b = self.__get_basic_matrix(basic_indexes)
 
-        result = self.__solver_loop(b, basic_indexes, non_basic_indexes, profit, self.restrictions, True, show_steps)
+        result = yield from self.__solver_loop(b, basic_indexes, non_basic_indexes, profit, self.restrictions, True, show_steps)
+        self.phase_one_iterations = self.current_interaction
+        if result == -3:
+            return -1
 
         if self.__check_infeasibility_phase_one() and result == 0:
             if not show_steps:
@@ -254,7 +704,7 @@ class RevisedSimplex:
 
         if show_steps:
             self.latexWriter.write(LanguageUtils.get_translated_text("phase_1_success_text")) #phase_1_success_text
-            self.latexWriter.write_column_identifiers(np.array(self.variable_values), self.__get_variables_list())
+            self.latexWriter.write_column_identifiers(self.__get_display_values()[0], self.__get_variables_list())
             basic_variables_list = self.basis
             non_basic_variables_list = self.non_basis
             self.latexWriter.write_vectors_with_identifiers(["x_b", "x_n"], [basic_variables_list, non_basic_variables_list])
@@ -277,7 +727,7 @@ class RevisedSimplex:
         any_negative_artificial = any(artificial_value != 0 for artificial_value in self.variable_values[-len(self.artificial_variables):])
         return any_artificial_remaining or any_negative_artificial
 
-    def __solve_phase_two(self, from_phase_one: bool, show_steps: bool = False) -> None:
+    def __solve_phase_two(self, from_phase_one: bool, show_steps: bool = False):
         ##
         # @brief Resolve a Fase 2 do Simplex Revisado para encontrar a solução ótima.
         # @param from_phase_one Indica se a Fase 1 ocorreu anteriormente, influenciando na escolha da base.
@@ -305,7 +755,7 @@ class RevisedSimplex:
         non_basic_indexes = self.__get_non_basic_indexes()
         b = self.__get_basic_matrix(basic_indexes)
 
-        result = self.__solver_loop(b, basic_indexes, non_basic_indexes, profit, self.restrictions, False, show_steps)
+        result = yield from self.__solver_loop(b, basic_indexes, non_basic_indexes, profit, self.restrictions, False, show_steps)
 
         if result == 0 and self.__check_infeasibility_phase_two():
             if not show_steps:
@@ -331,16 +781,19 @@ class RevisedSimplex:
         # este método também apresentará a solução numérica do problema
         # de forma detalhada ou simplificada a depender do lugar onde este estiver escrevendo.
         
-        problem_value = self.objective @ self.variable_values[0:len(self.variables)]
+        if self.quiet and not show_steps:
+            return
+        problem_value = self.get_objective_value()
         min_max_string = "max_text" if self.isMaximization else "min_text"
         min_max_string = LanguageUtils.get_translated_text(min_max_string)
         if show_steps:
             self.latexWriter.write(r"\subsection{"+LanguageUtils.get_translated_text("conclusion_text")+"}")
             if self.status == "optimal" or self.status == "degenerate":
+                values, problem_value_text = self.__get_display_values()
                 self.latexWriter.write(LanguageUtils.get_translated_text("optimal_solution_text"))
-                self.latexWriter.write_column_identifiers(np.array(self.variable_values), self.__get_variables_list())
+                self.latexWriter.write_column_identifiers(values, self.__get_variables_list())
                 self.latexWriter.write_vectors_with_identifiers(["x_b", "x_n"], [self.basis, self.non_basis])
-                self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("numerical_solution_text", [min_max_string, LatexUtils.format_value(str(problem_value))]))
+                self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("numerical_solution_text", [min_max_string, problem_value_text]))
                 if self.status == "degenerate":
                     degenerate_string = self.__get_degenerate_string()
                     self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("degenerate_solution_text", [degenerate_string, min_max_string]))
@@ -350,14 +803,17 @@ class RevisedSimplex:
                 self.latexWriter.write(LanguageUtils.get_translated_text("infeasible/phase_1_text"))
             elif self.status == "infeasible/phase_2":
                 self.latexWriter.write(LanguageUtils.get_translated_text("infeasible/phase_2_text"))
+            if self.instrumentation is not None and self.instrumentation.latex_appendix:
+                self.instrumentation.write_latex(self.latexWriter)
 
             if self.should_close:
                 self.latexWriter.close()
         elif self.status == "optimal" or self.status == "degenerate":
-            print(LanguageUtils.get_translated_text("optimal_solution_found"))
-            print(LanguageUtils.get_translated_text("basic_variables_text"), self.basis)
-            print(LanguageUtils.get_translated_text("values_text"), self.get_solution())
-            print(f"{min_max_string} = {problem_value:.4f}")
+            output = SolveContext.get_output()
+            print(LanguageUtils.get_translated_text("optimal_solution_found"), file=output)
+            print(LanguageUtils.get_translated_text("basic_variables_text"), self.basis, file=output)
+            print(LanguageUtils.get_translated_text("values_text"), self.get_solution(), file=output)
+            print(f"{min_max_string} = {problem_value:.4f}", file=output)
             if self.status == "degenerate":
                 LanguageUtils.print_translated("simple_degenerate_text")
         elif self.status == "unbounded":
@@ -374,6 +830,24 @@ class RevisedSimplex:
         any_negative_variable = any(var < 0 for var in self.variable_values)
         return any_negative_variable
 
+    def __get_display_values(self) -> (np.ndarray, str):
+        ##
+        # @brief Valores das variáveis e da função objetivo a escrever no LaTeX.
+        # @return Uma tupla com o vetor de valores e o valor da função objetivo já formatado. Na aritmética exata,
+        # são as frações da `FractionFreeBasis`, e não os floats de `variable_values`.
+
+        if self.exact_basis is None:
+            return np.array(self.variable_values), LatexUtils.format_value(str(self.get_objective_value()))
+        values = self.exact_basis.get_variable_values()[:len(self.variable_values)]
+        objective_value = to_fraction_array(self.objective) @ values[:len(self.variables)]
+        return values, LatexUtils.format_values(np.array([objective_value], dtype=object))[0]
+
+    def get_objective_value(self) -> float:
+        ##
+        # @brief Retorna o valor da função objetivo na solução atual.
+
+        return self.objective @ self.variable_values[0:len(self.variables)]
+
     def get_solution(self) -> dict:
         ##
         # @brief Retorna a solução das variáveis do problema.
@@ -389,7 +863,7 @@ class RevisedSimplex:
 
     def __solver_loop(self, basic_matrix: np.ndarray[np.float64], basic_indexes: list[int],
                       non_basic_indexes: list[int], profit_vector: np.array(np.float64),
-                      restrictions_vector: np.ndarray[np.float64], is_phase_one: bool, show_steps: bool = False) -> int:
+                      restrictions_vector: np.ndarray[np.float64], is_phase_one: bool, show_steps: bool = False):
         
         ##
         # @brief Realiza as iterações do Simplex até alcançar a solução ótima, ou até que as variáveis artificiais
@@ -415,95 +889,193 @@ class RevisedSimplex:
         # A ideia principal é garantir que, ao analisar o código, seja notado que a diferença entre cada fase,
         # é apenas com respeito a condição de parada e condição inicial do problema, mas o intermédio é o mesmo.
         # Esse seria o equivalente ao chamado "Coração do simplex" de acordo com os autores do SciPy.
+        # Cada iteração é escrita por `LatexWriter.write_iteration` e, com um rastro (`set_trace`), gravada no
+        # `IterationTrace`. Na aritmética exata, `B^{-1}`, `x_b`, `c_r`, `y` e as razões vêm da `FractionFreeBasis`,
+        # como vetores de frações (`dtype=object`), e a matriz básica em float não é usada.
+        # Com uma `SolverInstrumentation` (`set_instrumentation`), o tempo de cada etapa e os contadores são medidos.
         
         restrictions_vector = restrictions_vector.reshape(-1, 1)
         variables_list = self.__get_variables_list()
-        phase_indicator = "phase_one_text" if is_phase_one else "phase_two_text"
-        phase_indicator = LanguageUtils.get_translated_text(phase_indicator)
+
+        phase = 1 if is_phase_one else 2
+        self.basic_indexes = basic_indexes
+        stats = self.instrumentation
+        if stats is not None:
+            stats.begin_phase(phase)
+            mark = stats.clock()
+        exact_basis = None
+        self.pricer.reset_weights()
+        if self.options.arithmetic == "exact":
+            exact_basis = FractionFreeBasis(self.constraint_matrix, restrictions_vector, profit_vector, basic_indexes)
+            self.exact_basis = exact_basis
+            if stats is not None:
+                stats.lap(stats.INVERT, mark)
+                stats.count("refactorizations")
+        if self.trace is not None:
+            self.trace.begin_phase(phase, variables_list, profit_vector, basic_indexes, non_basic_indexes,
+                                   self.constraint_matrix, restrictions_vector)
 
         while True:
+            if self.checkpointer is not None:
+                self.checkpointer.maybe_save(self.__get_checkpoint_state(phase))
             self.current_interaction += 1
-            if self.current_interaction > 100:
+            if self.current_interaction > self.options.max_iterations:
                 if show_steps:
                     self.latexWriter.write(LanguageUtils.get_translated_text("maximum_iterations_exceeded_text"))
                 else:
                     self.__print_current_exercise_status("maximum_iterations_exceeded_text")
                 self.status = "maximum_iterations_exceeded"
-                return -3
-            inv_b = np.linalg.inv(basic_matrix)
-
-            x_b = inv_b @ restrictions_vector
-
-            if show_steps:
-                self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("iteration_text", [str(self.current_interaction), phase_indicator]))
-                self.latexWriter.write(LanguageUtils.get_translated_text("current_status_text"))
-                self.latexWriter.write_column_identifiers(np.array(self.variable_values), self.__get_variables_list())
-                self.latexWriter.write_vectors_with_identifiers(["x_b", "x_n"], [self.basis, self.non_basis])
-                self.latexWriter.write()
-                self.latexWriter.write(r"\textbf{"+LanguageUtils.get_translated_text("step_1_text")+"}")
-
-                self.latexWriter.write(LanguageUtils.get_translated_text("step_1_details"))
-                self.latexWriter.write_matrix_equations("x_b", [inv_b, restrictions_vector], x_b)
+                return self.__end_phase(-3)
+            if stats is not None:
+                mark = stats.begin_iteration()
+            render_steps = show_steps and self.latexWriter.render_policy.should_render_iteration(self.current_interaction)
+            if exact_basis is not None:
+                x_b, c_r, in_index, ties = exact_basis.price(non_basic_indexes)
+                if stats is not None:
+                    mark = stats.lap(stats.PRICING, mark)
+                inv_b = exact_basis.get_inverse() if show_steps else None
+                p_t = exact_basis.get_duals() if show_steps else None
+                if stats is not None:
+                    mark = stats.lap(stats.INVERT, mark)
+            else:
+                inv_b = np.linalg.inv(basic_matrix)
+                if stats is not None:
+                    mark = stats.lap(stats.INVERT, mark)
+                    stats.count("refactorizations")
 
-            p_t = profit_vector[basic_indexes] @ inv_b
+                x_b = inv_b @ restrictions_vector
+                if stats is not None:
+                    mark = stats.lap(stats.X_B, mark)
 
+                p_t = profit_vector[basic_indexes] @ inv_b
 
-            c_r = profit_vector[non_basic_indexes] - p_t @ self.constraint_matrix[:, non_basic_indexes]
 
-            if show_steps:
-                self.latexWriter.write(r"\textbf{"+LanguageUtils.get_translated_text("step_2_text")+"}")
-                self.latexWriter.write(LanguageUtils.get_translated_text("step_2_details"))
-                self.latexWriter.write(r"\[ c_r = c_n - (c_b \cdot B^{-1}) \]")
-                self.latexWriter.write_matrix_equations("c_r", [profit_vector[non_basic_indexes], "-", p_t, self.constraint_matrix[:, non_basic_indexes]], c_r)
+                c_r, in_index, ties = self.pricer.price(profit_vector, p_t, inv_b, self.constraint_matrix, non_basic_indexes)
+                if stats is not None:
+                    mark = stats.lap(stats.PRICING, mark)
 
+            step = None
             if show_steps:
-                self.latexWriter.write(r"\textbf{"+LanguageUtils.get_translated_text("step_3_text")+"}") #step_3_text
-
-            in_index = self.__get_negative_pivot(c_r, show_steps)
+                step = {"detailed": render_steps, "phase": phase, "iteration": self.current_interaction,
+                        "variables": variables_list,
+                        "variable_values": self.variable_values if exact_basis is None
+                        else exact_basis.get_variable_values()[:len(variables_list)],
+                        "basis": self.basis, "non_basis": self.non_basis, "inv_b": inv_b,
+                        "restrictions": restrictions_vector, "x_b": x_b, "costs_n": profit_vector[non_basic_indexes],
+                        "p_t": p_t, "a_n": self.constraint_matrix[:, non_basic_indexes] if render_steps else None,
+                        "c_r": c_r, "entering_ties": ties, "a_q": None, "y": None, "ratios": None, "leaving": -1,
+                        "leaving_ties": 0}
+
+            in_index = self.__get_negative_pivot(in_index, ties)
             if in_index == -1:
                 if show_steps:
-                    self.latexWriter.write(LanguageUtils.get_translated_text("no_negative_pivot_found_details"))
-                return 0
+                    self.latexWriter.write_iteration(self.__get_final_step(step, non_basic_indexes, entering=-1))
+                self.__record_iteration(phase, -1, -1)
+                return self.__end_phase(0)
 
 
-            c_n = self.constraint_matrix[:, in_index].reshape(-1, 1)
-            y = inv_b @ c_n
-
-            if show_steps:
-                self.latexWriter.write(r"\textbf{"+LanguageUtils.get_translated_text("step_4_text")+"}")
-                self.latexWriter.write(LanguageUtils.get_translated_text("step_4_details"))
-                self.latexWriter.write(r"\[ y =  B^{-1} \cdot A_n \]")
-                self.latexWriter.write_matrix_equations("y", [inv_b, c_n], y)
-                self.latexWriter.write(LanguageUtils.get_translated_text("step_4_variable_details"))
-
+            c_n = self.constraint_matrix[:, non_basic_indexes[in_index]].reshape(-1, 1)
+            y = inv_b @ c_n if exact_basis is None else exact_basis.get_direction(non_basic_indexes[in_index])
+            if stats is not None:
+                mark = stats.lap(stats.FTRAN, mark)
 
             if np.all(y <= 0):
+                if show_steps:
+                    self.latexWriter.write_iteration(self.__get_final_step(step, non_basic_indexes, entering=in_index,
+                                                                           a_q=c_n, y=y))
+                self.__record_iteration(phase, non_basic_indexes[in_index], -1, entering_ties=ties)
                 self.status = "unbounded"
-                return -1
+                return self.__end_phase(-1)
 
             ratios = np.full_like(y, np.inf)
             valid_indices = y > 0
             ratios[valid_indices] = x_b[valid_indices] / y[valid_indices]
-            if show_steps:
-                self.latexWriter.write(r"\textbf{"+LanguageUtils.get_translated_text("step_5_text")+"}")
-                self.latexWriter.write(LanguageUtils.get_translated_text("step_5_details"))
-                self.latexWriter.write_matrix_equations(r"\text{"+LanguageUtils.get_translated_text("step_5_formula_variable")+"}", [x_b, "/", y], ratios)
 
-            out_index = self.__get_positive_pivot(ratios, show_steps)
+            out_index, options = self.__get_positive_pivot(ratios)
+            if stats is not None:
+                mark = stats.lap(stats.RATIO_TEST, mark)
+            if show_steps:
+                fields = {"entering": in_index, "a_q": c_n, "y": y, "ratios": ratios, "leaving": out_index,
+                          "leaving_ties": options}
+                if not render_steps and is_phase_one and self.__ends_phase_one(in_index, out_index):
+                    self.latexWriter.write_iteration(self.__get_final_step(step, non_basic_indexes, **fields))
+                else:
+                    self.latexWriter.write_iteration(dict(step, **fields))
 
             out_index_basic = basic_indexes[out_index]
             in_index_non_basic = non_basic_indexes[in_index]
+            if exact_basis is None:
+                self.pricer.update_weights(inv_b, y, out_index, out_index_basic)
+            self.__record_iteration(phase, in_index_non_basic, out_index_basic, float(y[out_index, 0]),
+                                    float(ratios[out_index, 0]), ties, options)
 
             basic_indexes[out_index], non_basic_indexes[in_index] = self.__update_variable_values(basic_indexes, variables_list, x_b, y,
                                                                                         out_index, in_index_non_basic, out_index_basic)
-
+            event = self.__get_iteration_event(phase, variables_list, profit_vector, basic_indexes, x_b, out_index,
+                                               ratios[out_index, 0], in_index_non_basic, out_index_basic)
+            if stats is not None:
+                stats.lap(stats.UPDATE, mark)
+            yield event
+
+            if stats is not None:
+                mark = stats.clock()
             basic_matrix[:, out_index] = self.constraint_matrix[:, in_index_non_basic]
+            if exact_basis is not None:
+                exact_basis.replace(out_index, in_index_non_basic)
+            if stats is not None:
+                stats.lap(stats.UPDATE, mark)
+                stats.end_pivot(ties, options, event.step_length == 0)
 
             if is_phase_one and not any(artificial_var in self.basis for artificial_var in self.artificial_variables):
                 if show_steps:
                     self.latexWriter.write(r"\subsubsection{"+LanguageUtils.get_translated_text("phase_1_conclusion")+"}")
                     self.latexWriter.write(LanguageUtils.get_translated_text("phase_1_success_details"))
-                return 0
+                return self.__end_phase(0)
+
+    def __get_final_step(self, step: dict, non_basic_indexes: list[int], **fields) -> dict:
+        ##
+        # @brief Passo da última iteração de uma fase, que é sempre escrita por completo, mesmo quando a
+        # `RenderPolicy` resumiria essa iteração.
+
+        if not step["detailed"]:
+            step = dict(step, detailed=True, a_n=self.constraint_matrix[:, non_basic_indexes])
+        return dict(step, **fields)
+
+    def __ends_phase_one(self, in_index: int, out_index: int) -> bool:
+        ##
+        # @brief Indica se a troca de base escolhida tira da base a última variável artificial.
+
+        artificial_variables = set(self.artificial_variables)
+        return self.non_basis[in_index] not in artificial_variables and not any(
+            variable in artificial_variables for i, variable in enumerate(self.basis) if i != out_index)
+
+    def __get_iteration_event(self, phase: int, variables_list: list[str], profit_vector: np.ndarray,
+                              basic_indexes: list[int], x_b: np.ndarray, out_index: int, step_length,
+                              entering: int, leaving: int) -> "IterationEvent":
+        ##
+        # @brief Monta o evento de um pivô a partir de `x_b` já atualizado por `__update_variable_values`.
+        # @details Só usa vetores do tamanho da base, então o custo não depende do número de colunas.
+
+        values = x_b[:, 0].copy()
+        values[out_index] = step_length
+        objective = float(np.dot(profit_vector.take(basic_indexes), values))
+        infeasibility = float(-values[values < 0].sum()) if values.min() < 0 else 0.0
+        if phase == 1:
+            infeasibility += objective
+        elif self.isMaximization:
+            objective = -objective
+        return IterationEvent(self.current_interaction, phase, variables_list[entering], variables_list[leaving],
+                              objective, infeasibility, float(step_length))
+
+    def __record_iteration(self, phase: int, entering: int, leaving: int, pivot: float = np.nan, ratio: float = np.nan,
+                           entering_ties: int = 0, leaving_ties: int = 0) -> None:
+        if self.trace is not None:
+            self.trace.record(phase, self.current_interaction, entering, leaving, pivot, ratio, entering_ties, leaving_ties)
+
+    def __end_phase(self, result: int) -> int:
+        if self.trace is not None:
+            self.trace.end_phase(result)
+        return result
 
     def __update_variable_values(self, basic_indexes, variables_list: list[str], x_b, y, out_index,
                                  in_index_non_basic, out_index_basic) -> (int, int):
@@ -522,9 +1094,9 @@ class RevisedSimplex:
         # Atualiza os valores das variáveis e realiza a troca entre variáveis básicas e não
         # básicas, conforme indicado pelos pivôs calculados em iterações anteriores.
         
-        pivot_value = np.float64((x_b[out_index] / y[out_index]).item()) #Ele funciona sem o .item() mas dá warnings... MUITOS WARNINGS!!!
+        pivot_value = (x_b[out_index] / y[out_index]).item() #Ele funciona sem o .item() mas dá warnings... MUITOS WARNINGS!!!
         x_b -= pivot_value * y
-        self.variable_values[in_index_non_basic] = pivot_value
+        self.variable_values[in_index_non_basic] = np.float64(pivot_value)
         for i, basic_index in enumerate(basic_indexes):
                 self.variable_values[basic_index] = np.float64(x_b[i].item())
 
@@ -574,56 +1146,40 @@ class RevisedSimplex:
         variables_list = self.__get_variables_list()
         return [variables_list.index(var) for var in self.non_basis]
 
-    def __get_negative_pivot(self, reduced_costs: np.ndarray[np.float64], show_steps: bool = False) -> int:
+    def __get_negative_pivot(self, min_index: int, options: int) -> int:
         ##
         # @brief Determina ""o índice da variável que entrará na base (pivô de entrada).
-        # @param reduced_costs Um vetor contendo os custos reduzidos das variáveis não básicas.
-        # @param show_steps Booleano que indica se os detalhes do processo serão escritos no LaTeX.
+        # @param min_index Índice da candidata escolhida pelo `BlockPricer` (`-1` se não houver custo reduzido negativo).
+        # @param options Número de candidatas empatadas com a escolhida.
         # @return Retorna o índice da variável não básica com menor custo reduzido (menor valor negativo):
         # - Índice inteiro do pivô escolhido,
         # - `-1` se não houver valores negativos (indica que a solução é ótima).
         # @details
-        # Identifica a variável que entrará na base ao procurar o menor valor negativo em
-        # `reduced_costs`. Este valor define a direção de melhoria para o custo da função objetivo.
-        # 1. Valores negativos em `reduced_costs` indicam possíveis melhorias no custo.
+        # A busca pelo menor valor negativo nos custos reduzidos é feita pelo `BlockPricer`, bloco a bloco.
+        # Este valor define a direção de melhoria para o custo da função objetivo.
+        # 1. Valores negativos nos custos reduzidos indicam possíveis melhorias no custo.
         # 2. O pivô é selecionado com base no menor custo reduzido negativo.
         # 3. Se houver múltiplos candidatos com o mesmo valor, o método detecta
         # degeneração, e registra a iteração em que ocorreu.""
-        
-        negative_indexes = np.where(reduced_costs < 0)[0]
-        if show_steps:
-            self.latexWriter.write(LanguageUtils.get_translated_text("get_negative_pivot_details"))
-            min_value_string = LatexUtils.format_numbers_vector(reduced_costs)
-            self.latexWriter.write(r"\textbf{"+LanguageUtils.get_translated_text_variable_text("get_negative_pivot_entering_element_details", [min_value_string])+"}", True) #get_negative_pivot_entering_element_details, [min_value_string]
+        # @see BlockPricer.price
+        # @see LatexWriter.write_iteration
 
-        if negative_indexes.size == 0:
+        if min_index == -1:
             return -1
 
-
-        min_value = np.min(reduced_costs[negative_indexes])
-        options = np.where(reduced_costs == min_value)[0].size
         if options > 1:
             self.degeneracy_points.append(self.current_interaction)
 
-        min_index = negative_indexes[np.argmin(reduced_costs[negative_indexes])]
-
-        if show_steps:
-            self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("get_negative_pivot_element_index_text", [str(min_index+1), LatexUtils.format_string_vector(self.non_basis)]))
-            self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("get_negative_pivot_chosen_element_text", [ LatexUtils.format_variable( self.non_basis[min_index] ) ]))
-            if options > 1:
-                self.latexWriter.write(LanguageUtils.get_translated_text("get_negative_pivot_degeneracy")) #get_negative_pivot_degeneracy
-
         return int(min_index)
 
-    def __get_positive_pivot(self, ratios: np.array(np.float64), show_steps: bool = False) -> int:
+    def __get_positive_pivot(self, ratios: np.array(np.float64)) -> (int, int):
         ##
         # @brief Determina o índice da variável que sairá da base (pivô de saída).
         # @param ratios Um vetor contendo os coeficientes das razões entre as variáveis básicas (`x_b`)
         # e os valores correspondentes em `y`.
-        # @param show_steps Booleano que indica se os detalhes do método serão escritos no LaTeX.
-        # @return Retorna o índice da variável básica que será removida da base:
-        # - Índice inteiro do pivô escolhido para sair,
-        # - `-1` se não houver índices válidos (indica problema ilimitado).
+        # @return Uma tupla com:
+        # - o índice da variável básica que será removida da base (`-1` se não houver índices válidos),
+        # - o número de razões empatadas com a mínima.
         # @details
         # Este método calcula o pivô de saída seguindo o critério da razão mínima,
         # onde as razões `x_b / y` são analisadas. Apenas valores positivos em `y` são
@@ -634,7 +1190,7 @@ class RevisedSimplex:
         positive_indexes = np.where(ratios >= 0)[0]
 
         if positive_indexes.size == 0:
-            return -1
+            return -1, 0
 
         min_value = np.min(ratios[positive_indexes])
         options = np.where(ratios == min_value)[0].size
@@ -642,15 +1198,7 @@ class RevisedSimplex:
             self.degeneracy_points.append(self.current_interaction)
 
         min_index = positive_indexes[np.argmin(ratios[positive_indexes])]
-        if show_steps:
-            min_value_string = LatexUtils.format_numbers_vector(ratios.reshape(-1, 1)[:, 0])
-            self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("get_positive_pivot_leaving_element_details", [min_value_string]), True)
-            self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("get_positive_pivot_element_index_text", [str(min_index + 1), LatexUtils.format_string_vector(self.basis)]))
-            self.latexWriter.write(LanguageUtils.get_translated_text_variable_text("get_positive_pivot_chosen_element_text", [LatexUtils.format_variable(self.basis[min_index])]), True)
-            if options > 1:
-                self.latexWriter.write(LanguageUtils.get_translated_text("get_positive_pivot_degeneracy"))
-
-        return int(min_index)
+        return int(min_index), int(options)
 
     def __standardize_problem(self, show_steps: bool = False) -> None:
         ##
@@ -699,14 +1247,10 @@ class RevisedSimplex:
                 self.artificial_variables.append(artificial_variable)
                 artificial_lines.append(i)
 
-        for i in slack_lines:
-            if i in artificial_lines:
-                self.__add_variable_to_matrix(i, -1)
-            else:
-                self.__add_variable_to_matrix(i, 1)
-
-        for i in artificial_lines:
-            self.__add_variable_to_matrix(i, 1)
+        columns = [(i, -1 if i in artificial_lines else 1) for i in slack_lines]
+        columns += [(i, 1) for i in artificial_lines]
+        self.__add_variables_to_matrix(columns)
+        self.__release_shared_problem()
 
         if show_steps:
             self.latexWriter.write(LanguageUtils.get_translated_text("problem_standardization_after")) #problem_standardization_after
@@ -715,20 +1259,43 @@ class RevisedSimplex:
             self.latexWriter.write(LanguageUtils.get_translated_text("problem_standardization_result")) #problem_standardization_result
             self.__write_current_problem()
 
-    def __add_variable_to_matrix(self, line_to_add: int, value: int) -> None:
+    def __add_variables_to_matrix(self, columns: list[tuple[int, int]]) -> None:
         ##
-        # @brief Adiciona uma nova variável (folga ou artificial) à matriz de restrições.
-        # @param line_to_add Índice da linha onde a variável deve ser adicionada.
-        # @param value O valor do multiplicador da variável na matriz (1 para folga ou -1 caso uma variável artificial esteja presente).
+        # @brief Adiciona as novas variáveis (folga e artificiais) à matriz de restrições.
+        # @param columns Lista de pares (linha, valor) de cada nova coluna, na ordem das variáveis: o valor é
+        # o multiplicador da variável na matriz (1 para folga ou -1 caso uma variável artificial esteja presente).
         # @details
         # Este método modifica a matriz de restrições (A) e ajusta o vetor de variáveis com
         # a adição de novas colunas representando as variáveis introduzidas na padronização.
+        # A matriz padronizada é alocada uma única vez e a original é copiada para ela uma só vez,
+        # em vez de uma cópia por coluna acrescentada.
+        # Em uma `OutOfCoreMatrix` cada coluna é registrada apenas como (linha, valor), sem tocar no arquivo.
         # @note Este método é uma etapa necessária durante a padronização do problema.
-        
-        col = np.zeros((len(self.restriction_symbols), 1))
-        col[line_to_add, 0] = value
-        self.constraint_matrix = np.hstack((self.constraint_matrix, col))
-        self.__add_variable_value_to_vector(line_to_add, value)
+
+        if isinstance(self.constraint_matrix, OutOfCoreMatrix):
+            for line_to_add, value in columns:
+                self.constraint_matrix.append_unit_column(line_to_add, value)
+        elif columns:
+            matrix = np.asarray(self.constraint_matrix)
+            rows, num_columns = matrix.shape
+            standardized = np.zeros((rows, num_columns + len(columns)), dtype=np.result_type(matrix.dtype, np.float64))
+            standardized[:, :num_columns] = matrix
+            lines, values = zip(*columns)
+            standardized[list(lines), np.arange(num_columns, num_columns + len(columns))] = values
+            self.constraint_matrix = standardized
+        for line_to_add, value in columns:
+            self.__add_variable_value_to_vector(line_to_add, value)
+
+    def __release_shared_problem(self) -> None:
+        ##
+        # @brief Fecha o bloco de memória compartilhada anexado por `from_shared`, se houver.
+        # @details Após a padronização, a matriz de restrições é uma cópia própria e os vetores já foram
+        # copiados em `__setup_from_data`, então nenhuma visão sobre o bloco continua em uso.
+
+        shared_problem = self.shared_problem
+        if shared_problem is not None:
+            self.shared_problem = None
+            shared_problem.close()
 
     def __add_variable_value_to_vector(self, line_to_add: int, value: int) -> None:
         ##
@@ -798,16 +1365,25 @@ class RevisedSimplex:
         self.latexWriter.break_page()
         self.__exercise_number+=1
 
+    def set_exercise_number(self, exercise_number: int) -> None:
+        ##
+        # @brief Define o número do exercício usado nos títulos e mensagens, sem escrever no documento.
+        # @param exercise_number Número do exercício (começando em 1).
+
+        self.__exercise_number = exercise_number
+
     def __print_current_exercise_status(self, status:str) -> None:
         ##
         # @brief Identifica o exercício e imprime o status da tela.
         # @param status identificador do erro ou da conclusão obtida durante a execução do algoritmo.
         # @details
         # Imprime de forma simplificada o identificador do exercício atual,
-        # e faz um leve detalhamento do seu status atual.
-        
+        # e faz um leve detalhamento do seu status atual. Não imprime nada no modo `quiet`.
+
+        if self.quiet:
+            return
         cur_exercise = LanguageUtils.get_translated_text_variable_text("exercise_text",[str(self.__exercise_number)]) + ":"
-        print(cur_exercise)
+        print(cur_exercise, file=SolveContext.get_output())
         LanguageUtils.print_translated(status)
 
     def __write_current_problem(self) -> None:
@@ -824,7 +1400,7 @@ class RevisedSimplex:
             restrictions_symbols = ["="]*len(variables_list)
         problem_text = LatexUtils.format_problem_to_latex(self.objective, self.constraint_matrix, variables_list,
                                                           self.restrictions, restrictions_symbols,
-                                                          self.isMaximization)
+                                                          self.isMaximization, self.latexWriter.render_policy)
         self.latexWriter.write(problem_text)
 
 class RevisedSimplexWithoutFile(RevisedSimplex):
@@ -839,14 +1415,18 @@ class RevisedSimplexWithoutFile(RevisedSimplex):
     # da mesma forma que na implementação base de forma similar a como é feito no scipy.    
 
     def __init__(self, objective_function: np.array(np.float64), constraint_matrix: np.ndarray[np.float64],
-                 is_maximization: bool, restrictions: np.array(np.float64), restrictions_symbols: list[str] = None) -> None:
+                 is_maximization: bool, restrictions: np.array(np.float64), restrictions_symbols: list[str] = None,
+                 options: SolverOptions = None, solution_cache: SolutionCache = None, quiet: bool = False) -> None:
         ##
         # @brief Inicializa um problema linear diretamente a partir dos parâmetros fornecidos sem depender de arquivos.
         # @param objective_function Array representando o vetor da função objetivo.
         # @param constraint_matrix Matriz de restrições do problema.
         # @param is_maximization Booleano que indica se o problema é de maximização.
         # @param restrictions Vetor das restrições.
-        # @param restrictions_symbols Lista de símbolos das restrições (≤, =, ≥) (opcional, se não for passado, assumiremos que todos são ≤).
+        # @param restrictions_symbols Lista de símbolos das restrições (≤, =, ≥) (opcional, se não for passado, assumiremos que todas as restrições são ≤).
+        # @param options Configuração da execução (opcional).
+        # @param solution_cache Cache de soluções (opcional).
+        # @param quiet Não imprime nada na saída (opcional).
         # @details
         # Configura diretamente as variáveis e a matriz de restrições, utilizando o mesmo
         # algoritmo de base para executar o método Simplex. As variáveis são automaticamente
@@ -860,6 +1440,6 @@ class RevisedSimplexWithoutFile(RevisedSimplex):
         if restrictions_symbols is not None:
             self.restriction_symbols = restrictions_symbols
         else:
-            self.restriction_symbols = ["<="]*len(self.variables)
+            self.restriction_symbols = ["<="]*len(restrictions)
         self._setup_support_variables()
-        super().__init__()
+        super().__init__(options=options, solution_cache=solution_cache, quiet=quiet)
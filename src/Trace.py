@@ -0,0 +1,227 @@
+##
+# @file Trace.py
+# @brief Rastro compacto das iterações do Simplex Revisado e geração do passo a passo a partir dele.
+# @details Durante a resolução, o `IterationTrace` guarda apenas uma linha binária por iteração (fase, número,
+# variável que entra, variável que sai, elemento pivô, razão mínima e empates) e, por fase, a base inicial e o
+# vetor de custos. O `TraceRenderer` refaz as trocas de base e recalcula `B^{-1}`, `x_b`, `c_r`, `y` e as razões
+# só das iterações pedidas, escrevendo-as com o mesmo `LatexWriter.write_iteration` usado pelo solver.
+# Assim, resolver continua rápido e o documento pode ser gerado depois, quantas vezes for preciso.
+# @author Matheus Silveira Feitosa
+# @date 10/01/2025
+
+import os
+import tempfile
+
+import numpy as np
+
+from Context import SolveContext
+from Model import GrowableArray
+from Utils import LanguageUtils
+
+
+class IterationTrace:
+    ##
+    # @class IterationTrace
+    # @brief Grava as iterações de um `RevisedSimplex` (ver `RevisedSimplex.set_trace`).
+    # @details Cada fase resolvida abre um segmento com os nomes das variáveis, os custos e as listas de índices
+    # básicos e não básicos iniciais; cada iteração acrescenta uma linha a `rows`. Na última iteração de um
+    # segmento, `entering` é `-1` quando a solução é ótima e `leaving` é `-1` quando o problema é ilimitado.
+    # A matriz de restrições e o vetor de restrições são guardados por referência (o solver não os altera
+    # durante as fases) e só são copiados em `save`.
+
+    FORMAT_VERSION = 1
+    ROW_DTYPE = np.dtype([("phase", np.int8), ("iteration", np.int32), ("entering", np.int32), ("leaving", np.int32),
+                          ("pivot", np.float64), ("ratio", np.float64), ("entering_ties", np.int32),
+                          ("leaving_ties", np.int32)])
+
+    def __init__(self) -> None:
+        self.constraint_matrix = None
+        self.restrictions = None
+        self.segments = []
+        self.__rows = GrowableArray(self.ROW_DTYPE, 64)
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self.__rows.view()
+
+    def begin_phase(self, phase: int, variables: list[str], costs: np.ndarray, basic_indexes: list[int],
+                    non_basic_indexes: list[int], constraint_matrix, restrictions: np.ndarray) -> None:
+        self.constraint_matrix = constraint_matrix
+        self.restrictions = np.asarray(restrictions).reshape(-1)
+        self.segments.append({
+            "phase": phase,
+            "variables": list(variables),
+            "costs": np.array(costs, dtype=np.float64),
+            "basic_indexes": np.array(basic_indexes, dtype=np.int64),
+            "non_basic_indexes": np.array(non_basic_indexes, dtype=np.int64),
+            "first_row": self.__rows.size,
+            "result": None,
+        })
+
+    def record(self, phase: int, iteration: int, entering: int, leaving: int, pivot: float = np.nan,
+               ratio: float = np.nan, entering_ties: int = 0, leaving_ties: int = 0) -> None:
+        ##
+        # @brief Acrescenta uma iteração, com índices globais (na lista de variáveis da fase) das variáveis.
+
+        self.__rows.extend(np.array([(phase, iteration, entering, leaving, pivot, ratio, entering_ties, leaving_ties)],
+                                    dtype=self.ROW_DTYPE))
+
+    def end_phase(self, result: int) -> None:
+        ##
+        # @param result Retorno do laço do solver: `0` (ótimo ou fim da Fase 1), `-1` (ilimitado) ou `-3`.
+
+        self.segments[-1]["result"] = result
+
+    def get_segment_rows(self, index: int) -> np.ndarray:
+        segment = self.segments[index]
+        last_row = self.segments[index + 1]["first_row"] if index + 1 < len(self.segments) else self.__rows.size
+        return self.rows[segment["first_row"]:last_row]
+
+    def save(self, filename: str) -> None:
+        ##
+        # @brief Grava o rastro e o problema padronizado em um `.npz` sem pickle, de forma atômica.
+
+        matrix = self.constraint_matrix
+        if matrix is not None and not isinstance(matrix, np.ndarray):
+            matrix = matrix[:, slice(None)]
+        arrays = {
+            "version": np.int64(self.FORMAT_VERSION),
+            "rows": self.rows,
+            "constraint_matrix": np.asarray(matrix if matrix is not None else np.empty((0, 0)), dtype=np.float64),
+            "restrictions": np.asarray(self.restrictions if self.restrictions is not None else [], dtype=np.float64),
+            "segment_phase": np.array([segment["phase"] for segment in self.segments], dtype=np.int64),
+            "segment_first_row": np.array([segment["first_row"] for segment in self.segments], dtype=np.int64),
+            "segment_result": np.array([segment["result"] if segment["result"] is not None else 0
+                                        for segment in self.segments], dtype=np.int64),
+        }
+        for i, segment in enumerate(self.segments):
+            arrays[f"segment{i}_variables"] = np.array(segment["variables"], dtype=np.str_)
+            for key in ("costs", "basic_indexes", "non_basic_indexes"):
+                arrays[f"segment{i}_{key}"] = segment[key]
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        descriptor, temporary = tempfile.mkstemp(prefix=".trace.", suffix=".npz", dir=directory)
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                np.savez_compressed(file, **arrays)
+            os.replace(temporary, filename)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    @staticmethod
+    def load(filename: str) -> "IterationTrace":
+        trace = IterationTrace()
+        with np.load(filename, allow_pickle=False) as arrays:
+            if int(arrays["version"]) != IterationTrace.FORMAT_VERSION:
+                raise ValueError(f"Versão de rastro não suportada: {int(arrays['version'])}")
+            trace.constraint_matrix = arrays["constraint_matrix"]
+            trace.restrictions = arrays["restrictions"]
+            for i, (phase, first_row, result) in enumerate(zip(arrays["segment_phase"], arrays["segment_first_row"],
+                                                               arrays["segment_result"])):
+                trace.segments.append({
+                    "phase": int(phase),
+                    "variables": arrays[f"segment{i}_variables"].tolist(),
+                    "costs": arrays[f"segment{i}_costs"],
+                    "basic_indexes": arrays[f"segment{i}_basic_indexes"],
+                    "non_basic_indexes": arrays[f"segment{i}_non_basic_indexes"],
+                    "first_row": int(first_row),
+                    "result": int(result),
+                })
+            trace.__rows.extend(arrays["rows"])
+        return trace
+
+
+class TraceRenderer:
+    ##
+    # @class TraceRenderer
+    # @brief Gera o passo a passo das iterações escolhidas a partir de um `IterationTrace`.
+    # @details Exemplo:
+    # @code
+    # trace = solver.set_trace()
+    # solver.solve()
+    # TraceRenderer(trace).render(LatexWriter("problema"), iterations=[1, 2, 10])
+    # @endcode
+    # Apenas as trocas de base são refeitas para as demais iterações, sem nenhuma inversão de matriz.
+
+    def __init__(self, trace: IterationTrace) -> None:
+        self.trace = trace
+
+    def get_steps(self, iterations=None):
+        ##
+        # @brief Refaz as iterações e produz, para cada iteração escolhida, o dicionário aceito por
+        # `LatexWriter.write_iteration`.
+        # @param iterations Números das iterações (todas, se `None`).
+
+        selected = None if iterations is None else set(iterations)
+        matrix, restrictions = self.trace.constraint_matrix, self.trace.restrictions
+        for index, segment in enumerate(self.trace.segments):
+            variables = segment["variables"]
+            costs = segment["costs"]
+            basic_indexes = segment["basic_indexes"].tolist()
+            non_basic_indexes = segment["non_basic_indexes"].tolist()
+            rows = self.trace.get_segment_rows(index)
+            for position, row in enumerate(rows):
+                entering, leaving = int(row["entering"]), int(row["leaving"])
+                entering_position = non_basic_indexes.index(entering) if entering != -1 else -1
+                leaving_position = basic_indexes.index(leaving) if leaving != -1 else -1
+                if selected is None or int(row["iteration"]) in selected:
+                    step = self.__get_step(segment, row, matrix, restrictions, variables, costs, basic_indexes,
+                                           non_basic_indexes, entering_position, leaving_position)
+                    step["concludes_phase_one"] = segment["phase"] == 1 and segment["result"] == 0 \
+                        and position == len(rows) - 1 and leaving_position != -1
+                    yield step
+                if entering_position != -1 and leaving_position != -1:
+                    basic_indexes[leaving_position] = entering
+                    non_basic_indexes[entering_position] = leaving
+
+    def render(self, writer, iterations=None) -> int:
+        ##
+        # @brief Escreve as iterações escolhidas no `writer`, no idioma dele, com o título de cada fase antes da
+        # primeira delas.
+        # @return Número de iterações escritas.
+
+        rendered = 0
+        phase = None
+        with SolveContext(language=writer.language):
+            for step in self.get_steps(iterations):
+                if step["phase"] != phase:
+                    phase = step["phase"]
+                    phase_text = LanguageUtils.get_translated_text("phase_one_text" if phase == 1 else "phase_two_text")
+                    writer.write(r"\subsection{" + phase_text + ":}")
+                writer.write_iteration(step)
+                if step["concludes_phase_one"]:
+                    writer.write(r"\subsubsection{" + LanguageUtils.get_translated_text("phase_1_conclusion") + "}")
+                    writer.write(LanguageUtils.get_translated_text("phase_1_success_details"))
+                rendered += 1
+        return rendered
+
+    @staticmethod
+    def __get_step(segment: dict, row, matrix, restrictions: np.ndarray, variables: list[str], costs: np.ndarray,
+                   basic_indexes: list[int], non_basic_indexes: list[int], entering: int, leaving: int) -> dict:
+        restrictions_vector = restrictions.reshape(-1, 1)
+        inv_b = np.linalg.inv(matrix[:, basic_indexes])
+        x_b = inv_b @ restrictions_vector
+        p_t = costs[basic_indexes] @ inv_b
+        a_n = matrix[:, non_basic_indexes]
+        c_r = costs[non_basic_indexes] - p_t @ a_n
+        variable_values = np.zeros(len(variables))
+        variable_values[basic_indexes] = x_b[:, 0]
+        step = {
+            "detailed": True, "phase": segment["phase"], "iteration": int(row["iteration"]),
+            "variables": variables, "variable_values": variable_values,
+            "basis": [variables[i] for i in basic_indexes], "non_basis": [variables[i] for i in non_basic_indexes],
+            "inv_b": inv_b, "restrictions": restrictions_vector, "x_b": x_b,
+            "costs_n": costs[non_basic_indexes], "p_t": p_t, "a_n": a_n, "c_r": c_r,
+            "entering": entering, "entering_ties": int(row["entering_ties"]),
+            "a_q": None, "y": None, "ratios": None, "leaving": leaving, "leaving_ties": int(row["leaving_ties"]),
+        }
+        if entering != -1:
+            a_q = matrix[:, non_basic_indexes[entering]].reshape(-1, 1)
+            y = inv_b @ a_q
+            ratios = np.full_like(y, np.inf)
+            valid_indices = y > 0
+            ratios[valid_indices] = x_b[valid_indices] / y[valid_indices]
+            step.update({"a_q": a_q, "y": y, "ratios": ratios})
+        return step
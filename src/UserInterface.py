@@ -2,7 +2,9 @@ import os
 
 from LanguageDictionary import LanguageDictionary
 import Constants
-from LatexWriter import LatexWriter
+from IncrementalBuild import IncrementalBatchBuilder
+from ProblemCache import ProblemCache
+from ResultsWriter import ResultsWriter
 from Utils import FileUtils, LanguageUtils
 from Solver import RevisedSimplex
 
@@ -58,16 +60,12 @@ class UI:
         if confirmation_input not in Constants.VALID_YES:
             return self.__switch_menu("main_menu")
 
-        latex_writer = LatexWriter(LanguageUtils.get_translated_text("general_file_id"))
-        problem = RevisedSimplex("", True, latex_writer)
-        for i in range(len(problem_list)):
-            problem.reload_problem(problem_list[i])
-            problem.solve(True)
-            print(LanguageUtils.get_translated_text_variable_text("exercise_solved", [ problem_list[i].split("/")[-1] ]))
-            if i < len(problem_list) - 1:
-                problem.set_next_exercise()
-            else:
-                latex_writer.close()
+        results_file = f"{Constants.DATA_OUTPUT}{LanguageUtils.get_language()}/{Constants.RESULTS_FILE}"
+        os.makedirs(os.path.dirname(results_file), exist_ok=True)
+        with ResultsWriter(results_file, flush_interval=1.0) as results_writer:
+            builder = IncrementalBatchBuilder(problem_list, problem_cache=ProblemCache(Constants.DATA_CACHE),
+                                              results_writer=results_writer, on_result=self.__print_exercise_result)
+            builder.build()
         exit_message = LanguageUtils.get_translated_text("all_exercises_solved")
         exit_input = input(exit_message).strip().lower()
         if exit_input in Constants.VALID_YES:
@@ -77,6 +75,15 @@ class UI:
 
 
 
+    @staticmethod
+    def __print_exercise_result(problem_file: str, result: dict) -> None:
+        problem_name = problem_file.split("/")[-1]
+        if result is not None and result["status"] == "error":
+            print(LanguageUtils.get_translated_text_variable_text("exercise_failed", [problem_name, result["error"]]),
+                  flush=True)
+        else:
+            print(LanguageUtils.get_translated_text_variable_text("exercise_solved", [problem_name]), flush=True)
+
     def __language_menu(self) -> int:
         self.__select_language()
         return self.__switch_menu("main_menu")
@@ -1,81 +1,113 @@
 import os
+import re
+import warnings
 from fractions import Fraction
+from functools import lru_cache
 
 import numpy as np
 
+from Context import SolveContext
 from LanguageDictionary import LanguageDictionary
 
 
 class FormatUtils:
     SPECIAL_SIMBOLS = ["<=", ">=", "=", "+", "-"]
+    NUMBER_CHARACTERS = "0123456789."
 
     @staticmethod
-    def string_to_array(string: str, variables_order: list) -> np.array:
-        np_array = np.empty((len(variables_order)))
-        for idx, var in enumerate(variables_order):
-            np_array[idx] = FormatUtils._read_number(string, var)
-        np_array = np_array.astype(np.float64)
-        return np_array
+    def clean_line(line: str) -> str:
+        line = line.strip()
+        if line.startswith("#") or len(line) <= 1:
+            return ""
+        return line.split("#")[0].strip()
+
+    @staticmethod
+    def tokenize_expression(expression: str):
+        sign = 1.0
+        coefficient = None
+        for term in expression.split():
+            if term == "+":
+                continue
+            if term == "-":
+                sign = -sign
+                continue
+            while term[:1] in ("+", "-"):
+                if term[0] == "-":
+                    sign = -sign
+                term = term[1:]
+            char_index = 0
+            while char_index < len(term) and term[char_index] in FormatUtils.NUMBER_CHARACTERS:
+                char_index += 1
+            number, variable = term[:char_index], term[char_index:].lstrip("*")
+            if number:
+                coefficient = float(number) * (coefficient if coefficient is not None else 1.0)
+            if variable:
+                yield sign * (coefficient if coefficient is not None else 1.0), variable
+                sign, coefficient = 1.0, None
 
+    @staticmethod
+    def coo_to_dense(rows: np.ndarray, columns: np.ndarray, values: np.ndarray, shape: tuple) -> np.ndarray:
+        matrix = np.zeros(shape, dtype=np.float64)
+        np.add.at(matrix, (rows, columns), values)
+        return matrix
+
+    # Funções antigas, mantidas como invólucros finos sobre `clean_line` e `tokenize_expression` para quem ainda as
+    # usa fora do `FileParser`. Serão removidas em uma versão futura.
+
+    @staticmethod
+    def string_to_array(string: str, variables_order: list) -> np.array:
+        FormatUtils.__warn_deprecated("string_to_array", "tokenize_expression")
+        coefficients = dict.fromkeys(variables_order, 0.0)
+        for coefficient, variable in FormatUtils.__get_terms(string):
+            if variable in coefficients:
+                coefficients[variable] += coefficient
+        return np.array(list(coefficients.values()), dtype=np.float64)
 
     @staticmethod
     def get_variables_vector(string):
-        variables = []
+        FormatUtils.__warn_deprecated("get_variables_vector", "tokenize_expression")
+        return list(dict.fromkeys(variable for _, variable in FormatUtils.__get_terms(string)))
 
-        string_list = string.split(" ")
-        for term in string_list:
-            if term in FormatUtils.SPECIAL_SIMBOLS or term.startswith("max") or term.startswith("min"):
-                continue
-            char_index = 0
-            while char_index < len(term):
-                if term[char_index].isdigit() or term[char_index] in FormatUtils.SPECIAL_SIMBOLS:
-                    char_index += 1
-                else:
-                    break
-            variable = term[char_index:]
-            if variable not in variables and not variable == "":
-                variables.append(variable)
-
-
-        return variables
-
-    @staticmethod
-    def _read_number(expression: str, variable: str) -> str:
-        variable_index = expression.find(variable)
-        if variable_index == -1:
-            return "0"
-        half_expression = expression[:variable_index].split(" ")[-2:]
-        if half_expression[-1] == "-":
-            value = -1
-        elif not half_expression[-1].isdigit():
-            value = 1
-        else:
-            value = half_expression[-1]
-        if len(half_expression) >= 2 and half_expression[-2] == "-":
-            value = -float(value)
-        return value
+    @staticmethod
+    def _read_number(expression: str, variable: str) -> float:
+        FormatUtils.__warn_deprecated("_read_number", "tokenize_expression")
+        return sum((coefficient for coefficient, name in FormatUtils.__get_terms(expression) if name == variable), 0.0)
 
     @staticmethod
     def format_file(file_content: str) -> list:
-        file_content = file_content.split('\n')
-
-        cleared_file = []
+        FormatUtils.__warn_deprecated("format_file", "clean_line")
+        lines = (FormatUtils.clean_line(line) for line in file_content.split("\n"))
+        return list(dict.fromkeys(line for line in lines if line))
 
-        for line in file_content:
-            line = line.strip()
-            if not line.startswith("#") and len(line) > 1:
-                line = line.split("#")[0]
-                if line not in cleared_file:
-                    cleared_file.append(line)
+    @staticmethod
+    def __get_terms(expression: str):
+        # Apenas o lado esquerdo, sem o `max`/`min` da função objetivo, como nas versões antigas.
+        for symbol in ("<=", ">=", "="):
+            expression = expression.split(symbol, 1)[0]
+        words = expression.split()
+        if words and words[0].startswith(("max", "min")):
+            words = words[1:]
+        return FormatUtils.tokenize_expression(" ".join(words))
 
-        return cleared_file
+    @staticmethod
+    def __warn_deprecated(name: str, replacement: str) -> None:
+        warnings.warn(f"FormatUtils.{name} está obsoleta; use FormatUtils.{replacement}.", DeprecationWarning,
+                      stacklevel=3)
 
 class LanguageUtils:
-    __language = "pt"
+    ##
+    # @class LanguageUtils
+    # @details Com o idioma `DEFERRED_LANGUAGE` no contexto, os textos não são traduzidos na hora: viram marcadores
+    # (chave e substituições entre caracteres de uso privado) que o `LatexWriter` resolve no idioma dele com
+    # `resolve_deferred_text`. Assim, um mesmo conteúdo gerado uma vez pode ser escrito em vários idiomas.
+
+    DEFERRED_LANGUAGE = "*"
+    TEXT_START, TEXT_SEPARATOR, TEXT_END = "\ue000", "\ue001", "\ue002"
+    DEFERRED_TEXT_PATTERN = re.compile("\ue000([^\ue000\ue002]*)\ue002")
 
     @staticmethod
     def get_language() -> str:
-        return LanguageUtils.__language
+        return SolveContext.get_language()
 
     @staticmethod
     def set_language(language: str) -> None:
@@ -83,18 +115,24 @@ class LanguageUtils:
             error_message = LanguageUtils.get_translated_text(
                 "language_not_found_error") + f"{', '.join(LanguageDictionary.LANGUAGE_REFERENCE.keys())}"
             raise ValueError(error_message)
-        LanguageUtils.__language = language
+        SolveContext.set_language(language)
 
     @staticmethod
     def print_translated(key: str) -> None:
-        print(LanguageUtils.get_translated_text(key))
+        print(LanguageUtils.get_translated_text(key), file=SolveContext.get_output())
 
     @staticmethod
     def get_translated_text(key: str) -> str:
-        return LanguageDictionary.get_text(key, LanguageUtils.__language)
+        language = SolveContext.get_language()
+        if language == LanguageUtils.DEFERRED_LANGUAGE:
+            return LanguageUtils.TEXT_START + key + LanguageUtils.TEXT_END
+        return LanguageDictionary.get_text(key, language)
 
     @staticmethod
     def get_translated_text_variable_text(key: str, substitution_variables: list[str]) -> str:
+        if SolveContext.get_language() == LanguageUtils.DEFERRED_LANGUAGE and len(substitution_variables) > 0:
+            return LanguageUtils.TEXT_START + LanguageUtils.TEXT_SEPARATOR.join([key] + list(substitution_variables)) \
+                + LanguageUtils.TEXT_END
         text = LanguageUtils.get_translated_text(key)
         if len(substitution_variables) == 0:
             return text
@@ -105,21 +143,50 @@ class LanguageUtils:
 
         return formatted_text
 
+    @staticmethod
+    def resolve_deferred_text(content: str, language: str) -> str:
+        ##
+        # @brief Traduz os marcadores gerados no idioma `DEFERRED_LANGUAGE`, dos mais internos para os externos.
+
+        with SolveContext(language=language):
+            while LanguageUtils.TEXT_START in content:
+                content = LanguageUtils.DEFERRED_TEXT_PATTERN.sub(LanguageUtils.__translate_marker, content)
+        return content
+
+    @staticmethod
+    def __translate_marker(match: re.Match) -> str:
+        key, *substitution_variables = match.group(1).split(LanguageUtils.TEXT_SEPARATOR)
+        return LanguageUtils.get_translated_text_variable_text(key, substitution_variables)
+
     @staticmethod
     def get_available_languages() -> list[str]:
         return list(LanguageDictionary.LANGUAGE_REFERENCE.keys())
 
 
 class FileUtils:
+    MPS_EXTENSIONS = [".mps", ".fmps", ".freemps"]
+
     @staticmethod
     def get_files(directory: str) -> list[str]:
-        files = [os.path.join(directory, f) for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
+        files = [os.path.join(directory, f) for f in sorted(os.listdir(directory))
+                 if os.path.isfile(os.path.join(directory, f)) and not f.startswith(".")]
         if not files:
             LanguageUtils.print_translated("no_files_to_solve_error")
         return files
 
+    @staticmethod
+    def is_mps_file(filename: str) -> bool:
+        return os.path.splitext(filename)[1].lower() in FileUtils.MPS_EXTENSIONS
+
 class LatexUtils:
+    SMALL_DENOMINATOR = 64
+    # Abaixo deste módulo, uma fração n/d com d <= SMALL_DENOMINATOR que reproduz o float exatamente é
+    # sempre a mesma devolvida por `Fraction.limit_denominator()`.
+    SMALL_DENOMINATOR_BOUND = 2.0 ** 20
+    INTEGER_BOUND = 2.0 ** 53
+
     @staticmethod
+    @lru_cache(maxsize=4096)
     def format_value(value: str) -> str:
         if value == "inf" or value == "-inf":
             return value
@@ -133,6 +200,57 @@ class LatexUtils:
         except ValueError:
             return LatexUtils.format_variable(value)
 
+    @staticmethod
+    def format_values(values: np.ndarray) -> np.ndarray:
+        ##
+        # @brief Formata um vetor ou matriz inteira, com o mesmo resultado de `format_value(str(x))` por elemento.
+        # @return Array de strings (`dtype=object`) com o mesmo formato da entrada.
+        # @details Vetores de `Fraction` (`dtype=object`) são escritos exatamente, com `format_fraction`.
+        # @details Valores inteiros são convertidos de uma vez; frações com denominador até `SMALL_DENOMINATOR`
+        # são encontradas testando todos os elementos por denominador. Os demais valores usam `format_value`,
+        # cujo cache guarda os valores repetidos.
+
+        values = np.asarray(values)
+        if values.dtype.kind not in "iuf":
+            return np.vectorize(LatexUtils.__format_object, otypes=[object])(values)
+
+        values = values.astype(np.float64)
+        result = np.empty(values.shape, dtype=object)
+        pending = np.isfinite(values) & (np.abs(values) < LatexUtils.INTEGER_BOUND)
+        with np.errstate(invalid="ignore"):
+            integers = pending & (values % 1 == 0)
+        result[integers] = values[integers].astype(np.int64).astype(str)
+        pending &= ~integers
+
+        pending &= np.abs(values) < LatexUtils.SMALL_DENOMINATOR_BOUND
+        for denominator in range(2, LatexUtils.SMALL_DENOMINATOR + 1):
+            if not pending.any():
+                break
+            numerators = np.round(values * denominator)
+            exact = pending & (numerators / denominator == values)
+            if exact.any():
+                result[exact] = [f"\\frac{{{numerator}}}{{{denominator}}}" for numerator in numerators[exact].astype(np.int64)]
+                pending &= ~exact
+
+        remaining = np.equal(result, None)
+        result[remaining] = [LatexUtils.format_value(str(value)) for value in values[remaining]]
+        return result
+
+    @staticmethod
+    def format_fraction(value: Fraction) -> str:
+        ##
+        # @brief Escreve uma fração exata (da aritmética exata do solver) sem passar por float.
+
+        if value.denominator == 1:
+            return str(value.numerator)
+        return f"\\frac{{{value.numerator}}}{{{value.denominator}}}"
+
+    @staticmethod
+    def __format_object(value) -> str:
+        if isinstance(value, Fraction):
+            return LatexUtils.format_fraction(value)
+        return LatexUtils.format_value(str(value))
+
     @staticmethod
     def format_string_vector(vector: list[str]) -> str:
         result = r"\{"
@@ -146,29 +264,17 @@ class LatexUtils:
 
     @staticmethod
     def format_numbers_vector(vector: np.array(np.float64)) -> str:
-        result = r"\{"
-        for i in range(len(vector)):
-            result += f"{LatexUtils.format_value(str(vector[i]))}"
-            if i < len(vector) - 1:
-                result += ", "
-
-        result += r"\}"
-        return result
+        return r"\{" + ", ".join(LatexUtils.format_values(vector)) + r"\}"
 
     @staticmethod
     def format_matrix(matrix: np.ndarray) -> str:
         result = r"\begin{bmatrix}"
 
+        formatted = LatexUtils.format_values(matrix)
         if matrix.ndim == 1:
-            result += " & ".join(LatexUtils.format_value(str(x)) for x in matrix) + r" \\"
+            result += " & ".join(formatted) + r" \\"
         else:
-            for i in range(len(matrix)):
-                for j in range(len(matrix[i])):
-                    result += f"{LatexUtils.format_value(str(matrix[i][j]))}"
-                    if j < len(matrix[i]) - 1:
-                        result += " & "
-                if i < len(matrix) - 1:
-                    result += r"\\ "
+            result += r"\\ ".join(" & ".join(row) for row in formatted)
 
         result += r"\end{bmatrix}" + "\n"
         return result
@@ -177,17 +283,24 @@ class LatexUtils:
     def format_matrices(equations: list[np.ndarray[np.float64]]) -> str:
         content = ""
         for equation in equations:
-            if len(equation) == 1:
-                content += str(equation)
+            if isinstance(equation, str):
+                content += equation
             else:
                 content += LatexUtils.format_matrix(equation)
         return content
 
     @staticmethod
     def format_problem_to_latex(objective_function: np.array(np.float64), constraint_matrix: np.ndarray[np.float64],
-                                lp_variables: list[str], restrictions_vector: np.array(np.float64), symbols: list[str], is_maximization: bool) -> str:
+                                lp_variables: list[str], restrictions_vector: np.array(np.float64), symbols: list[str], is_maximization: bool,
+                                render_policy=None) -> str:
+        ##
+        # @details Com uma `RenderPolicy`, restrições e variáveis além dos limites dela são trocadas por reticências.
 
         variables_list = LatexUtils.format_variables(lp_variables)
+        rows = min(len(constraint_matrix), len(symbols), len(restrictions_vector))
+        row_indexes, row_gap = np.arange(rows), -1
+        if render_policy is not None:
+            row_indexes, row_gap = render_policy.select(rows, render_policy.max_rows)
 
         max_or_min = "maximize_text" if is_maximization else "minimize_text"
         max_or_min = LanguageUtils.get_translated_text(max_or_min)
@@ -198,10 +311,15 @@ class LatexUtils:
         content += rf"\text{{{max_or_min}}} \quad & {objective} \\ " + "\n"
 
         content += r"\text{"+LanguageUtils.get_translated_text("subject_to_text")+r":} \quad & \\" + "\n"
-        for row, symbol, restriction_value in zip(constraint_matrix, symbols, restrictions_vector):
-            constraint_expression = LatexUtils.format_expression(variables_list, row, symbol, restriction_value)
+        for position, row_index in enumerate(row_indexes):
+            if position == row_gap:
+                content += r"\quad & \vdots \\ " + "\n"
+            constraint_expression = LatexUtils.format_expression(variables_list, constraint_matrix[row_index],
+                                                                 symbols[row_index], restrictions_vector[row_index])
             content += rf"\quad & {constraint_expression} \\ " + "\n"
 
+        if render_policy is not None:
+            variables_list = render_policy.elide_list(variables_list)
         non_negativity = r"\quad &"
         for i in range(len(variables_list)):
             non_negativity += variables_list[i]
@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+import Cli
+from Solver import SolverOptions
+from Utils import LanguageUtils
+
+SOURCE_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def test_cli_startup_does_not_import_heavy_modules():
+    script = ("import sys, time; start = time.perf_counter(); import Cli; Cli.build_parser(); "
+              "print(time.perf_counter() - start); "
+              "print(any(name in sys.modules for name in ['numpy', 'LanguageDictionary', 'LatexWriter', 'Solver']))")
+    output = subprocess.run([sys.executable, "-c", script], cwd=SOURCE_DIRECTORY, capture_output=True,
+                            text=True, check=True).stdout.split()
+    help_start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "Cli", "--help"], cwd=SOURCE_DIRECTORY, capture_output=True, check=True)
+    help_elapsed = time.perf_counter() - help_start
+
+    # Os tempos dependem da máquina: são apenas registrados (visíveis com `pytest -s`), com um limite folgado.
+    print(f"Cli: import + parser em {float(output[0]):.3f}s, --help em {help_elapsed:.3f}s")
+    assert output[1] == "False"
+    assert float(output[0]) < 5.0
+
+
+def test_cli_choices_match_the_source_modules():
+    assert Cli.LANGUAGES == LanguageUtils.get_available_languages()
+    assert Cli.PRICING_RULES == SolverOptions.PRICING_RULES
+    assert Cli.ARITHMETIC_MODES == SolverOptions.ARITHMETIC_MODES
+
+
+def test_cli_solves_globs_and_reports_errors(setup_test_files, tmp_path, capsys):
+    test_directory, _ = setup_test_files
+    (tmp_path / "broken.lp").write_text("3x + 5y\nx + y <= 4\nx, y >= 0\n")
+    output = str(tmp_path / "results.jsonl")
+
+    code = Cli.main([os.path.join(test_directory, "default.lp"), os.path.join(test_directory, "unb*.lp"),
+                     str(tmp_path / "broken.lp"), "--format", "jsonl", "--output", output, "--language", "en"])
+    with open(output, encoding="utf-8") as file:
+        records = [json.loads(line) for line in file]
+
+    assert code == 1
+    assert [record["status"] for record in records] == ["optimal", "unbounded", "error"]
+    assert Cli.main([os.path.join(test_directory, "missing*.lp")]) == 2
+
+
+def test_cli_infers_results_format_from_output_extension(setup_test_files, tmp_path):
+    file_path = os.path.join(setup_test_files[0], "default.lp")
+    for filename in ["results.jsonl", "results.csv"]:
+        assert Cli.main([file_path, "-o", str(tmp_path / filename)]) == 0
+    with open(tmp_path / "results.jsonl", encoding="utf-8") as file:
+        assert json.loads(file.readline())["status"] == "optimal"
+    with open(tmp_path / "results.csv", encoding="utf-8") as file:
+        assert file.readline().startswith("file,status")
+
+    with pytest.raises(SystemExit) as error:
+        Cli.main([file_path, "--format", "text", "-o", str(tmp_path / "results.txt")])
+    assert error.value.code == 2
+
+
+def _write_identity_problem(directory, size: int) -> str:
+    variables = [f"x_{i + 1}" for i in range(size)]
+    lines = ["max " + " + ".join(variables)] + [f"{variable} <= 1" for variable in variables]
+    filename = str(directory / f"identity_{size}.lp")
+    with open(filename, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines + [", ".join(variables) + " >= 0"]))
+    return filename
+
+
+def test_cli_render_policy_flags_bound_the_document_size(tmp_path):
+    sizes = {}
+    runs = [(40, []), (40, ["--compact"]), (80, ["--compact"]), (80, ["--max-rows", "8", "--detail-every", "40"])]
+    for size, flags in runs:
+        output_directory = tmp_path / f"{size}_{len(flags)}"
+        output_directory.mkdir()
+        arguments = [_write_identity_problem(tmp_path, size), "--show-steps", "-d", str(output_directory), "-o",
+                     str(output_directory / "results.jsonl")] + flags
+        assert Cli.main(arguments) == 0
+        build_directory = output_directory / "pt" / ".build"
+        sizes[size, len(flags)] = sum(file.stat().st_size for file in build_directory.glob("*.tex"))
+
+    assert sizes[40, 1] * 10 < sizes[40, 0]
+    assert sizes[80, 1] < 3 * sizes[40, 1]
+    assert sizes[80, 4] < sizes[40, 0]
+
+    parser = Cli.build_parser()
+    assert Cli.get_render_policy(parser.parse_args(["a.lp"])) is None
+    policy = Cli.get_render_policy(parser.parse_args(["a.lp", "--detail-every", "5"]))
+    assert (policy.max_rows, policy.full_iterations, policy.every_iterations) == (None, 1, 5)
+    with pytest.raises(SystemExit):
+        parser.parse_args(["a.lp", "--max-rows", "0"])
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+from Concurrent import ConcurrentSolver
+from Parser import FileParser
+from Solver import SolverOptions
+
+
+@pytest.mark.parametrize("filename,expected_status", [
+    ("default.lp", "optimal"),
+    ("unbounded.lp", "unbounded"),
+    ("infeasible.lp", "infeasible/phase_1"),
+])
+def test_concurrent_solver_returns_first_conclusive_result(setup_test_files, filename, expected_status):
+    test_directory, _ = setup_test_files
+    data = FileParser(os.path.join(test_directory, filename)).parse_file()
+
+    result = ConcurrentSolver(timeout=30).solve(data)
+
+    assert result["status"] == expected_status
+    assert result["strategy"] in ConcurrentSolver.DEFAULT_STRATEGIES
+
+
+def test_concurrent_solver_skips_inconclusive_strategies(setup_test_files):
+    test_directory, _ = setup_test_files
+    data = FileParser(os.path.join(test_directory, "four_vars.lp")).parse_file()
+    strategies = {
+        "too_short": SolverOptions(max_iterations=0),
+        "dantzig": SolverOptions(),
+    }
+
+    result = ConcurrentSolver(strategies, timeout=30).solve(data)
+
+    assert result["strategy"] == "dantzig"
+    assert result["solution"]["x1"] == pytest.approx(11.42857, rel=1e-5)
+
+
+class ExitingOptions(SolverOptions):
+    # Simula um processo morto pelo sistema (sem exceção nem resultado publicado) assim que a resolução começa.
+    @property
+    def max_iterations(self):
+        os._exit(1)
+
+    @max_iterations.setter
+    def max_iterations(self, value):
+        pass
+
+
+def test_concurrent_solver_does_not_wait_for_crashed_workers(setup_test_files):
+    test_directory, _ = setup_test_files
+    data = FileParser(os.path.join(test_directory, "four_vars.lp")).parse_file()
+
+    result = ConcurrentSolver({"crash": ExitingOptions()}).solve(data)
+    assert result["strategy"] == "crash" and result["status"] == "error"
+
+    result = ConcurrentSolver({"crash": ExitingOptions(), "dantzig": SolverOptions()}).solve(data)
+    assert result["strategy"] == "dantzig" and result["status"] == "optimal"
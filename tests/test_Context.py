@@ -0,0 +1,50 @@
+import io
+import os
+import threading
+
+from Context import SolveContext
+from LatexWriter import LatexWriter
+from Utils import LanguageUtils
+from Solver import RevisedSimplex
+
+
+def test_solve_context_restores_previous_values():
+    previous_language = LanguageUtils.get_language()
+    with SolveContext(language="es"):
+        assert LanguageUtils.get_language() == "es"
+        with SolveContext(language="en"):
+            assert LanguageUtils.get_translated_text("max_text") == "Maximum"
+        assert LanguageUtils.get_language() == "es"
+    assert LanguageUtils.get_language() == previous_language
+
+
+def test_concurrent_solves_keep_their_own_language_and_output(setup_test_files):
+    test_directory, _ = setup_test_files
+    outputs = {language: io.StringIO() for language in ["pt", "en", "es"]}
+    barrier = threading.Barrier(len(outputs))
+
+    def solve(language):
+        with SolveContext(language=language, output=outputs[language]):
+            barrier.wait()
+            for _ in range(20):
+                RevisedSimplex(os.path.join(test_directory, "default.lp")).solve(show_steps=False)
+
+    threads = [threading.Thread(target=solve, args=(language,)) for language in outputs]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for language, output in outputs.items():
+        with SolveContext(language=language):
+            expected = LanguageUtils.get_translated_text("optimal_solution_found")
+        assert output.getvalue().count(expected) == 20
+
+
+def test_latex_writer_uses_context_output_directory(tmp_path):
+    os.makedirs(tmp_path / "en")
+    writer = LatexWriter("problem", language="en", output_directory=f"{tmp_path}/")
+    writer.close()
+
+    assert writer.filename == f"{tmp_path}/en/problem_solution.tex"
+    assert os.path.exists(writer.filename)
@@ -0,0 +1,67 @@
+import io
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from Context import SolveContext
+from Exact import FractionFreeBasis, get_fraction_array, invert_fraction_free, to_fraction_array
+from LatexWriter import LatexWriter
+from Solver import RevisedSimplex, SolverOptions
+
+
+def test_fraction_free_inverse_and_basis_updates_are_exact():
+    rng = np.random.default_rng(3)
+    for _ in range(50):
+        matrix = rng.integers(-5, 6, size=(4, 4))
+        if round(np.linalg.det(matrix)) == 0:
+            continue
+        adjugate, determinant = invert_fraction_free(matrix.astype(object))
+        assert abs(determinant) == abs(round(np.linalg.det(matrix)))
+        assert (matrix.astype(object) @ get_fraction_array(adjugate, determinant) == np.eye(4)).all()
+
+    constraint_matrix = np.hstack((rng.integers(1, 9, size=(3, 4)) / 10, np.eye(3)))
+    costs = np.array([0.5, 0.25, 1.0, 0.1, 0, 0, 0])
+    basis = FractionFreeBasis(constraint_matrix, np.ones(3), costs, [4, 5, 6])
+    for position, column in [(0, 0), (1, 1), (2, 2), (0, 3)]:
+        if basis.get_direction(column)[position, 0] == 0:
+            continue
+        basis.replace(position, column)
+        inverse = basis.get_inverse()
+        assert (to_fraction_array(constraint_matrix)[:, basis.basic_indexes] @ inverse == np.eye(3)).all()
+        assert (basis.get_duals() == to_fraction_array(costs)[basis.basic_indexes] @ inverse).all()
+
+
+def test_exact_arithmetic_avoids_float_drift(tmp_path):
+    data = {"lp_variables": ["x_1", "x_2", "x_3"], "constraint_matrix": np.array([[0.2, 0.1, 0.1], [0.4, 0.1, 0.1], [0.3, 0.6, 0.5]]),
+            "is_maximization": True, "objective_function": np.array([0.6, 0.9, 0.8]),
+            "restrictions_vector": np.array([0.3, 0.9, 0.7]), "symbols": ["<="] * 3}
+    (tmp_path / "pt").mkdir()
+    with SolveContext(language="pt", output=io.StringIO(), output_directory=str(tmp_path) + "/"):
+        writer = LatexWriter("exato")
+        solver = RevisedSimplex(data=data, latex_writer=writer, options=SolverOptions(arithmetic="exact"))
+        solver._setup_support_variables()
+        solver.solve(show_steps=True)
+        writer.close()
+
+    assert solver.status == "optimal"
+    assert solver.get_objective_value() == pytest.approx(44 / 35)
+    assert min(solver.variable_values) >= 0
+    assert r"= $\frac{44}{35}$" in open(writer.filename, encoding="utf-8").read()
+
+
+def test_exact_arithmetic_matches_float_on_fixtures(setup_test_files):
+    test_directory, _ = setup_test_files
+    for filename in ["default.lp", "equalities.lp", "degenerate.lp", "unbounded.lp", "infeasible.lp"]:
+        results = []
+        for arithmetic in ["float", "exact"]:
+            with SolveContext(output=io.StringIO()):
+                solver = RevisedSimplex(f"{test_directory}/{filename}", options=SolverOptions(arithmetic=arithmetic))
+                solver.solve()
+            results.append((solver.status, solver.basis, solver.current_interaction))
+            if solver.status in ("optimal", "degenerate"):
+                assert Fraction(solver.get_objective_value()).limit_denominator() == Fraction(
+                    float(solver.get_objective_value())).limit_denominator()
+        assert results[0] == results[1]
+
+    with pytest.raises(ValueError):
+        SolverOptions(pricing="steepest_edge", arithmetic="exact")
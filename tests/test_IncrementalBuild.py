@@ -0,0 +1,145 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from Context import SolveContext
+from IncrementalBuild import IncrementalBatchBuilder
+from LatexWriter import LatexWriter
+from ProblemCache import ProblemCache
+from ResultsWriter import ResultsWriter
+from Solver import RevisedSimplex
+
+
+def test_incremental_build_matches_single_writer_and_skips_unchanged(setup_test_files, tmp_path):
+    test_directory, _ = setup_test_files
+    inputs = []
+    for filename in ["default.lp", "equalities.lp", "degenerate.lp"]:
+        shutil.copy(os.path.join(test_directory, filename), tmp_path / filename)
+        inputs.append(str(tmp_path / filename))
+    output_directory = str(tmp_path / "output") + "/"
+    os.makedirs(output_directory + "en")
+
+    with SolveContext(language="en", output_directory=output_directory):
+        writer = LatexWriter("reference")
+        solver = RevisedSimplex("", True, writer)
+        for i, input_file in enumerate(inputs):
+            solver.reload_problem(input_file)
+            solver.solve(True)
+            if i < len(inputs) - 1:
+                solver.set_next_exercise()
+        writer.close()
+
+    builder = IncrementalBatchBuilder(inputs, language="en", output_directory=output_directory, inline_fragments=True)
+    output_file = builder.build()
+    with open(writer.filename, encoding="utf-8") as reference, open(output_file, encoding="utf-8") as built:
+        assert built.read() == reference.read()
+    assert builder.rebuilt == inputs
+
+    builder.build()
+    assert builder.rebuilt == []
+
+    with open(inputs[0], encoding="utf-8") as file:
+        content = file.read()
+    with open(inputs[0], "w", encoding="utf-8") as file:
+        file.write(content.replace("max 3x + 5y", "max 3x + 6y"))
+    builder.build()
+    assert builder.rebuilt == [inputs[0]]
+    assert builder.reused == inputs[1:]
+
+
+def test_incremental_build_streams_results_for_reused_fragments(setup_test_files, tmp_path):
+    test_directory, _ = setup_test_files
+    inputs = [os.path.join(test_directory, filename) for filename in ["default.lp", "three_vars.lp"]]
+    output_directory = str(tmp_path) + "/"
+
+    for run in range(3):
+        results_file = str(tmp_path / f"results_{run}.jsonl")
+        with ResultsWriter(results_file) as writer:
+            IncrementalBatchBuilder(inputs, language="pt", output_directory=output_directory,
+                                    results_writer=writer).build()
+        with open(results_file, encoding="utf-8") as file:
+            records = [json.loads(line) for line in file]
+        assert [record["status"] for record in records] == ["optimal", "degenerate"]
+        assert records[0]["timings"].get("cached", False) == (run > 0)
+
+        with open(tmp_path / "pt" / ".build" / "manifest.json", encoding="utf-8") as file:
+            manifest = json.load(file)
+        assert all("cached" not in record["result"]["timings"] for record in manifest.values())
+
+
+def test_multi_language_build_solves_once_and_matches_single_language_builds(setup_test_files, tmp_path, monkeypatch):
+    test_directory, _ = setup_test_files
+    inputs = [os.path.join(test_directory, filename) for filename in ["default.lp", "equalities.lp"]]
+    solves = []
+    original_solve = RevisedSimplex.solve
+    monkeypatch.setattr(RevisedSimplex, "solve", lambda self, *args, **kwargs: solves.append(1) or original_solve(self, *args, **kwargs))
+
+    builder = IncrementalBatchBuilder(inputs, output_directory=str(tmp_path / "all") + "/", languages=["pt", "en", "es"],
+                                      inline_fragments=True)
+    builder.build()
+    assert len(solves) == len(inputs)
+    assert sorted(builder.output_files) == ["en", "es", "pt"]
+
+    for language, output_file in builder.output_files.items():
+        single = IncrementalBatchBuilder(inputs, language=language, output_directory=str(tmp_path / language) + "/",
+                                         inline_fragments=True)
+        with open(single.build(), encoding="utf-8") as reference, open(output_file, encoding="utf-8") as built:
+            assert built.read() == reference.read()
+    assert "Iteration 1" in open(builder.output_files["en"], encoding="utf-8").read()
+
+
+
+def test_master_document_inputs_fragments_in_order_and_parallel_build_matches(setup_test_files, tmp_path):
+    test_directory, _ = setup_test_files
+    inputs = [os.path.join(test_directory, filename) for filename in ["default.lp", "equalities.lp", "unbounded.lp"]]
+
+    serial = IncrementalBatchBuilder(inputs, language="pt", output_directory=str(tmp_path / "serial") + "/")
+    output_file = serial.build()
+    with open(output_file, encoding="utf-8") as file:
+        content = file.read()
+    manifest = json.load(open(os.path.join(os.path.dirname(output_file), ".build", "manifest.json"), encoding="utf-8"))
+    fragments = [manifest[input_file]["fragment"] for input_file in inputs]
+    inputs_lines = [line for line in content.splitlines() if line.startswith(r"\input{")]
+    assert inputs_lines == [r"\input{.build/" + os.path.basename(fragment) + "}" for fragment in fragments]
+    assert content.endswith(r"\end{document}")
+
+    parallel = IncrementalBatchBuilder(inputs, language="pt", output_directory=str(tmp_path / "parallel") + "/", jobs=2)
+    parallel.build()
+    assert parallel.rebuilt == inputs
+    assert [result["status"] for result in parallel.results] == [result["status"] for result in serial.results]
+    for input_file in inputs:
+        with open(manifest[input_file]["fragment"], encoding="utf-8") as expected, \
+                open(manifest[input_file]["fragment"].replace("serial", "parallel"), encoding="utf-8") as built:
+            assert built.read() == expected.read()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_failing_input_is_recorded_as_error_and_build_continues(setup_test_files, tmp_path, jobs):
+    test_directory, _ = setup_test_files
+    broken = tmp_path / "broken.lp"
+    broken.write_text("garbage\n", encoding="utf-8")
+    inputs = [os.path.join(test_directory, "default.lp"), str(broken), os.path.join(test_directory, "equalities.lp")]
+    cache = ProblemCache(str(tmp_path / "cache"))
+
+    reported = []
+    manifest_file = tmp_path / "output" / "pt" / ".build" / "manifest.json"
+    builder = IncrementalBatchBuilder(inputs, language="pt", output_directory=str(tmp_path / "output") + "/",
+                                      problem_cache=cache, jobs=jobs, on_result=lambda input_file, result:
+                                      reported.append((input_file, result["status"], manifest_file.exists())))
+    output_file = builder.build()
+
+    assert reported == [(inputs[0], "optimal", False), (str(broken), "error", False), (inputs[2], "optimal", False)]
+    assert builder.failed == [str(broken)]
+    assert builder.rebuilt == [inputs[0], inputs[2]]
+    assert [result["status"] for result in builder.results] == ["optimal", "error", "optimal"]
+    assert builder.results[1]["file"] == "broken.lp" and builder.results[1]["error"]
+    with open(output_file, encoding="utf-8") as file:
+        assert sum(line.startswith(r"\input{") for line in file) == 2
+    build_directory = os.path.join(os.path.dirname(output_file), ".build")
+    manifest = json.load(open(os.path.join(build_directory, "manifest.json"), encoding="utf-8"))
+    assert sorted(manifest) == sorted([inputs[0], inputs[2]])
+    assert sorted(os.listdir(build_directory)) == sorted(["manifest.json"] + [
+        os.path.basename(record["fragment"]) for record in manifest.values()])
+    assert len(os.listdir(str(tmp_path / "cache"))) == 2
@@ -0,0 +1,56 @@
+import json
+import os
+
+import pytest
+from Context import SolveContext
+from Instrumentation import SolverInstrumentation
+from LatexWriter import LatexWriter
+from Solver import RevisedSimplex, SolverOptions
+
+
+@pytest.mark.parametrize("arithmetic", ["float", "exact"])
+@pytest.mark.parametrize("filename", ["default.lp", "equalities.lp", "degenerate.lp"])
+def test_instrumentation_counts_and_times_each_stage(setup_test_files, filename, arithmetic):
+    file_path = os.path.join(setup_test_files[0], filename)
+    calls = []
+    solver = RevisedSimplex(file_path, options=SolverOptions(arithmetic=arithmetic), quiet=True)
+    instrumentation = solver.set_instrumentation(SolverInstrumentation(lambda stats: calls.append(
+        stats.counters["iterations"]), every_iterations=2))
+    events = list(solver.iterate())
+
+    data = json.loads(instrumentation.to_json())
+    assert data["counters"]["iterations"] == solver.current_interaction
+    assert sum(phase["iterations"] for phase in data["phases"].values()) == solver.current_interaction
+    assert data["counters"]["degenerate_pivots"] == sum(event.step_length == 0 for event in events)
+    if arithmetic == "float":
+        assert data["counters"]["refactorizations"] == solver.current_interaction
+    else:
+        assert data["counters"]["refactorizations"] == len(data["phases"])
+    assert set(data["stages"]) == set(SolverInstrumentation.STAGES)
+    assert data["total"] == pytest.approx(sum(phase["total"] for phase in data["phases"].values()))
+    assert all(value >= 0 for value in data["stages"].values()) and data["stages"]["pricing"] > 0
+    assert calls == [iteration for iteration in range(2, solver.current_interaction + 1, 2)
+                     if any(event.iteration == iteration for event in events)]
+
+    solver.reload_problem(file_path)
+    solver.solve()
+    assert instrumentation.counters["iterations"] == solver.current_interaction
+
+
+def test_instrumentation_writes_latex_appendix(setup_test_files, tmp_path):
+    (tmp_path / "en").mkdir()
+    with SolveContext(language="en", output_directory=str(tmp_path) + "/"):
+        writer = LatexWriter("stats")
+        solver = RevisedSimplex("", True, writer)
+        solver.set_instrumentation(SolverInstrumentation(latex_appendix=True))
+        solver.reload_problem(os.path.join(setup_test_files[0], "equalities.lp"))
+        solver.solve(True)
+        writer.close()
+
+    content = open(writer.filename, encoding="utf-8").read()
+    appendix = content[content.index(r"\subsection{Solver statistics}"):]
+    assert r"\texttt{ratio\_test}" in appendix and r"\texttt{refactorizations}" in appendix
+    assert "Phase 1 & Phase 2 & Total" in appendix
+
+    with pytest.raises(ValueError):
+        SolverInstrumentation(every_iterations=0)
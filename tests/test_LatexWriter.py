@@ -0,0 +1,89 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from Context import SolveContext
+from LatexWriter import AsyncLatexWriter, LatexWriter
+
+
+def write_sample(writer, matrix):
+    writer.write(r"\section{Teste}")
+    writer.write_matrices_with_labels(["A"], [matrix])
+    matrix[:] = -1
+    writer.write_matrix_equations("x", [matrix, "-", np.ones(2)], matrix[:, 0])
+    writer.break_page()
+    writer.close()
+
+
+def test_async_writer_matches_synchronous_output(tmp_path):
+    (tmp_path / "pt").mkdir()
+    with SolveContext(language="pt", output_directory=str(tmp_path) + "/"):
+        writers = [LatexWriter("sync"), AsyncLatexWriter("async", queue_size=1)]
+    for writer in writers:
+        write_sample(writer, np.array([[0.5, 2.0], [1.0, 0.25]]))
+
+    contents = [open(writer.filename, encoding="utf-8").read() for writer in writers]
+    assert contents[0] == contents[1]
+    assert r"\frac{1}{2}" in contents[1]
+
+
+def test_async_writer_reports_errors_and_closes_file(tmp_path):
+    (tmp_path / "pt").mkdir()
+    with SolveContext(language="pt", output_directory=str(tmp_path) + "/"):
+        writer = AsyncLatexWriter("error")
+    writer.write_matrices_with_labels(["A", "b"], [np.eye(2)])
+    with pytest.raises(ValueError):
+        writer.flush()
+    with pytest.raises(ValueError):
+        writer.close()
+    assert writer.file.closed
+    assert not writer.worker.is_alive()
+
+
+class UncopiableArray(np.ndarray):
+    def copy(self, order="C"):
+        raise AssertionError("campo não usado no resumo foi copiado")
+
+
+def test_async_writer_copies_only_the_summarized_iteration_fields(tmp_path):
+    (tmp_path / "pt").mkdir()
+    with SolveContext(language="pt", output_directory=str(tmp_path) + "/"):
+        writers = [LatexWriter("sync"), AsyncLatexWriter("async")]
+    y = np.array([[2.0], [0.5]])
+    step = {"detailed": False, "phase": 2, "iteration": 3, "entering": 0, "leaving": 1,
+            "basis": ["x1", "s_2"], "non_basis": ["x2", "s_1"], "y": y, "inv_b": np.eye(2).view(UncopiableArray),
+            "a_n": np.ones((2, 2)).view(UncopiableArray)}
+    for writer in writers:
+        writer.write_iteration(step)
+        y[:] = -1
+        writer.close()
+        y[:] = [[2.0], [0.5]]
+
+    contents = [open(writer.filename, encoding="utf-8").read() for writer in writers]
+    assert contents[0] == contents[1]
+
+
+def test_async_writer_drains_pending_tasks_at_exit_without_close(tmp_path):
+    (tmp_path / "pt").mkdir()
+    script = ("from Context import SolveContext\n"
+              "from LatexWriter import AsyncLatexWriter\n"
+              f"with SolveContext(language='pt', output_directory={str(tmp_path) + '/'!r}):\n"
+              "    writer = AsyncLatexWriter('exit')\n"
+              "for i in range(2000):\n"
+              "    writer.write(f'linha {i}')\n"
+              "print(writer.filename)\n")
+    source_directory = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    filename = subprocess.run([sys.executable, "-c", script], cwd=source_directory, capture_output=True, text=True,
+                              check=True).stdout.strip()
+
+    content = open(filename, encoding="utf-8").read()
+    assert content.rstrip().endswith("linha 1999")
+    assert r"\end{document}" not in content
+
+    with SolveContext(language="pt", output_directory=str(tmp_path) + "/"):
+        with AsyncLatexWriter("with") as writer:
+            writer.write("linha")
+    assert open(writer.filename, encoding="utf-8").read().endswith(r"\end{document}")
+    assert not writer.worker.is_alive()
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from Model import GrowableArray, Model
+
+
+def test_model_matches_dense_solver():
+    model = Model(is_maximization=True, capacity=1)
+    model.add_variables(2, cost=[3, 5], names=["x", "y"])
+    model.add_constraints([[1, 1]], "<=", 4)
+    model.add_constraints(([0, 0], [0, 1], [2, 3]), ["<="], [9])
+    solver = model.to_solver()
+    solver.solve(show_steps=False)
+
+    assert solver.status == "optimal"
+    assert solver.get_solution()["y"] == pytest.approx(3)
+    assert model.rows.buffer.size >= model.rows.size == 4
+
+
+def test_model_bounds_become_constraints():
+    model = Model(is_maximization=True)
+    model.add_variables(2, lb=[1, 0], ub=[np.inf, 2], cost=[1, 1])
+    model.add_constraints(np.array([[1, 2]]), "<=", 10)
+
+    data = model.to_data()
+    assert data["symbols"] == ["<=", "<=", ">="]
+    assert list(data["restrictions_vector"]) == [10, 2, 1]
+
+    solver = model.to_solver()
+    solver.solve(show_steps=False)
+    assert solver.get_solution()["x1"] == pytest.approx(10)
+    assert solver.get_solution()["x2"] == pytest.approx(0)
+
+
+@pytest.mark.parametrize("arguments", [
+    {"A_block": [[1, 1, 1]], "sense": "<=", "rhs": 1},
+    {"A_block": [[1, 1]], "sense": "<", "rhs": 1},
+    {"A_block": ([0], [5], [1.0]), "sense": "<=", "rhs": 1},
+])
+def test_model_rejects_invalid_constraints(arguments):
+    model = Model()
+    model.add_variables(2)
+    with pytest.raises(ValueError):
+        model.add_constraints(**arguments)
+
+
+def test_growable_array_doubles_capacity():
+    array = GrowableArray(np.int64, capacity=2)
+    array.extend([1, 2, 3])
+    assert array.buffer.size == 4
+    array.extend(np.arange(10))
+    assert array.view().tolist() == [1, 2, 3] + list(range(10))
+
+
+def test_variable_names_must_be_unique():
+    model = Model()
+    model.add_variables(1, names=["x2"])
+    with pytest.raises(ValueError):
+        model.add_variables(1)
+    with pytest.raises(ValueError):
+        model.add_variables(2, names=["y", "y"])
+    with pytest.raises(ValueError):
+        model.add_variables(1, names=["x2"])
+    model.add_variables(1, names=["y"])
+    assert model.names == ["x2", "y"]
+    assert model.cost.view().size == 2
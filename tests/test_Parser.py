@@ -1,7 +1,8 @@
-from src.Parser import *
+from Parser import *
 import os
 import numpy as np
 import pytest
+from MpsParser import MpsParser, MpsWriter
 
 POSITIVE_INFINITY = np.inf
 NEGATIVE_INFINITY = -np.inf
@@ -88,3 +89,102 @@ def test_parse_problem_with_degenerate_case(setup_test_files):
     np.testing.assert_array_almost_equal(parsed["constraint_matrix"], np.array([[1, 1], [1, 0], [0, 1]], dtype=np.float64))
     np.testing.assert_array_equal(parsed["restrictions_vector"], np.array([2, 1, 1], dtype=np.float64))
     assert parsed["symbols"] == ["<=", "<=", "<="]
+
+
+def test_parse_content_coefficient_forms():
+    parsed = FileParser("").parse_content("""max 2 x - -3y + 1.5z
+# comentário
+x + y <= 4 # primeira restrição
+-2x + 0.5y - z >= 1
+x + y <= 4
+x, y, z >= 0""")
+
+    assert parsed["lp_variables"] == ["x", "y", "z"]
+    np.testing.assert_array_equal(parsed["objective_function"], np.array([2, 3, 1.5]))
+    np.testing.assert_array_equal(parsed["constraint_matrix"], np.array([[1, 1, 0], [-2, 0.5, -1]]))
+    np.testing.assert_array_equal(parsed["restrictions_vector"], np.array([4, 1]))
+    assert parsed["symbols"] == ["<=", ">="]
+
+
+def test_parse_content_requires_objective_sense():
+    with pytest.raises(ValueError):
+        FileParser("").parse_content("3x + 5y\nx <= 1\nx >= 0")
+
+
+def test_mps_round_trip(setup_test_files, tmp_path):
+    test_directory, _ = setup_test_files
+    parsed = FileParser(os.path.join(test_directory, "mixed_vars.lp")).parse_file()
+
+    MpsWriter.write(str(tmp_path / "mixed_vars.mps"), parsed)
+    reparsed = MpsParser(str(tmp_path / "mixed_vars.mps")).parse_file()
+
+    assert reparsed["lp_variables"] == parsed["lp_variables"]
+    assert reparsed["is_maximization"] is True
+    assert reparsed["symbols"] == parsed["symbols"]
+    np.testing.assert_array_equal(reparsed["constraint_matrix"], parsed["constraint_matrix"])
+    np.testing.assert_array_equal(reparsed["objective_function"], parsed["objective_function"])
+    np.testing.assert_array_equal(reparsed["restrictions_vector"], parsed["restrictions_vector"])
+
+
+def test_mps_writer_keeps_empty_columns_and_rejects_names_with_spaces(tmp_path):
+    data = {"lp_variables": ["x", "unused", "y"], "constraint_matrix": np.array([[1.0, 0.0, 2.0]]),
+            "is_maximization": False, "objective_function": np.array([1.0, 0.0, 0.0]),
+            "restrictions_vector": np.array([4.0]), "symbols": ["<="]}
+    MpsWriter.write(str(tmp_path / "empty_column.mps"), data)
+    reparsed = MpsParser(str(tmp_path / "empty_column.mps")).parse_file()
+
+    assert reparsed["lp_variables"] == ["x", "unused", "y"]
+    np.testing.assert_array_equal(reparsed["constraint_matrix"], data["constraint_matrix"])
+    np.testing.assert_array_equal(reparsed["objective_function"], data["objective_function"])
+
+    with pytest.raises(ValueError):
+        MpsWriter.write(str(tmp_path / "spaces.mps"), dict(data, lp_variables=["x", "my var", "y"]))
+
+
+def test_free_mps_ranges_and_bounds():
+    parsed = MpsParser("").parse_content("""NAME example
+* comentário
+ROWS
+ N obj
+ L lim1
+ E lim2
+COLUMNS
+ x obj 1 lim1 1
+ x lim2 1
+ y obj 2 lim2 1
+RHS
+ RHS lim1 4 lim2 3
+RANGES
+ RNG lim2 2
+BOUNDS
+ UP BND x 2
+ LO BND y 1
+ENDATA""")
+
+    assert parsed["lp_variables"] == ["x", "y"]
+    assert parsed["is_maximization"] is False
+    assert parsed["symbols"] == ["<=", ">=", "<=", "<=", ">="]
+    np.testing.assert_array_equal(parsed["restrictions_vector"], np.array([4, 3, 5, 2, 1]))
+    np.testing.assert_array_equal(parsed["constraint_matrix"], np.array([[1, 0], [1, 1], [1, 1], [1, 0], [0, 1]]))
+
+
+def test_mps_rejects_free_variables():
+    with pytest.raises(ValueError):
+        MpsParser("").parse_content("ROWS\n N obj\n L c\nCOLUMNS\n x obj 1 c 1\nBOUNDS\n FR BND x\nENDATA")
+
+
+@pytest.mark.parametrize("columns, bounds", [
+    (" MARKER 'MARKER' 'INTORG'\n x obj 1 c 1\n MARKER 'MARKER' 'INTEND'\n", ""),
+    (" x obj 1 c 1\n", "BOUNDS\n BV BND x\n"),
+    (" x obj 1 c 1\n", "BOUNDS\n UI BND x 3\n"),
+    (" x obj 1 c 1\n", "BOUNDS\n LI BND x 1\n"),
+])
+def test_mps_rejects_integer_variables_unless_relaxed(columns, bounds):
+    content = "ROWS\n N obj\n L c\nCOLUMNS\n" + columns + "RHS\n RHS c 4\n" + bounds + "ENDATA"
+    with pytest.raises(ValueError):
+        MpsParser("").parse_content(content)
+
+    with pytest.warns(UserWarning, match="relaxação linear"):
+        parsed = MpsParser("", relax_integrality=True).parse_content(content)
+    assert parsed["lp_variables"] == ["x"]
+    assert len(parsed["symbols"]) == (1 if bounds == "" else 2)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+from Pricing import BlockPricer
+from Solver import RevisedSimplexWithoutFile, SolverOptions
+
+
+def test_block_pricer_reduction_is_independent_of_thread_count():
+    rng = np.random.default_rng(7)
+    constraint_matrix = rng.integers(0, 3, size=(5, 200)).astype(np.float64)
+    profit_vector = -rng.integers(0, 4, size=200).astype(np.float64)
+    p_t = np.zeros(5)
+    non_basic_indexes = list(range(200))
+
+    expected = BlockPricer(block_size=200).price(profit_vector, p_t, np.eye(5), constraint_matrix, non_basic_indexes)
+    with BlockPricer(threads=4, block_size=16) as pricer:
+        reduced_costs, index, ties = pricer.price(profit_vector, p_t, np.eye(5), constraint_matrix, non_basic_indexes)
+
+    np.testing.assert_array_equal(reduced_costs, expected[0])
+    assert index == expected[1] == int(np.argmin(profit_vector))
+    assert ties == expected[2] == int(np.count_nonzero(profit_vector == profit_vector.min()))
+
+
+def test_block_pricer_without_negative_costs():
+    reduced_costs, index, ties = BlockPricer().price(np.ones(3), np.zeros(2), np.eye(2), np.ones((2, 3)), [0, 1, 2])
+    np.testing.assert_array_equal(reduced_costs, np.ones(3))
+    assert index == -1 and ties == 0
+
+
+@pytest.mark.parametrize("pricing", ["dantzig", "steepest_edge"])
+def test_threaded_pricing_matches_serial_solve(pricing):
+    rng = np.random.default_rng(11)
+    constraint_matrix = rng.integers(1, 10, size=(8, 300)).astype(np.float64)
+    objective = rng.integers(1, 5, size=300).astype(np.float64)
+    restrictions = rng.integers(50, 100, size=8).astype(np.float64)
+
+    results = []
+    for threads in [1, 4]:
+        options = SolverOptions(pricing=pricing, pricing_threads=threads, pricing_block_size=32)
+        solver = RevisedSimplexWithoutFile(objective.copy(), constraint_matrix, True, restrictions, ["<="] * 8, options)
+        solver.solve(show_steps=False)
+        results.append((solver.status, list(solver.basis), solver.current_interaction))
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("threads", [1, 3])
+def test_steepest_edge_updated_weights_match_recomputed_weights(monkeypatch, threads):
+    rng = np.random.default_rng(5)
+    constraint_matrix = rng.normal(size=(12, 40))
+    objective = rng.normal(size=40)
+    restrictions = rng.uniform(1, 10, size=12)
+    symbols = ["<="] * 11 + [">="]
+
+    checked = []
+    original_price = BlockPricer.price
+
+    def checked_price(pricer, profit_vector, p_t, inv_b, matrix, non_basic_indexes):
+        result = original_price(pricer, profit_vector, p_t, inv_b, matrix, non_basic_indexes)
+        edge_directions = inv_b @ matrix[:, non_basic_indexes]
+        np.testing.assert_allclose(pricer.weights[non_basic_indexes],
+                                   1 + np.sum(edge_directions * edge_directions, axis=0), rtol=1e-8)
+        checked.append(pricer.pending_update is None)
+        return result
+
+    monkeypatch.setattr(BlockPricer, "price", checked_price)
+    options = SolverOptions(pricing="steepest_edge", pricing_threads=threads, pricing_block_size=8)
+    solver = RevisedSimplexWithoutFile(objective, constraint_matrix, True, restrictions, symbols, options, quiet=True)
+    solver.solve()
+
+    assert len(checked) > 5 and all(checked)
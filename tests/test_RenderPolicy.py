@@ -0,0 +1,53 @@
+import numpy as np
+from Context import SolveContext
+from LatexWriter import LatexWriter
+from RenderPolicy import RenderPolicy
+from Solver import RevisedSimplex
+
+
+def test_large_matrices_are_elided_or_listed_as_sparse():
+    policy = RenderPolicy.compact(max_rows=4, max_columns=4, edge=1)
+    dense = np.arange(1.0, 51.0).reshape(5, 10)
+    assert not policy.is_large(np.ones((4, 4)))
+    assert policy.format_matrix(dense) == (r"\begin{bmatrix}1 & \cdots & 10\\ \vdots & \ddots & \vdots\\ "
+                                           r"41 & \cdots & 50\end{bmatrix}_{5 \times 10}")
+    assert policy.format_matrix(np.eye(20)).startswith(r"\left\{(1,1){:}\ 1, (2,2){:}\ 1")
+    assert policy.format_numbers_vector(np.arange(6.0)) == r"\{0, \ldots, 5\}"
+    assert [policy.should_render_iteration(i) for i in (1, 10, 11, 20)] == [True, True, False, True]
+    assert not RenderPolicy().is_large(dense) and RenderPolicy().should_render_iteration(11)
+
+
+def test_large_problem_document_stays_bounded(tmp_path):
+    size = 40
+    data = {"lp_variables": [f"x_{i + 1}" for i in range(size)], "constraint_matrix": np.eye(size),
+            "is_maximization": True, "objective_function": np.ones(size), "restrictions_vector": np.ones(size),
+            "symbols": ["<="] * size}
+    (tmp_path / "pt").mkdir()
+    sizes = {}
+    with SolveContext(language="pt", output_directory=str(tmp_path) + "/"):
+        for name, policy in [("full", RenderPolicy.unlimited()), ("elided", RenderPolicy.compact(full_iterations=2))]:
+            writer = LatexWriter(name, render_policy=policy)
+            solver = RevisedSimplex(data=data, latex_writer=writer)
+            solver._setup_support_variables()
+            solver.solve(show_steps=True)
+            writer.close()
+            assert solver.get_objective_value() == size
+            sizes[name] = len(open(writer.filename, encoding="utf-8").read())
+
+    content = open(writer.filename, encoding="utf-8").read()
+    assert r"\vdots" in content and "resumida" in content
+    assert sizes["elided"] * 10 < sizes["full"]
+    last_iteration = content[content.index(f"Iteração {size + 1} (Fase 2)"):]
+    assert "resumida" not in last_iteration and r"\textbf{Passo 1" in last_iteration
+
+
+def test_summarized_unbounded_iteration_writes_header_and_pivot_column(tmp_path):
+    (tmp_path / "pt").mkdir()
+    with SolveContext(language="pt", output_directory=str(tmp_path) + "/"):
+        writer = LatexWriter("ilimitado", standalone=False)
+        writer.write_iteration({"detailed": False, "phase": 2, "iteration": 3, "non_basis": ["x_1", "x_2"],
+                                "basis": ["s_1"], "entering": 1, "leaving": -1, "y": np.array([[-1.0]])})
+        writer.close()
+
+    content = open(writer.filename, encoding="utf-8").read()
+    assert "Iteração 3 (Fase 2)" in content and "x_{2}" in content and "Coluna do pivô" in content
@@ -0,0 +1,51 @@
+import csv
+import json
+import os
+
+import pytest
+from ResultsWriter import ResultsWriter
+from Solver import RevisedSimplex
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "csv"])
+def test_results_writer_streams_one_record_per_problem(setup_test_files, tmp_path, extension):
+    test_directory, _ = setup_test_files
+    filename = str(tmp_path / f"results.{extension}")
+    with ResultsWriter(filename, flush_interval=0) as writer:
+        for problem in ["default.lp", "unbounded.lp"]:
+            solver = RevisedSimplex(os.path.join(test_directory, problem))
+            solver.solve(show_steps=False)
+            writer.write_solver(problem, solver, {"solve": 0.5})
+            assert os.path.getsize(filename) > 0
+
+    with open(filename, encoding="utf-8", newline="") as file:
+        if extension == "jsonl":
+            records = [json.loads(line) for line in file]
+        else:
+            records = list(csv.DictReader(file))
+            for record in records:
+                record["values"] = json.loads(record["values"])
+
+    assert [record["file"] for record in records] == ["default.lp", "unbounded.lp"]
+    assert records[0]["status"] == "optimal"
+    assert float(records[0]["objective"]) == pytest.approx(15)
+    assert records[0]["values"]["y"] == pytest.approx(3)
+    assert records[1]["status"] == "unbounded"
+
+
+def test_results_writer_rejects_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        ResultsWriter(str(tmp_path / "results.txt"), file_format="xml")
+
+
+@pytest.mark.parametrize("extension", ["jsonl", "csv"])
+def test_results_writer_keeps_the_error_message(tmp_path, extension):
+    filename = str(tmp_path / f"results.{extension}")
+    with ResultsWriter(filename) as writer:
+        writer.write(ResultsWriter.get_error_record("broken.lp", ValueError("Função objetivo inválida")))
+
+    with open(filename, encoding="utf-8", newline="") as file:
+        record = json.loads(file.readline()) if extension == "jsonl" else next(csv.DictReader(file))
+
+    assert record["status"] == "error"
+    assert record["error"] == "Função objetivo inválida"
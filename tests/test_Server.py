@@ -0,0 +1,115 @@
+import asyncio
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+from Server import SolveServer
+
+
+@pytest.fixture(scope="module")
+def solve_server():
+    server = SolveServer(port=0, workers=1, queue_size=4, default_timeout=30)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def run():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+        loop.run_until_complete(server.stop())
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    started.wait(10)
+    yield server
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(10)
+
+
+def _request(server, method, path, payload=None):
+    data = json.dumps(payload).encode("utf-8") if payload is not None else None
+    request = urllib.request.Request(f"http://127.0.0.1:{server.port}{path}", data=data, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_health(solve_server):
+    assert _request(solve_server, "GET", "/health") == (200, {"status": "ok"})
+
+
+def test_solve_text_problem(solve_server):
+    problem = "max 3x + 5y\nx + y <= 4\n2x + 3y <= 9\nx, y >= 0"
+    status, result = _request(solve_server, "POST", "/solve", {"problem": problem, "language": "en"})
+
+    assert status == 200
+    assert result["status"] == "optimal"
+    assert result["solution"]["y"] == pytest.approx(3)
+
+
+def test_solve_array_problem(solve_server):
+    payload = {"objective": [3, 5], "constraint_matrix": [[1, 0], [0, 2], [3, 2]], "is_maximization": True,
+               "restrictions": [4, 12, 18], "symbols": ["<=", "<=", "<="]}
+    status, result = _request(solve_server, "POST", "/solve", payload)
+
+    assert status == 200
+    assert result["solution"]["x1"] == pytest.approx(2)
+    assert result["solution"]["x2"] == pytest.approx(6)
+
+
+def test_invalid_problem_and_metrics(solve_server):
+    status, _ = _request(solve_server, "POST", "/solve", {"problem": "3x + 5y\nx <= 1\nx >= 0"})
+    assert status == 400
+
+    status, metrics = _request(solve_server, "GET", "/metrics")
+    assert status == 200
+    assert metrics["failed"] >= 1
+    assert metrics["workers"] == 1
+
+
+def test_cancel_unknown_job(solve_server):
+    assert _request(solve_server, "DELETE", "/solve/unknown")[0] == 404
+
+
+def _klee_minty(size):
+    constraint_matrix = [[2 * 10.0 ** (i - j) if j < i else float(i == j) for j in range(size)] for i in range(size)]
+    return {"objective": [10.0 ** (size - j - 1) for j in range(size)], "constraint_matrix": constraint_matrix,
+            "is_maximization": True, "restrictions": [100.0 ** i for i in range(size)],
+            "options": {"max_iterations": 10 ** 7}}
+
+
+def test_malformed_requests_get_400(solve_server):
+    assert _request(solve_server, "POST", "/solve", [1, 2]) == (400, {"error": "invalid_payload"})
+    assert _request(solve_server, "POST", "/solve", {"problem": "max x\nx <= 1\nx >= 0", "timeout": "soon"})[0] == 400
+
+    with socket.create_connection(("127.0.0.1", solve_server.port), timeout=10) as connection:
+        connection.sendall(b"POST /solve HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+        response = connection.recv(4096).decode("latin-1")
+    assert response.startswith("HTTP/1.1 400") and "invalid_content_length" in response
+
+
+def test_deadline_frees_worker_and_duplicate_ids_are_rejected(solve_server):
+    responses = {}
+    slow = dict(_klee_minty(16), id="slow", timeout=0.5)
+    thread = threading.Thread(target=lambda: responses.update(slow=_request(solve_server, "POST", "/solve", slow)))
+    thread.start()
+    for _ in range(100):
+        if _request(solve_server, "GET", "/metrics")[1]["running"] == 1:
+            break
+        time.sleep(0.05)
+
+    assert _request(solve_server, "POST", "/solve", {"id": "slow", "problem": "max x\nx <= 1\nx >= 0"})[0] == 409
+    thread.join(30)
+    assert responses["slow"][0] == 504
+
+    start = time.perf_counter()
+    status, result = _request(solve_server, "POST", "/solve", {"problem": "max x\nx <= 1\nx >= 0"})
+    assert status == 200 and result["status"] == "optimal"
+    assert time.perf_counter() - start < 3
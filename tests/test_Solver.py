@@ -1,8 +1,16 @@
+import multiprocessing
 import os
+import tracemalloc
 
 import numpy as np
 import pytest
-from src.Solver import RevisedSimplex, RevisedSimplexWithoutFile
+from MpsParser import MpsWriter
+from OutOfCore import OutOfCoreMatrix
+from Parser import FileParser
+from ProblemCache import ProblemCache
+from SharedProblem import SharedProblem
+from SolutionCache import SolutionCache
+from Solver import RevisedSimplex, RevisedSimplexWithoutFile, SolveStatus, SolverOptions
 
 
 @pytest.mark.parametrize("filename,expected_solution,expected_basis", [
@@ -152,3 +160,307 @@ def test_revised_simplex_without_file_infeasible_case(objective, constraint_matr
     solver.solve(show_steps=False)
 
     assert "infeasible" in solver.status
+
+
+def test_entering_column_is_taken_from_the_non_basic_variable_index():
+    # O pricing devolve a posição da variável que entra na lista da não base, e não a sua coluna em A. Elas só
+    # coincidem na primeira iteração; depois do primeiro pivô, usar a posição como coluna calcula `y` errado.
+    solver = RevisedSimplexWithoutFile(np.array([2, 3, 1], dtype=np.float64),
+                                       np.array([[1, 2, 1], [0, 4, 4]], dtype=np.float64), True,
+                                       np.array([5, 9], dtype=np.float64), ["<=", "<="])
+    solver.solve(show_steps=False)
+
+    assert solver.status == "optimal"
+    solution = solver.get_solution()
+    assert solution["x1"] == pytest.approx(5)
+    assert 2 * solution["x1"] + 3 * solution["x2"] + solution["x3"] == pytest.approx(10)
+
+
+def test_default_symbols_follow_number_of_constraints():
+    solver = RevisedSimplexWithoutFile(np.array([1.0, 1.0]), np.array([[1.0, 1.0], [1.0, 0.0], [0.0, 1.0]]),
+                                       True, np.array([3.0, 2.0, 2.0]))
+    solver.solve(show_steps=False)
+    assert solver.restriction_symbols == ["<="] * 3
+    assert sum(solver.get_solution()[name] for name in ["x1", "x2"]) == pytest.approx(3)
+
+
+def _solve_shared(handle, objective):
+    solver = RevisedSimplex.from_shared(handle, objective_function=objective)
+    solver.solve(show_steps=False)
+    return solver.status, solver.get_solution()
+
+
+def test_revised_simplex_from_shared_problem(setup_test_files):
+    test_directory, _ = setup_test_files
+    data = FileParser(os.path.join(test_directory, "default.lp")).parse_file()
+
+    with SharedProblem.create(data) as shared_problem:
+        attached = SharedProblem.attach(shared_problem.handle)
+        view = attached.get_data()["constraint_matrix"]
+        assert not view.flags.writeable
+        np.testing.assert_array_equal(view, data["constraint_matrix"])
+        del view
+        attached.close()
+
+        scenarios = [np.array([3, 5], dtype=np.float64), np.array([5, 3], dtype=np.float64)]
+        with multiprocessing.Pool(2) as pool:
+            results = pool.starmap(_solve_shared, [(shared_problem.handle, objective) for objective in scenarios])
+
+    assert results[0][0] == "optimal"
+    assert results[0][1]["y"] == pytest.approx(3)
+    assert results[1][1]["x"] == pytest.approx(4)
+
+
+def test_from_shared_releases_block_after_standardization(setup_test_files):
+    test_directory, _ = setup_test_files
+    data = FileParser(os.path.join(test_directory, "redundant_constraints.lp")).parse_file()
+    expected = RevisedSimplex(os.path.join(test_directory, "redundant_constraints.lp"), quiet=True).solve()
+
+    with SharedProblem.create(data) as shared_problem:
+        with RevisedSimplex.from_shared(shared_problem.handle, quiet=True) as solver:
+            result = solver.solve()
+            assert solver.shared_problem is None
+            assert solver.constraint_matrix.flags.writeable
+        with RevisedSimplex.from_shared(shared_problem.handle, quiet=True) as unused:
+            assert unused.shared_problem is not None
+        assert unused.shared_problem is None
+
+    assert result.status == expected.status and result.objective == pytest.approx(expected.objective)
+    num_variables = len(data["lp_variables"])
+    np.testing.assert_array_equal(solver.constraint_matrix[:, :num_variables], data["constraint_matrix"])
+    added_columns = solver.constraint_matrix[:, num_variables:]
+    assert added_columns.shape[1] > 0 and np.all(np.abs(added_columns).sum(axis=0) == 1)
+
+
+@pytest.mark.parametrize("filename,expected_objective", [
+    ("default.lp", 15),
+    ("three_vars.lp", 120),
+    ("four_vars.lp", 65.71428),
+    ("redundant_constraints.lp", 153.33333),
+    ("equalities.lp", 23.33333),
+])
+def test_revised_simplex_steepest_edge_pricing(setup_test_files, filename, expected_objective):
+    test_directory, _ = setup_test_files
+    solver = RevisedSimplex(os.path.join(test_directory, filename), options=SolverOptions(pricing="steepest_edge"))
+    solver.solve(show_steps=False)
+
+    solution = solver.get_solution()
+    objective = sum(value * solution[var] for var, value in zip(solver.variables, solver.objective))
+    assert solver.status in ["optimal", "degenerate"]
+    assert objective == pytest.approx(expected_objective, rel=1e-5)
+
+
+def test_solver_options_reject_unknown_pricing():
+    with pytest.raises(ValueError):
+        SolverOptions(pricing="random")
+
+
+def test_revised_simplex_selects_mps_parser_by_extension(setup_test_files, tmp_path):
+    test_directory, _ = setup_test_files
+    MpsWriter.write(str(tmp_path / "default.mps"), FileParser(os.path.join(test_directory, "default.lp")).parse_file())
+
+    solver = RevisedSimplex(str(tmp_path / "default.mps"))
+    solver.solve(show_steps=False)
+
+    assert solver.status == "optimal"
+    assert solver.get_solution()["y"] == pytest.approx(3)
+
+
+def test_reload_problem_uses_problem_cache(setup_test_files, tmp_path):
+    test_directory, _ = setup_test_files
+    file_path = os.path.join(test_directory, "equalities.lp")
+    cache = ProblemCache(str(tmp_path))
+
+    solutions = []
+    for _ in range(2):
+        solver = RevisedSimplex(file_path, problem_cache=cache)
+        solver.solve(show_steps=False)
+        solutions.append(solver.get_solution())
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert isinstance(cache.load(cache.get_key(file_path))["constraint_matrix"], np.memmap)
+    assert solutions[0] == pytest.approx(solutions[1])
+
+    solver.reload_problem(os.path.join(test_directory, "default.lp"))
+    solver.solve(show_steps=False)
+    assert cache.misses == 2
+    assert solver.get_solution()["y"] == pytest.approx(3)
+
+
+@pytest.mark.parametrize("filename", ["equalities.lp", "four_vars.lp"])
+def test_out_of_core_matrix_matches_dense_solve(setup_test_files, tmp_path, filename):
+    test_directory, _ = setup_test_files
+    data = FileParser(os.path.join(test_directory, filename)).parse_file()
+    dense = RevisedSimplex(data=data)
+    dense.solve(show_steps=False)
+
+    stored = OutOfCoreMatrix.create(str(tmp_path / "columns.npy"), data["constraint_matrix"], chunk_columns=2)
+    solver = RevisedSimplex(data=dict(data, constraint_matrix=stored), options=SolverOptions(pricing_block_size=2))
+    solver.solve(show_steps=False)
+
+    assert solver.status == dense.status
+    assert solver.get_solution() == pytest.approx(dense.get_solution())
+    assert solver.constraint_matrix.get_io_statistics()["bytes_read"] > 0
+    assert stored.get_io_statistics() == solver.constraint_matrix.get_io_statistics()
+    assert stored.unit_columns == []
+    with pytest.raises(ValueError):
+        RevisedSimplex(data=dict(data, constraint_matrix=stored), latex_writer=object()).solve(show_steps=True)
+
+
+def test_out_of_core_solve_keeps_only_a_bounded_working_set_resident(tmp_path):
+    # Só as 4 primeiras colunas unitárias valem a pena, então a resolução termina em poucos pivôs, mas cada
+    # pricing percorre as 5000 colunas do arquivo. O tracemalloc vê os buffers do NumPy, e não as páginas mapeadas.
+    rows, columns = 200, 5000
+    rng = np.random.default_rng(7)
+    matrix = np.hstack([np.eye(rows), rng.uniform(0.5, 1, (rows, columns - rows))])
+    objective = np.concatenate([np.full(4, 10.0), np.zeros(rows - 4), rng.uniform(1, 2, columns - rows)])
+    data = {"lp_variables": [f"x{j}" for j in range(columns)], "constraint_matrix": matrix, "is_maximization": True,
+            "objective_function": objective,
+            "restrictions_vector": np.arange(1, rows + 1, dtype=np.float64), "symbols": ["<="] * rows}
+    dense = RevisedSimplex(data=data, quiet=True).solve()
+
+    statistics = []
+    for working_set_size in (64, 0):
+        stored = OutOfCoreMatrix.create(str(tmp_path / f"columns_{working_set_size}.npy"), matrix)
+        stored.working_set_size = working_set_size
+        tracemalloc.start()
+        try:
+            result = RevisedSimplex(data=dict(data, constraint_matrix=stored), quiet=True,
+                                    options=SolverOptions(pricing_block_size=256)).solve()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert result.objective == pytest.approx(dense.objective)
+        assert peak < matrix.nbytes / 2
+        statistics.append(stored.get_io_statistics())
+
+    assert statistics[0]["working_set_hits"] == result.iterations - 1 > 0
+    assert statistics[1]["working_set_hits"] == 0
+    assert statistics[1]["column_reads"] - statistics[0]["column_reads"] == statistics[0]["working_set_hits"]
+
+
+@pytest.mark.parametrize("filename", ["default.lp", "degenerate.lp", "unbounded.lp"])
+def test_solution_cache_restores_previous_result(setup_test_files, tmp_path, filename):
+    test_directory, _ = setup_test_files
+    file_path = os.path.join(test_directory, filename)
+    cache = SolutionCache(capacity=1, directory=str(tmp_path))
+
+    solvers = []
+    for _ in range(2):
+        solver = RevisedSimplex(file_path, solution_cache=cache)
+        solver.solve(show_steps=False)
+        solvers.append(solver)
+
+    assert cache.get_statistics()["hits"] == 1
+    assert solvers[1].get_solution_state() == solvers[0].get_solution_state()
+
+    cache.clear()
+    solver = RevisedSimplex(file_path, solution_cache=cache)
+    solver.solve(show_steps=False)
+    assert cache.disk_hits == 1
+
+    changed = RevisedSimplex(file_path, options=SolverOptions(pricing="steepest_edge"), solution_cache=cache)
+    assert cache.get_key(changed) != cache.get_key(solver)
+    threaded = RevisedSimplex(file_path, options=SolverOptions(pricing_threads=2, pricing_block_size=1))
+    assert cache.get_key(threaded) == cache.get_key(solver)
+
+
+def test_solution_cache_key_ignores_sign_of_zero():
+    problems = [RevisedSimplexWithoutFile(np.array([3, zero]), np.array([[1, 2], [zero, 1]]), True,
+                                          np.array([4, 2]), ["<=", "<="]) for zero in (0.0, -0.0)]
+    cache = SolutionCache()
+    assert cache.get_key(problems[0]) == cache.get_key(problems[1])
+
+
+def test_solution_cache_evicts_disk_entries_by_size(tmp_path, monkeypatch):
+    cache = SolutionCache(directory=str(tmp_path), max_disk_bytes=130)
+    listings = []
+    original_listdir = os.listdir
+    monkeypatch.setattr(os, "listdir", lambda path: listings.append(path) or original_listdir(path))
+    for key in ["a", "b", "c"]:
+        cache.put(key, {"values": [0.0] * 10})
+    monkeypatch.undo()
+
+    assert sorted(os.listdir(tmp_path)) == ["b.json", "c.json"]
+    assert len(listings) <= 1
+    assert cache.disk_bytes == sum(os.path.getsize(tmp_path / name) for name in ["b.json", "c.json"])
+
+    reopened = SolutionCache(directory=str(tmp_path), max_disk_bytes=130)
+    assert reopened.get("b") is not None
+    reopened.put("d", {"values": [0.0] * 10})
+    assert sorted(os.listdir(tmp_path)) == ["b.json", "d.json"]
+
+
+@pytest.mark.parametrize("filename", ["equalities.lp", "four_vars.lp", "three_vars.lp"])
+def test_checkpoint_resume_matches_uninterrupted_solve(setup_test_files, tmp_path, filename):
+    file_path = os.path.join(setup_test_files[0], filename)
+    checkpoint = str(tmp_path / "state.npz")
+    complete = RevisedSimplex(file_path)
+    complete.solve(show_steps=False)
+
+    for stop_at in range(1, complete.current_interaction):
+        interrupted = RevisedSimplex(file_path, options=SolverOptions(max_iterations=stop_at))
+        interrupted.set_checkpoint(checkpoint, every_iterations=1)
+        interrupted.solve(show_steps=False)
+        assert interrupted.status == "maximum_iterations_exceeded"
+
+        resumed = RevisedSimplex(file_path)
+        resumed.solve(show_steps=False, resume_from=checkpoint)
+        assert resumed.get_solution_state() == complete.get_solution_state()
+
+
+def test_checkpoint_rejects_other_problem(setup_test_files, tmp_path):
+    test_directory, _ = setup_test_files
+    checkpoint = str(tmp_path / "state.npz")
+    solver = RevisedSimplex(os.path.join(test_directory, "default.lp"))
+    solver.set_checkpoint(checkpoint)
+    solver.solve(show_steps=False)
+
+    with pytest.raises(ValueError):
+        RevisedSimplex(os.path.join(test_directory, "three_vars.lp")).solve(show_steps=False, resume_from=checkpoint)
+
+
+@pytest.mark.parametrize("filename", ["equalities.lp", "three_vars.lp", "four_vars.lp"])
+def test_iterate_yields_one_event_per_pivot_and_matches_solve(setup_test_files, filename):
+    file_path = os.path.join(setup_test_files[0], filename)
+    complete = RevisedSimplex(file_path)
+    complete.solve(show_steps=False)
+
+    solver = RevisedSimplex(file_path)
+    events = list(solver.iterate())
+    assert solver.get_solution_state() == complete.get_solution_state()
+    assert [event.iteration for event in events] == sorted({event.iteration for event in events})
+    assert all(event.step_length >= 0 and event.primal_infeasibility >= 0 for event in events)
+    assert events[-1].phase == 2 and events[-1].entering in solver.basis
+    assert events[-1].objective == pytest.approx(solver.get_objective_value())
+
+    stopped = RevisedSimplex(file_path)
+    for event in stopped.iterate():
+        break
+    assert stopped.status is None and stopped.current_interaction == events[0].iteration
+
+
+@pytest.mark.parametrize("filename", ["default.lp", "equalities.lp", "degenerate.lp", "unbounded.lp", "infeasible.lp"])
+def test_solve_returns_immutable_result_and_quiet_mode_prints_nothing(setup_test_files, filename, capsys):
+    file_path = os.path.join(setup_test_files[0], filename)
+    complete = RevisedSimplex(file_path)
+    expected = complete.solve(show_steps=False)
+    assert capsys.readouterr().out != ""
+
+    result = RevisedSimplex(file_path, quiet=True).solve(show_steps=False)
+    assert capsys.readouterr().out == ""
+    assert isinstance(result.status, SolveStatus) and result.status == complete.status
+    assert result.get_solution() == pytest.approx(complete.get_solution())
+    assert result.get_basis_names() == complete.basis
+    assert result.iterations == complete.current_interaction and result.degeneracy_points == tuple(complete.degeneracy_points)
+    assert result.to_dict()["values"] == expected.to_dict()["values"]
+    if result.is_solved:
+        assert result.objective == pytest.approx(complete.get_objective_value())
+    else:
+        assert result.objective is None
+    assert result.timings["solve"] >= 0
+
+    with pytest.raises(AttributeError):
+        result.status = SolveStatus.OPTIMAL
+    with pytest.raises(ValueError):
+        result.values[0] = 1
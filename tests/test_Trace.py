@@ -0,0 +1,37 @@
+import os
+
+import pytest
+from Context import SolveContext
+from LatexWriter import LatexWriter
+from Solver import RevisedSimplex
+from Trace import IterationTrace, TraceRenderer
+
+
+@pytest.mark.parametrize("filename", ["default.lp", "equalities.lp", "degenerate.lp", "unbounded.lp"])
+def test_deferred_rendering_matches_inline_steps(setup_test_files, tmp_path, filename):
+    test_directory, _ = setup_test_files
+    (tmp_path / "pt").mkdir()
+    with SolveContext(language="pt", output_directory=str(tmp_path) + "/", output=open(os.devnull, "w")):
+        inline_writer = LatexWriter("inline", standalone=False)
+        solver = RevisedSimplex("", True, inline_writer)
+        solver.reload_problem(os.path.join(test_directory, filename))
+        solver.solve(True)
+        inline_writer.close()
+
+        solver = RevisedSimplex(os.path.join(test_directory, filename))
+        solver.set_trace()
+        solver.solve()
+        solver.trace.save(str(tmp_path / "trace.npz"))
+        trace = IterationTrace.load(str(tmp_path / "trace.npz"))
+        assert trace.rows.tobytes() == solver.trace.rows.tobytes()
+        assert trace.rows["iteration"].tolist() == list(range(1, solver.current_interaction + 1))
+
+        deferred_writer = LatexWriter("deferred", standalone=False)
+        rendered = TraceRenderer(trace).render(deferred_writer)
+        deferred_writer.close()
+
+    inline = open(inline_writer.filename, encoding="utf-8").read()
+    deferred = open(deferred_writer.filename, encoding="utf-8").read()
+    assert rendered == len(trace.rows)
+    for block in deferred.split(r"\subsection{")[1:]:
+        assert block.split(":}\n\n", 1)[1] in inline
@@ -0,0 +1,43 @@
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from Utils import FormatUtils, LatexUtils
+
+
+def reference_format_value(value: str) -> str:
+    if value == "inf" or value == "-inf":
+        return value
+    try:
+        value_to_check = float(value)
+        if value_to_check % 1 != 0:
+            fraction = Fraction(value_to_check).limit_denominator()
+            return f"\\frac{{{fraction.numerator}}}{{{fraction.denominator}}}"
+        return str(int(value_to_check))
+    except ValueError:
+        return LatexUtils.format_variable(value)
+
+
+@pytest.mark.parametrize("values", [
+    np.array([0.0, -0.0, 1.0, -3.0, 2.0 ** 60, 1e300, np.inf, -np.inf, np.nan]),
+    np.array([0.5, -1 / 3, 10 / 3, 7 / 64, 1 / 65, 0.1, 2 ** 21 + 0.5, 123456.78, 1 / 3 + 1e-12]),
+    np.arange(-12, 13).reshape(5, 5) / np.arange(1, 26).reshape(5, 5),
+    np.random.default_rng(7).normal(size=(6, 6)),
+    np.linalg.inv(np.array([[2.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 4.0]])),
+    np.array([[3, -4], [0, 12]]),
+])
+def test_format_values_matches_scalar_formatting(values):
+    expected = [reference_format_value(str(value)) for value in values.ravel()]
+    assert LatexUtils.format_values(values).ravel().tolist() == expected
+
+
+def test_deprecated_format_helpers_still_work():
+    with pytest.warns(DeprecationWarning):
+        np.testing.assert_array_equal(FormatUtils.string_to_array("x1 - 2x2 + 3x3 <= 6", ["x1", "x2", "x3", "x4"]),
+                                      np.array([1, -2, 3, 0]))
+    with pytest.warns(DeprecationWarning):
+        assert FormatUtils.get_variables_vector("max 3x + 5y - z") == ["x", "y", "z"]
+    with pytest.warns(DeprecationWarning):
+        assert FormatUtils._read_number("4x1 - 3x2 >= 12", "x2") == -3
+    with pytest.warns(DeprecationWarning):
+        assert FormatUtils.format_file("# comentário\nmax 3x + 5y\nx <= 4 # limite\nx <= 4\n") == ["max 3x + 5y", "x <= 4"]